@@ -7,7 +7,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from functools import lru_cache
-from typing import Set, Union
+from typing import Iterable, Set, Union
+
+import numpy as np
 
 from ..rbool import SubSetR1
 from ..scalar.reals import Real
@@ -72,8 +74,34 @@ class IAnalytic(ABC):
         """
         raise NotImplementedError
 
-    @vectorize(1, 0)
+    def eval_many(
+        self, nodes: Iterable[Real], derivate: int = 0
+    ) -> np.ndarray:
+        """
+        Evaluates the given analytic function at all the given nodes.
+
+        The default implementation calls ``eval`` for each node,
+        the child classes may override it with a faster version
+
+        Example
+        -------
+        >>> polynomial = Polynomial([1, 2, 3])  # p(x) = 1 + 2 * x + 3 * x^2
+        >>> polynomial.eval_many([0, 1, 2])
+        array([1, 6, 17], dtype=object)
+        >>> polynomial.eval_many([0, 1, 2], 1)  # p'(x) = 2 + 6 * x
+        array([2, 8, 14], dtype=object)
+        """
+        nodes = np.asarray(nodes)
+        values = [self.eval(node, derivate) for node in nodes.flat]
+        return np.array(values).reshape(nodes.shape)
+
     def __call__(self, node: Real) -> Real:
+        if Is.instance(node, np.ndarray):
+            return self.eval_many(node, 0)
+        return self.__vectorized_call(node)
+
+    @vectorize(1, 0)
+    def __vectorized_call(self, node: Real) -> Real:
         return self.eval(node, 0)
 
     @abstractmethod
@@ -1,15 +1,20 @@
 """
 Defines the Bezier class, that has the same basis as the Polynomial
+
+Besides the polynomial coefficients, the Bezier keeps its control points,
+the coefficients in the Bernstein basis, which allows evaluating with the
+de Casteljau's algorithm, subdividing and bounding the function by the
+convex hull of the control points
 """
 
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Iterable, Tuple, Union
+from typing import Iterable, List, Tuple, Union
 
-from ..rbool import SubSetR1
+from ..rbool import SubSetR1, WholeR1, create_interval
 from ..scalar.quadrature import inner
-from ..scalar.reals import Math, Rational, Real
+from ..scalar.reals import Math, Rational, Real, backend_cache
 from ..tools import Is, To
 from .polynomial import Polynomial, scale_coefs, shift_coefs
 
@@ -36,7 +41,7 @@ def bezier_caract_matrix(degree: int) -> Tuple[Tuple[Rational, ...], ...]:
     return tuple(map(tuple, matrix))
 
 
-@lru_cache(maxsize=None)
+@backend_cache
 def inverse_caract_matrix(degree: int) -> Tuple[Tuple[Rational, ...], ...]:
     """
     Returns the inverse matrix of the caract bezier matrix
@@ -69,6 +74,70 @@ def polynomial2bezier(coefs: Iterable[Real]) -> Iterable[Real]:
     return (inner(weights, coefs) for weights in matrix)
 
 
+def bernstein_coefs(
+    polynomial: Polynomial, reparam: Tuple[Real, Real]
+) -> Tuple[Real, ...]:
+    """
+    Gives the coefficients in the Bernstein basis of the polynomial
+    restricted to the interval [a, b] given by ``reparam``
+
+    Example
+    -------
+    >>> poly = Polynomial([0, 0, 1])  # p(t) = t^2
+    >>> tuple(map(int, bernstein_coefs(poly, (0, 1))))
+    (0, 0, 1)
+    >>> tuple(map(int, bernstein_coefs(poly, (-1, 1))))
+    (1, -1, 1)
+    """
+    knota, knotb = reparam
+    coefs = shift_coefs(polynomial, -knota)
+    coefs = (coef * (knotb - knota) ** i for i, coef in enumerate(coefs))
+    return tuple(polynomial2bezier(coefs))
+
+
+def to_bezier(polynomial: Polynomial, reparam: Tuple[Real, Real]) -> Bezier:
+    """
+    Converts the polynomial into a Bezier which control points
+    describe the polynomial inside the interval given by ``reparam``
+
+    Example
+    -------
+    >>> poly = Polynomial([0, 0, 1])  # p(t) = t^2
+    >>> tuple(map(int, to_bezier(poly, (-1, 1)).ctrlpoints))
+    (1, -1, 1)
+    """
+    ctrlpoints = bernstein_coefs(polynomial, reparam)
+    return Bezier(ctrlpoints, reparam, domain=polynomial.domain)
+
+
+def de_casteljau(
+    ctrlpoints: Iterable[Real], param: Real
+) -> Tuple[List[Real], List[Real]]:
+    """
+    Applies the de Casteljau's algorithm over the control points.
+
+    Gives the control points of the left and right parts of the
+    bezier when subdivided at the parameter ``param`` in [0, 1].
+    The value of the bezier at ``param`` is the last left point
+
+    Example
+    -------
+    >>> de_casteljau([1, 2, 3], 0.5)
+    ([1, 1.5, 2.0], [2.0, 2.5, 3])
+    """
+    points = list(ctrlpoints)
+    left = [points[0]]
+    right = [points[-1]]
+    for _ in range(len(points) - 1):
+        points = [
+            (1 - param) * pta + param * ptb
+            for pta, ptb in zip(points, points[1:])
+        ]
+        left.append(points[0])
+        right.append(points[-1])
+    return left, right[::-1]
+
+
 class Bezier(Polynomial):
     """
     Defines the Bezier class, that allows evaluating and operating
@@ -82,7 +151,107 @@ class Bezier(Polynomial):
         *,
         domain: Union[None, SubSetR1] = None,
     ):
-        coefs = tuple(bezier2polynomial(coefs))
+        ctrlpoints = tuple(coefs)
         knota, knotb = reparam
+        coefs = tuple(bezier2polynomial(ctrlpoints))
         coefs = shift_coefs(scale_coefs(coefs, knotb - knota), knota)
         super().__init__(coefs, domain=domain)
+        self.__ctrlpoints = ctrlpoints
+        self.__reparam = (knota, knotb)
+
+    @property
+    def ctrlpoints(self) -> Tuple[Real, ...]:
+        """
+        The control points of the bezier, the coefficients in the
+        Bernstein basis over the interval given by ``reparam``
+        """
+        return self.__ctrlpoints
+
+    @property
+    def reparam(self) -> Tuple[Real, Real]:
+        """
+        The interval [a, b] in which the control points are defined
+        """
+        return self.__reparam
+
+    def __param(self, node: Real) -> Real:
+        """Transforms the node from [a, b] into the parameter in [0, 1]"""
+        knota, knotb = self.__reparam
+        if Is.rational(node) and Is.rational(knota) and Is.rational(knotb):
+            return To.rational(node - knota, knotb - knota)
+        return (node - knota) / (knotb - knota)
+
+    def eval(self, node: Real, derivate: int = 0) -> Real:
+        # The rational nodes are evaluated exactly by the polynomial form,
+        # while the de Casteljau's algorithm is stable for the floats
+        if derivate or Is.rational(node) or not Is.finite(node):
+            return super().eval(node, derivate)
+        if node not in self.domain:
+            raise ValueError(f"Node {node} not in {self.domain}")
+        left, _ = de_casteljau(self.__ctrlpoints, self.__param(node))
+        return left[-1]
+
+    def split(self, node: Real) -> Tuple[Bezier, Bezier]:
+        """
+        Subdivides the bezier at given node, giving two beziers
+        that describe the left and the right parts of the curve
+
+        Example
+        -------
+        >>> bezier = Bezier([1, 2, 3])
+        >>> left, right = bezier.split(0.5)
+        >>> left.ctrlpoints
+        (1, 1.5, 2.0)
+        >>> right.ctrlpoints
+        (2.0, 2.5, 3)
+        """
+        knota, knotb = self.__reparam
+        if not knota < node < knotb:
+            raise ValueError(f"Node {node} not in ({knota}, {knotb})")
+        left, right = de_casteljau(self.__ctrlpoints, self.__param(node))
+        domains = [None, None]
+        if self.domain != WholeR1():
+            domains[0] = self.domain & create_interval(knota, node)
+            domains[1] = self.domain & create_interval(node, knotb)
+        return (
+            Bezier(left, (knota, node), domain=domains[0]),
+            Bezier(right, (node, knotb), domain=domains[1]),
+        )
+
+    def elevate(self, times: int = 1) -> Bezier:
+        """
+        Elevates the degree of the bezier, keeping the same function
+
+        Example
+        -------
+        >>> bezier = Bezier([1, 3])
+        >>> tuple(map(int, bezier.elevate().ctrlpoints))
+        (1, 2, 3)
+        """
+        if not Is.integer(times) or times < 0:
+            raise ValueError(f"Times must be integer >= 0, not {times}")
+        ctrlpoints = self.__ctrlpoints
+        for _ in range(times):
+            npts = len(ctrlpoints) + 1
+            middle = (
+                To.rational(i, npts - 1) * ctrlpoints[i - 1]
+                + To.rational(npts - 1 - i, npts - 1) * ctrlpoints[i]
+                for i in range(1, npts - 1)
+            )
+            ctrlpoints = (ctrlpoints[0],) + tuple(middle) + ctrlpoints[-1:]
+        return Bezier(ctrlpoints, self.__reparam, domain=self.domain)
+
+    def bounds(self) -> Tuple[Real, Real]:
+        """
+        Gives the pair (lower, upper) that bounds the values of the bezier
+        inside the interval ``reparam``.
+
+        It uses the convex hull property of the control points,
+        therefore it doesn't need to find the roots of the derivative
+
+        Example
+        -------
+        >>> Bezier([1, -1, 2]).bounds()
+        (-1, 2)
+        """
+        return min(self.__ctrlpoints), max(self.__ctrlpoints)
@@ -5,7 +5,9 @@ Implementation of a polynomial class
 from __future__ import annotations
 
 from numbers import Real
-from typing import Iterable, Iterator, List, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
 
 from ..rbool import IntervalR1, SubSetR1, WholeR1, from_any, move, scale
 from ..rbool.tools import is_continuous
@@ -35,6 +37,100 @@ def shift_coefs(coefs: Iterable[Real], amount: Real) -> Iterator[Real]:
     yield from coefs
 
 
+KARATSUBA_THRESHOLD = 16
+
+
+def multiply_coefs(
+    coefsa: Tuple[Real, ...], coefsb: Tuple[Real, ...]
+) -> Tuple[Real, ...]:
+    """
+    Computes the coefficients of the product p(t) * q(t)
+
+    For big polynomials, if any coefficient is not rational, the product
+    is computed in float by ``numpy.convolve``. Otherwise, it's exact and
+    the Karatsuba's algorithm is used when both degrees are bigger than
+    the threshold
+
+    Example
+    -------
+    >>> multiply_coefs((1, 2), (3, 4))  # (1 + 2t) * (3 + 4t)
+    (3, 10, 8)
+    >>> multiply_coefs((1, 2), (0.5, 4))
+    (0.5, 5.0, 8.0)
+    """
+    if len(coefsa) * len(coefsb) > KARATSUBA_THRESHOLD**2 and not all(
+        map(Is.rational, coefsa + coefsb)
+    ):
+        coefsa = np.array(coefsa, dtype=np.float64)
+        coefsb = np.array(coefsb, dtype=np.float64)
+        return tuple(np.convolve(coefsa, coefsb).tolist())
+    return karatsuba(coefsa, coefsb)
+
+
+def karatsuba(
+    coefsa: Tuple[Real, ...], coefsb: Tuple[Real, ...]
+) -> Tuple[Real, ...]:
+    """
+    Multiplies the polynomials with exact coefficients by the Karatsuba's
+    algorithm, which needs only three products of half the size.
+    Below the ``KARATSUBA_THRESHOLD``, the schoolbook product is used
+
+    Example
+    -------
+    >>> karatsuba((1, 1), (1, -1))  # (1 + t) * (1 - t)
+    (1, 0, -1)
+    """
+    half = min(len(coefsa), len(coefsb)) // 2
+    if half < KARATSUBA_THRESHOLD // 2:
+        return schoolbook(coefsa, coefsb)
+    zero = 0 * coefsa[0] * coefsb[0]
+    result = [zero] * (len(coefsa) + len(coefsb) - 1)
+    lows = karatsuba(coefsa[:half], coefsb[:half])
+    highs = karatsuba(coefsa[half:], coefsb[half:])
+    middle = list(
+        karatsuba(
+            add_halves(coefsa, half, zero), add_halves(coefsb, half, zero)
+        )
+    )
+    for i, coef in enumerate(lows):
+        result[i] += coef
+        middle[i] -= coef
+    for i, coef in enumerate(highs):
+        result[i + 2 * half] += coef
+        middle[i] -= coef
+    for i, coef in enumerate(middle[: len(result) - half]):
+        result[i + half] += coef
+    return tuple(result)
+
+
+def schoolbook(
+    coefsa: Tuple[Real, ...], coefsb: Tuple[Real, ...]
+) -> Tuple[Real, ...]:
+    """
+    Multiplies the polynomials by the direct product of the coefficients
+
+    Example
+    -------
+    >>> schoolbook((1, 1), (1, -1))  # (1 + t) * (1 - t)
+    (1, 0, -1)
+    """
+    result = [0 * coefsa[0] * coefsb[0]] * (len(coefsa) + len(coefsb) - 1)
+    for i, coefi in enumerate(coefsa):
+        for j, coefj in enumerate(coefsb):
+            result[i + j] += coefi * coefj
+    return tuple(result)
+
+
+def add_halves(
+    coefs: Tuple[Real, ...], half: int, zero: Real
+) -> Tuple[Real, ...]:
+    """Adds the lower part coefs[:half] to the upper part coefs[half:]"""
+    return tuple(
+        (coefs[i] if i < half else zero) + coef
+        for i, coef in enumerate(coefs[half:])
+    )
+
+
 class Polynomial(IAnalytic):
     """
     Defines a polynomial with coefficients
@@ -72,6 +168,8 @@ class Polynomial(IAnalytic):
         degree = max((i for i, v in enumerate(coefs) if v * v > 0), default=0)
         self.__coefs = coefs[: degree + 1]
         self.__domain = domain
+        self.__derivates: Dict[int, Polynomial] = {}
+        self.__dercoefs: Dict[int, Tuple[Real, ...]] = {0: self.__coefs}
 
     @property
     def domain(self) -> SubSetR1:
@@ -125,31 +223,44 @@ class Polynomial(IAnalytic):
             )
         if not Is.instance(other, Polynomial):
             raise NotImplementedError
-        coefs = [0 * self[0]] * (self.degree + other.degree + 1)
-        for i, coefi in enumerate(self):
-            for j, coefj in enumerate(other):
-                coefs[i + j] += coefi * coefj
+        coefs = multiply_coefs(self.__coefs, tuple(other))
         return Polynomial(coefs, domain=self.domain & other.domain)
 
+    def __pow__(self, exponent: int) -> Polynomial:
+        """
+        Computes the power of the polynomial by squaring, multiplying
+        only the coefficients with ``multiply_coefs``
+
+        Example
+        -------
+        >>> print(Polynomial([1, 1]) ** 3)
+        1 + 3 * t + 3 * t^2 + t^3
+        """
+        if not Is.integer(exponent) or exponent < 0:
+            raise ValueError
+        if not Is.finite(self[0]):
+            raise ValueError
+        result = (1 + 0 * self[0],)
+        base = self.__coefs
+        while exponent:
+            if exponent % 2:
+                result = multiply_coefs(result, base)
+            exponent //= 2
+            if exponent:
+                base = multiply_coefs(base, base)
+        return Polynomial(result, domain=self.domain)
+
     def eval(self, node: Real, derivate: int = 0) -> Real:
         if node not in self.domain:
             raise ValueError(f"Node {node} not in {self.domain}")
-        if derivate == 0:
-            coefs = self.__coefs
-        elif self.degree < derivate:
-            coefs = (0 * self.__coefs[0],)
-        else:
-            coefs = tuple(
-                Math.factorial(n + derivate) // Math.factorial(n) * coef
-                for n, coef in enumerate(self.__coefs[derivate:])
-            )
+        coefs = self.__derivative_coefs(derivate)
         node = To.real(node)
         if len(coefs) == 1:
             return coefs[0]
         if Is.infinity(node):
             return coefs[len(coefs) - 1] * (
                 Math.NEGINF
-                if self.degree % 2 and node == Math.NEGINF
+                if (len(coefs) - 1) % 2 and node == Math.NEGINF
                 else Math.POSINF
             )
         result: Real = 0 * coefs[0]
@@ -157,14 +268,91 @@ class Polynomial(IAnalytic):
             result = node * result + coef
         return result
 
-    def derivate(self, times=1):
-        if self.degree < times:
-            return Polynomial([0 * self[0]], domain=self.domain)
-        coefs = (
-            Math.factorial(n + times) // Math.factorial(n) * coef
-            for n, coef in enumerate(self[times:])
+    def eval_many(
+        self, nodes: Iterable[Real], derivate: int = 0
+    ) -> np.ndarray:
+        """
+        Evaluates the polynomial at all the given nodes at once,
+        using the Horner's method over the entire array of nodes.
+
+        If all the nodes and coefficients are rationals, the evaluation
+        is exact and gives an array of objects.
+        Otherwise, the evaluation is made with numpy's float64.
+
+        Example
+        -------
+        >>> poly = Polynomial([1, 2, 3])  # p(t) = 1 + 2 * t + 3 * t^2
+        >>> poly.eval_many([0, 1, 2])
+        array([1, 6, 17], dtype=object)
+        >>> poly.eval_many(np.linspace(0, 1, 3))
+        array([1.  , 2.75, 6.  ])
+        """
+        nodes = np.asarray(nodes)
+        if nodes.size == 0:
+            return np.zeros(nodes.shape, dtype=object)
+        if self.domain != WholeR1():
+            for node in nodes[~self.__inside(nodes)].flat:
+                raise ValueError(f"Node {node} not in {self.domain}")
+        coefs = self.__derivative_coefs(derivate)
+        exact = all(map(Is.rational, coefs)) and (
+            np.issubdtype(nodes.dtype, np.integer)
+            or (nodes.dtype == object and all(map(Is.rational, nodes.flat)))
         )
-        return Polynomial(coefs, domain=self.domain)
+        dtype = object if exact else np.float64
+        nodes = nodes.astype(dtype)
+        if not exact:
+            if not np.all(np.isfinite(nodes)):
+                return super().eval_many(nodes, derivate)
+            coefs = np.array(coefs, dtype=np.float64)
+        result = np.full(nodes.shape, coefs[-1], dtype=dtype)
+        for coef in coefs[-2::-1]:
+            result = result * nodes + coef
+        return result
+
+    def __inside(self, nodes: np.ndarray) -> np.ndarray:
+        """Tells, for each node, if it's inside the domain, the same as
+        ``node in self.domain``, but compared over the whole array"""
+        domain = self.domain
+        if not Is.instance(domain, IntervalR1):
+            inside = [node in domain for node in nodes.flat]
+            return np.array(inside, dtype=bool).reshape(nodes.shape)
+        lower, upper = domain[0], domain[1]
+        above = nodes >= lower if domain.closed_left else nodes > lower
+        below = nodes <= upper if domain.closed_right else nodes < upper
+        return np.asarray(above & below, dtype=bool)
+
+    def derivate(self, times=1):
+        """
+        Derivate the polynomial curve, giving a new one
+
+        The derivatives are computed only once: they are stored in a
+        table indexed by the order of the derivative and reused in the
+        next calls of ``derivate`` and ``eval``
+
+        Example
+        -------
+        >>> poly = Polynomial([1, 2, 5])
+        >>> print(poly.derivate())
+        2 + 10 * t
+        >>> print(poly.derivate(2))
+        10
+        """
+        if times not in self.__derivates:
+            if self.degree < times:
+                coefs = (0 * self[0],)
+            else:
+                coefs = (
+                    Math.factorial(n + times) // Math.factorial(n) * coef
+                    for n, coef in enumerate(self[times:])
+                )
+            self.__derivates[times] = Polynomial(coefs, domain=self.domain)
+        return self.__derivates[times]
+
+    def __derivative_coefs(self, times: int) -> Tuple[Real, ...]:
+        """Gives the coefficients of the derivative, from the table"""
+        if times not in self.__dercoefs:
+            self.__dercoefs[times] = tuple(self.derivate(times))
+        return self.__dercoefs[times]
 
     def integrate(self, domain):
         domain = from_any(domain)
@@ -2,13 +2,16 @@
 Some tools used in
 """
 
-from typing import Union
+import math
+from typing import Iterable, Iterator, List, Tuple, Union
 
 import numpy as np
 
 from ..loggers import debug
 from ..rbool import (
+    DisjointR1,
     EmptyR1,
+    IntervalR1,
     SingleR1,
     SubSetR1,
     WholeR1,
@@ -16,9 +19,10 @@ from ..rbool import (
     from_any,
     unite,
 )
-from ..scalar.reals import Math, Real
+from ..scalar.reals import Backend, Math, Real
 from ..tools import Is, NotExpectedError, To
 from .base import IAnalytic
+from .bezier import bernstein_coefs, de_casteljau
 from .polynomial import Polynomial
 
 
@@ -34,6 +38,40 @@ def find_roots(analytic: IAnalytic, domain: SubSetR1 = WholeR1()) -> SubSetR1:
     raise NotExpectedError(f"Invalid analytic: {type(analytic)}")
 
 
+@debug("shapepy.analytic.tools")
+def find_roots_many(
+    analytics: Iterable[IAnalytic],
+    domains: Union[SubSetR1, Iterable[SubSetR1]] = WholeR1(),
+) -> Tuple[SubSetR1, ...]:
+    """
+    Finds the roots of many analytic functions at once, giving the
+    same values as ``find_roots`` for each one of them
+
+    The domains are either one for each analytic, or a single SubSetR1
+    that is used for all of them
+
+    Example
+    -------
+    >>> x = Polynomial([0, 1])
+    >>> polys = (x**3 - x, x**3 - 8, x**3 + x)
+    >>> for roots in find_roots_many(polys, from_any([0, 1])):
+    ...     print(roots)
+    {0, 1}
+    {}
+    {0}
+    """
+    analytics = tuple(analytics)
+    if Is.instance(domains, (SubSetR1, str)):
+        domains = (domains,) * len(analytics)
+    domains = tuple(map(from_any, domains))
+    if len(domains) != len(analytics):
+        raise ValueError(f"Expected {len(analytics)} domains")
+    for analytic in analytics:
+        if not Is.instance(analytic, Polynomial):
+            raise NotExpectedError(f"Invalid analytic: {type(analytic)}")
+    return PolynomialFunctions.find_roots_many(analytics, domains)
+
+
 @debug("shapepy.analytic.tools")
 def where_minimum(
     analytic: IAnalytic, domain: SubSetR1 = WholeR1()
@@ -71,10 +109,17 @@ class PolynomialFunctions:
     """Static class that stores static functions used for the generics
     functions above. This class specifics for Polynomial"""
 
+    exact_bisection: bool = True
+
     @staticmethod
     def find_roots(polynomial: Polynomial, domain: SubSetR1) -> SubSetR1:
         """
         Finds all the values of t* such p(t*) = 0 inside given domain
+
+        For degree greater than 2, only the real roots inside the domain
+        are searched: the domain is bounded by the Cauchy's bound, the
+        roots are isolated by ``isolate_roots`` and refined by
+        ``refine_root``. Roots with multiplicity are given once
         """
         assert Is.instance(polynomial, Polynomial)
         domain &= polynomial.domain
@@ -82,7 +127,7 @@ class PolynomialFunctions:
             return domain if polynomial[0] == 0 else EmptyR1()
         if polynomial.degree == 1:
             numerator = -To.rational(1, 1) * polynomial[0]
-            return SingleR1(numerator / polynomial[1])
+            return SingleR1(numerator / polynomial[1]) & domain
         if polynomial.degree == 2:
             c, b, a = polynomial
             delta = b * b - 4 * a * c
@@ -92,10 +137,464 @@ class PolynomialFunctions:
             half = To.rational(1, 2)
             x0 = half * (-b - sqrtdelta) / a
             x1 = half * (-b + sqrtdelta) / a
-            return from_any({x0, x1})
-        roots = np.roots(tuple(polynomial)[::-1])
-        roots = (To.real(np.real(r)) for r in roots if abs(np.imag(r)) < 1e-15)
-        return from_any(set(roots))
+            return from_any({x0, x1}) & domain
+        return PolynomialFunctions.__search_roots(polynomial, domain)
+
+    @staticmethod
+    def __search_roots(polynomial: Polynomial, domain: SubSetR1) -> SubSetR1:
+        """Finds the roots of polynomials of high degree, by isolating
+        them inside each bounded connected part of the domain"""
+        coefs = tuple(polynomial)
+        unit = To.rational(1, 1)
+        bound = unit + max(unit * abs(coef) / abs(coefs[-1]) for coef in coefs)
+        polynomial = Polynomial(coefs)
+        if PolynomialFunctions.__is_exact(polynomial):
+            polynomial = PolynomialFunctions.__squarefree(polynomial)
+        roots = set()
+        bounded = domain & IntervalR1(-bound, bound)
+        for knota, knotb in PolynomialFunctions.__pieces(bounded):
+            for inta, intb in PolynomialFunctions.__isolate(
+                polynomial, knota, knotb
+            ):
+                root = PolynomialFunctions.refine_root(polynomial, inta, intb)
+                if not PolynomialFunctions.__is_cluster(
+                    polynomial, inta, intb
+                ) and all(map(Is.rational, polynomial)):
+                    roots.add(root)
+                elif PolynomialFunctions.__is_root(polynomial, root):
+                    roots.add(root)
+        return from_any(set(root for root in roots if root in domain))
+
+    @staticmethod
+    def __is_exact(polynomial: Polynomial) -> bool:
+        """Tells if the roots of the polynomial are computed exactly"""
+        return (
+            PolynomialFunctions.exact_bisection
+            and not Backend.floats
+            and all(map(Is.rational, polynomial))
+        )
+
+    @staticmethod
+    def __divmod(
+        numerator: Tuple[Real, ...], denominator: Tuple[Real, ...]
+    ) -> Tuple[Tuple[Real, ...], Tuple[Real, ...]]:
+        """Computes the quotient and the remainder of the division
+        of the polynomials, given by their coefficients"""
+        remainder = [To.rational(1, 1) * coef for coef in numerator]
+        size = len(denominator) - 1
+        quotient = [0] * max(1, len(numerator) - size)
+        for i in range(len(numerator) - size - 1, -1, -1):
+            quotient[i] = remainder[i + size] / denominator[-1]
+            for j, coef in enumerate(denominator):
+                remainder[i + j] -= quotient[i] * coef
+        remainder = remainder[:size]
+        while remainder and remainder[-1] == 0:
+            remainder.pop()
+        return tuple(quotient), tuple(remainder)
+
+    @staticmethod
+    def __squarefree(polynomial: Polynomial) -> Polynomial:
+        """Gives p / gcd(p, p'), which roots are the same of p, but simple.
+        The computations are exact, only for rational coefficients"""
+        coefsa, coefsb = tuple(polynomial), tuple(polynomial.derivate())
+        while coefsb:
+            coefsb = tuple(coef / coefsb[-1] for coef in coefsb)
+            _, remainder = PolynomialFunctions.__divmod(coefsa, coefsb)
+            coefsa, coefsb = coefsb, remainder
+        if len(coefsa) == 1:
+            return polynomial
+        quotient, _ = PolynomialFunctions.__divmod(tuple(polynomial), coefsa)
+        return Polynomial(quotient)
+
+    @staticmethod
+    def __is_root(polynomial: Polynomial, node: Real) -> bool:
+        """Tells if the node is a root, up to the float rounding errors.
+        It discards the spurious roots caused by the noise of the
+        float coefficients near the multiple roots, and the roots of
+        p'(t) given by the clusters that don't contain a multiple root"""
+        error = sum(abs(coef * node**i) for i, coef in enumerate(polynomial))
+        return abs(polynomial(node)) <= 1e-12 * error
+
+    @staticmethod
+    def __pieces(subset: SubSetR1) -> Iterator[Tuple[Real, Real]]:
+        """Gives the extremities of each bounded connected part of subset"""
+        if Is.instance(subset, SingleR1):
+            yield (subset.internal, subset.internal)
+        elif Is.instance(subset, IntervalR1):
+            yield (subset[0], subset[1])
+        elif Is.instance(subset, DisjointR1):
+            for item in subset:
+                yield from PolynomialFunctions.__pieces(item)
+
+    @staticmethod
+    def __is_cluster(polynomial: Polynomial, knota: Real, knotb: Real) -> bool:
+        """Tells if the interval given by ``isolate_roots`` is a cluster"""
+        if knota == knotb:
+            return False
+        signa = PolynomialFunctions.__sign(polynomial, knota, 1)
+        return signa == PolynomialFunctions.__sign(polynomial, knotb, -1)
+
+    @staticmethod
+    def __sign(polynomial: Polynomial, node: Real, side: int) -> bool:
+        """Tells if p(t) > 0 for t near the node, at the given side"""
+        for times in range(polynomial.degree + 1):
+            value = polynomial.eval(node, times)
+            if value != 0:
+                return (value > 0) == (side > 0 or times % 2 == 0)
+        raise NotExpectedError(f"Null polynomial {polynomial}")
+
+    @staticmethod
+    def isolate_roots(
+        polynomial: Polynomial, knota: Real, knotb: Real
+    ) -> Iterator[Tuple[Real, Real]]:
+        """
+        Isolates the real roots of the polynomial inside [a, b]
+
+        The number of sign changes of the Bernstein coefficients over an
+        interval bounds the number of roots inside it (Descartes' rule).
+        The intervals with more than one sign change are subdivided
+        by the de Casteljau's algorithm until each one contains a single
+        root, or until they are smaller than the tolerance.
+
+        If all the coefficients are rationals and ``exact_bisection``
+        is True, all the computations are exact: the polynomial is
+        replaced by its square-free part and the intervals are
+        subdivided until each one contains a single root.
+
+        Gives the intervals (a*, b*), in increasing order, such that:
+        * If a* == b*, then a* is a root
+        * If p(a*) and p(b*) have different signs, there's only one root
+        * Else, it's a cluster of roots, like a multiple root
+
+        Example
+        -------
+        >>> poly = Polynomial([0, -1, 0, 1])  # p(t) = t^3 - t
+        >>> intervals = PolynomialFunctions.isolate_roots(poly, -2, 2)
+        >>> for knota, knotb in intervals:
+        ...     print(knota, knotb)
+        -2 0
+        0 0
+        0 2
+        """
+        if PolynomialFunctions.__is_exact(polynomial):
+            polynomial = PolynomialFunctions.__squarefree(polynomial)
+        yield from PolynomialFunctions.__isolate(polynomial, knota, knotb)
+
+    @staticmethod
+    def __isolate(
+        polynomial: Polynomial, knota: Real, knotb: Real
+    ) -> Iterator[Tuple[Real, Real]]:
+        """Isolates the roots of the polynomial inside [a, b], which is
+        square-free if the computations are exact"""
+        exact = PolynomialFunctions.__is_exact(polynomial)
+        knota, knotb = PolynomialFunctions.__knots(knota, knotb, exact)
+        if knota == knotb:
+            if polynomial(knota) == 0:
+                yield (knota, knotb)
+            return
+        ctrlpoints = bernstein_coefs(polynomial, (knota, knotb))
+        if ctrlpoints[0] == 0:
+            yield (knota, knota)
+        leaves = PolynomialFunctions.__subdivide(
+            polynomial, ctrlpoints, knota, knotb
+        )
+        yield from PolynomialFunctions.__merge_clusters(leaves)
+        if ctrlpoints[-1] == 0:
+            yield (knotb, knotb)
+
+    @staticmethod
+    def __knots(knota: Real, knotb: Real, exact: bool) -> Tuple[Real, Real]:
+        """Converts the extremities into rationals if exact, or floats"""
+        if not exact:
+            return float(knota), float(knotb)
+        return tuple(
+            (
+                knot
+                if Is.rational(knot)
+                else To.rational(*knot.as_integer_ratio())
+            )
+            for knot in (knota, knotb)
+        )
+
+    @staticmethod
+    def __subdivide(
+        polynomial: Polynomial,
+        ctrlpoints: Tuple[Real, ...],
+        knota: Real,
+        knotb: Real,
+    ) -> Iterator[Tuple[Real, Real, bool]]:
+        """Subdivides the interval [a, b] from left to right, giving the
+        intervals (a*, b*, cluster) with only one root or a cluster.
+        The exact subdivisions never stop at a cluster, while the float
+        ones stop when the interval is smaller than a relative tolerance
+        of its own extremities, not of the initial interval. The float
+        control points are computed from the polynomial at each interval,
+        cause the de Casteljau's rounding errors are relative to the
+        initial interval, that is as large as the Cauchy's bound"""
+        exact = Is.rational(knota)
+        half = To.rational(1, 2) if exact else 0.5
+        stack = [(ctrlpoints, knota, knotb)]
+        while stack:
+            ctrlpoints, knota, knotb = stack.pop()
+            if ctrlpoints is None:  # Exact root at a subdivision node
+                yield (knota, knotb, False)
+                continue
+            signs = tuple(ctrl > 0 for ctrl in ctrlpoints if ctrl != 0)
+            changes = sum(sa != sb for sa, sb in zip(signs, signs[1:]))
+            if changes == 1:
+                yield (knota, knotb, False)
+            elif (
+                changes > 1
+                and not exact
+                and knotb - knota < 1e-7 * max(1, abs(knota), abs(knotb))
+            ):
+                yield (knota, knotb, True)
+            elif changes > 1:
+                middle = knota + (knotb - knota) * half
+                if exact:
+                    left, right = de_casteljau(ctrlpoints, half)
+                else:
+                    left = bernstein_coefs(polynomial, (knota, middle))
+                    right = bernstein_coefs(polynomial, (middle, knotb))
+                stack.append((right, middle, knotb))
+                if left[-1] == 0:
+                    stack.append((None, middle, middle))
+                stack.append((left, knota, middle))
+
+    @staticmethod
+    def __merge_clusters(
+        leaves: Iterable[Tuple[Real, Real, bool]],
+    ) -> Iterator[Tuple[Real, Real]]:
+        """Merges the consecutive clusters of roots into only one"""
+        cluster: List[Real] = []
+        for knota, knotb, is_cluster in leaves:
+            if is_cluster and cluster and cluster[1] == knota:
+                cluster[1] = knotb
+                continue
+            if cluster:
+                yield tuple(cluster)
+            cluster = [knota, knotb] if is_cluster else []
+            if not is_cluster:
+                yield (knota, knotb)
+        if cluster:
+            yield tuple(cluster)
+
+    @staticmethod
+    def refine_root(polynomial: Polynomial, knota: Real, knotb: Real) -> Real:
+        """
+        Refines the root of the polynomial inside the interval [a, b],
+        given by the function ``isolate_roots``.
+
+        The root is found by the Newton's method, safeguarded by bisection
+        to stay inside the interval. If the coefficients and extremities
+        are rationals and ``exact_bisection`` is True, an exact bisection
+        starting near the Newton's estimative gives the nearest float
+        to the root.
+
+        If the interval is a cluster of roots, the root of p'(t) is given
+
+        Example
+        -------
+        >>> poly = Polynomial([-2, 0, 1])  # p(t) = t^2 - 2
+        >>> PolynomialFunctions.refine_root(poly, 1, 2)
+        1.4142135623730951
+        """
+        if knota == knotb:
+            return knota
+        signa = PolynomialFunctions.__sign(polynomial, knota, 1)
+        signb = PolynomialFunctions.__sign(polynomial, knotb, -1)
+        if signa == signb:  # Cluster of roots
+            if polynomial.degree > 1:
+                return PolynomialFunctions.refine_root(
+                    polynomial.derivate(), knota, knotb
+                )
+            return To.real(float(knota + (knotb - knota) / 2))
+        root = PolynomialFunctions.__newton(
+            polynomial, float(knota), float(knotb), signa
+        )
+        if PolynomialFunctions.__is_exact(polynomial) and all(
+            map(Is.rational, (knota, knotb))
+        ):
+            root = PolynomialFunctions.__bisect(
+                polynomial, root, (knota, knotb), signa
+            )
+        return root
+
+    @staticmethod
+    def __newton(
+        polynomial: Polynomial, knota: float, knotb: float, signa: bool
+    ) -> float:
+        """Newton's method safeguarded by bisection over [a, b]"""
+        node = knota + (knotb - knota) / 2
+        for _ in range(1024):
+            value = polynomial(node)
+            if value == 0:
+                break
+            if (value > 0) == signa:
+                knota = node
+            else:
+                knotb = node
+            slope = polynomial.eval(node, 1)
+            newnode = node - value / slope if slope != 0 else node
+            if not knota < newnode < knotb:
+                newnode = knota + (knotb - knota) / 2
+            if newnode in (node, knota, knotb):
+                break
+            node = newnode
+        return To.real(float(node))
+
+    @staticmethod
+    def __bisect(
+        polynomial: Polynomial,
+        root: float,
+        interval: Tuple[Real, Real],
+        signa: bool,
+    ) -> Real:
+        """Exact bisection over the rational interval that contains the
+        root, until all its values are rounded to the same float.
+        The steps start at a quarter of ulp from the float estimative
+        and are doubled until they pass the root, so only few exact
+        evaluations are needed if the estimative is good"""
+        lower, upper = interval
+        exact = To.rational(*root.as_integer_ratio())
+        value = polynomial(exact)
+        if value == 0:
+            return exact
+        step = To.rational(*math.ulp(root).as_integer_ratio()) / 4
+        if (value > 0) == signa:
+            lower = exact
+        else:
+            upper, step = exact, -step
+        for _ in range(2048):
+            if float(lower) == float(upper):
+                break
+            node = exact + step
+            if lower < node < upper:
+                step *= 2
+            else:
+                node = (lower + upper) / 2
+            value = polynomial(node)
+            if value == 0:
+                return node
+            if (value > 0) == signa:
+                lower = node
+            else:
+                upper = node
+        return To.real(float(lower))
+
+    @staticmethod
+    def find_roots_many(
+        polynomials: Tuple[Polynomial, ...], domains: Tuple[SubSetR1, ...]
+    ) -> Tuple[SubSetR1, ...]:
+        """
+        Finds the roots of many polynomials inside the given domains
+
+        The polynomials of degree greater than 2 are grouped by degree,
+        and the eigenvalues of the stacked companion matrices of each
+        group are computed by a single ``numpy.linalg.eigvals`` call.
+        The eigenvalues only give small windows that contain the real
+        roots: the polynomials without windows inside the domain have
+        no roots, and the others are solved by ``find_roots``, such no
+        root is lost or changed by a float tolerance
+        """
+        results = [None] * len(polynomials)
+        indexs = []
+        for i, (polynomial, domain) in enumerate(zip(polynomials, domains)):
+            if polynomial.degree < 3:
+                results[i] = PolynomialFunctions.find_roots(polynomial, domain)
+            else:
+                indexs.append(i)
+        if not indexs:
+            return tuple(results)
+        degree = max(polynomials[i].degree for i in indexs)
+        coefs = np.zeros((len(indexs), degree + 1), dtype=np.float64)
+        for line, i in zip(coefs, indexs):
+            line[: polynomials[i].degree + 1] = tuple(
+                map(float, polynomials[i])
+            )
+        allroots = PolynomialFunctions.companion_roots(coefs)
+        for i, roots in zip(indexs, allroots):
+            polynomial, domain = polynomials[i], domains[i]
+            if np.all(np.isfinite(roots)):
+                windows = PolynomialFunctions.__windows(roots)
+                if not PolynomialFunctions.__overlaps(domain, windows):
+                    results[i] = EmptyR1()
+                    continue
+            results[i] = PolynomialFunctions.find_roots(polynomial, domain)
+        return tuple(results)
+
+    @staticmethod
+    def __windows(roots: np.ndarray) -> List[Tuple[float, float]]:
+        """Gives the disjoint intervals, in increasing order, around the
+        real parts of the eigenvalues that contain the real roots.
+        The eigenvalues of a multiple root are spread in a circle, so
+        the width also takes the imaginary part and the distance to
+        the nearest eigenvalue"""
+        scales = np.maximum(1, np.abs(roots))
+        widths = 2 * np.abs(roots.imag) + 1e-6 * scales
+        if len(roots) > 1:
+            distances = np.abs(roots[:, None] - roots[None, :])
+            np.fill_diagonal(distances, np.inf)
+            widths += np.minimum(distances.min(axis=1), 1e-3 * scales)
+        windows: List[List[float]] = []
+        for center, width in sorted(zip(roots.real.tolist(), widths.tolist())):
+            if windows and center - width <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], center + width)
+            else:
+                windows.append([center - width, center + width])
+        return [tuple(window) for window in windows]
+
+    @staticmethod
+    def __overlaps(
+        domain: SubSetR1, windows: Iterable[Tuple[float, float]]
+    ) -> bool:
+        """Tells if any window intersects the domain"""
+        windows = tuple(windows)
+        if Is.instance(domain, WholeR1):
+            return len(windows) > 0
+        return any(
+            lower <= knotb and knota <= upper
+            for knota, knotb in PolynomialFunctions.__pieces(domain)
+            for lower, upper in windows
+        )
+
+    @staticmethod
+    def companion_roots(coefs: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Computes all the complex roots of many polynomials, which
+        coefficients are the lines of the matrix (m, n+1), in increasing
+        order.
+
+        The lines are grouped by their degree, ignoring the null leading
+        coefficients, and each group is solved by ``numpy.linalg.eigvals``
+        over the stacked companion matrices. The constant lines give
+        no roots. No root is filtered: the caller decides which ones
+        are real for its tolerance
+
+        Example
+        -------
+        >>> coefs = np.array([[-1, 0, 1], [2, -1, 0], [3, 0, 0]])
+        >>> for roots in PolynomialFunctions.companion_roots(coefs):
+        ...     print(sorted(roots.real.tolist()))
+        [-1.0, 1.0]
+        [2.0]
+        []
+        """
+        coefs = np.asarray(coefs, dtype=np.float64)
+        results = [np.zeros(0, dtype=np.complex128)] * coefs.shape[0]
+        degrees = np.array(
+            [max(np.flatnonzero(line), default=0) for line in coefs],
+            dtype=np.int64,
+        )
+        for degree in set(degrees.tolist()) - {0}:
+            indexs = np.flatnonzero(degrees == degree)
+            group = coefs[indexs, : degree + 1]
+            companions = np.zeros((len(indexs), degree, degree))
+            companions[:, range(1, degree), range(degree - 1)] = 1
+            companions[:, :, -1] = -group[:, :-1] / group[:, -1:]
+            for i, line in zip(indexs, np.linalg.eigvals(companions)):
+                results[i] = line
+        return tuple(results)
 
     @staticmethod
     def where_minimum(polynomial: Polynomial, domain: SubSetR1) -> SubSetR1:
@@ -130,10 +629,26 @@ class PolynomialFunctions:
         If the minimal does not exist, returns None
 
         If the polynomial goes to -inf, returns -inf
+
+        For a closed interval, the control points of the polynomial in the
+        Bernstein basis bound its values. If the lowest control point is
+        at one extremity, the minimum is there and no root is computed
         """
         assert Is.instance(polynomial, Polynomial)
         if polynomial.degree == 0:
             return polynomial[0]
+        if (
+            Is.instance(domain, IntervalR1)
+            and domain.closed_left
+            and domain.closed_right
+        ):
+            knots = (domain[0], domain[1])
+            ctrlpoints = bernstein_coefs(polynomial, knots)
+            lower = min(ctrlpoints)
+            extremities = (ctrlpoints[0], ctrlpoints[-1])
+            for knot, ctrlpoint in zip(knots, extremities):
+                if ctrlpoint == lower:
+                    return polynomial(knot)
         if domain == WholeR1() and polynomial.degree % 2:
             return Math.NEGINF
         relation = {}
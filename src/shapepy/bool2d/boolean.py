@@ -6,11 +6,13 @@ operations between the SubSetR2 instances
 from __future__ import annotations
 
 from copy import copy
-from typing import Iterable, Tuple, Union
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from shapepy.geometry.jordancurve import JordanCurve
 
 from ..geometry.intersection import GeometricIntersectionCurves
+from ..geometry.segment import Segment
 from ..geometry.unparam import USegment
 from ..loggers import debug
 from ..tools import CyclicContainer, Is
@@ -18,6 +20,8 @@ from .base import EmptyShape, Future, SubSetR2, WholeShape
 from .config import Config
 from .curve import SingleCurve
 from .lazy import LazyAnd, LazyNot, LazyOr, RecipeLazy
+from .overlay import Overlay, VertexIndex
+from .planner import PlanStep, QueryPlan
 from .point import SinglePoint
 from .shape import ConnectedShape, DisjointShape, SimpleShape
 
@@ -115,10 +119,75 @@ def clean_bool2d(subset: SubSetR2) -> SubSetR2:
     if Is.instance(subset, LazyNot):
         return clean_bool2d_not(subset)
     subsets = tuple(subset)
-    assert len(subsets) == 2
-    shapea, shapeb = subsets
-    shapea = clean_bool2d(shapea)
-    shapeb = clean_bool2d(shapeb)
+    if len(subsets) <= 2:
+        subsets = tuple(map(clean_bool2d, subsets))
+    return clean_bool2d_plan(QueryPlan(subset, subsets))
+
+
+@debug("shapepy.bool2d.boolean")
+def clean_bool2d_plan(plan: QueryPlan) -> SubSetR2:
+    """
+    Evaluates the steps of the plan of a LazyAnd or a LazyOr, and joins
+    the disjoint results of the steps
+
+    The operands of the ``keep`` and ``pair`` steps must be cleaned
+    subsets, which are used as they are
+
+    Parameters
+    ----------
+    plan: QueryPlan
+        The plan of the lazy subset to be cleaned
+
+    Return
+    ------
+    SubSetR2
+        The cleaned subset
+    """
+    results = []
+    for step in plan.steps:
+        if step.action == PlanStep.EMPTY:
+            return EmptyShape()
+        if step.action == PlanStep.KEEP:
+            result = copy(step.operands[0])
+        elif step.action == PlanStep.PAIR:
+            result = clean_bool2d_pair(plan.subset, *step.operands)
+        elif len(step.operands) == len(tuple(plan.subset)):
+            result = overlay_bool2d(plan.subset)
+        else:
+            result = overlay_bool2d(LazyOr(step.operands))
+        results.append(result)
+    if len(results) == 1:
+        return results[0]
+    return DisjointShape(
+        sub
+        for result in results
+        for sub in (
+            result if Is.instance(result, DisjointShape) else (result,)
+        )
+    )
+
+
+@debug("shapepy.bool2d.boolean")
+def clean_bool2d_pair(
+    subset: SubSetR2, shapea: SubSetR2, shapeb: SubSetR2
+) -> SubSetR2:
+    """
+    Cleans the union or the intersection of two cleaned subsets
+
+    Parameters
+    ----------
+    subset: SubSetR2
+        The lazy subset, LazyAnd or LazyOr, to be cleaned
+    shapea: SubSetR2
+        The first cleaned subset
+    shapeb: SubSetR2
+        The second cleaned subset
+
+    Return
+    ------
+    SubSetR2
+        The cleaned subset
+    """
     if Is.instance(subset, LazyAnd):
         if shapeb in shapea:
             return copy(shapeb)
@@ -136,6 +205,73 @@ def clean_bool2d(subset: SubSetR2) -> SubSetR2:
     return shape_from_jordans(jordans)
 
 
+@debug("shapepy.bool2d.boolean")
+def overlay_bool2d(
+    subset: SubSetR2, overlay: Optional[Overlay] = None
+) -> SubSetR2:
+    """
+    Computes the lazy subset from the planar arrangement of all its
+    shapes, which are intersected only once, for any number of operands
+
+    Parameters
+    ----------
+    subset: SubSetR2
+        The lazy subset to be evaluated
+    overlay: Optional[Overlay]
+        The arrangement that contains all the shapes of the subset,
+        such many subsets of the same shapes reuse the same overlay
+
+    Return
+    ------
+    SubSetR2
+        The cleaned subset
+    """
+    if overlay is None:
+        shapes = {
+            id(leaf): leaf
+            for leaf in lazy_leaves(subset)
+            if not Is.instance(leaf, (EmptyShape, WholeShape))
+        }
+        overlay = Overlay(shapes.values())
+    indexs = {id(shape): k for k, shape in enumerate(overlay.shapes)}
+    function = partial(lazy_coverage, subset, indexs)
+    jordans = overlay.boundary(function)
+    if jordans:
+        return shape_from_jordans(jordans)
+    outside = (False,) * len(overlay.shapes)
+    return WholeShape() if function(outside) else EmptyShape()
+
+
+def lazy_leaves(subset: SubSetR2) -> Iterator[SubSetR2]:
+    """Gives the subsets that are not lazy inside the lazy subset"""
+    if Is.instance(subset, LazyNot):
+        yield from lazy_leaves(~subset)
+    elif Is.instance(subset, (LazyAnd, LazyOr)):
+        for sub in subset:
+            yield from lazy_leaves(sub)
+    else:
+        yield subset
+
+
+def lazy_coverage(
+    subset: SubSetR2, indexs: Dict[int, int], coverage: Tuple[bool, ...]
+) -> bool:
+    """
+    Tells if the lazy subset covers a face, given the coverage of the
+    face by each shape: the shape ``leaf`` covers the face if
+    ``coverage[indexs[id(leaf)]]`` is True
+    """
+    if Is.instance(subset, LazyNot):
+        return not lazy_coverage(~subset, indexs, coverage)
+    if Is.instance(subset, LazyAnd):
+        return all(lazy_coverage(sub, indexs, coverage) for sub in subset)
+    if Is.instance(subset, LazyOr):
+        return any(lazy_coverage(sub, indexs, coverage) for sub in subset)
+    if Is.instance(subset, (EmptyShape, WholeShape)):
+        return Is.instance(subset, WholeShape)
+    return coverage[indexs[id(subset)]]
+
+
 @debug("shapepy.bool2d.boolean")
 def clean_bool2d_not(subset: LazyNot) -> SubSetR2:
     """
@@ -269,6 +405,62 @@ def shape_from_jordans(jordans: Tuple[JordanCurve]) -> SubSetR2:
     return DisjointShape(connecteds)
 
 
+class EndpointGraph:
+    """
+    Indexes the segments of the jordan curves by their start points,
+    which are snapped in a spatial hash, such the segment that continues
+    a path is found without searching over all the segments
+
+    Example
+    -------
+    >>> from shapepy.bool2d.primitive import Primitive
+    >>> squarea = Primitive.square(side=2)
+    >>> squareb = Primitive.square(side=2, center=(1, 1))
+    >>> FollowPath.split_on_intersection([squarea.jordans, squareb.jordans])
+    >>> jordans = tuple(squarea.jordans) + tuple(squareb.jordans)
+    >>> graph = EndpointGraph(jordans)
+    >>> graph.following(0, 4)  # The segment after jordans[0][4]
+    (1, 4)
+    >>> graph.following(0, 5)  # It continues over the same jordan
+    (0, 0)
+    """
+
+    def __init__(self, jordans: Tuple[JordanCurve], tolerance: float = 1e-9):
+        self.__segments = tuple(
+            tuple(jordan.parametrize()) for jordan in jordans
+        )
+        self.__vertices = VertexIndex(tolerance)
+        self.__starts: Dict[int, List[Tuple[int, int]]] = {}
+        for i, segments in enumerate(self.__segments):
+            for j, segment in enumerate(segments):
+                vertex = self.__vertices(segment(segment.knots[0]))
+                self.__starts.setdefault(vertex, []).append((i, j))
+
+    @property
+    def segments(self) -> Tuple[Tuple[Segment, ...], ...]:
+        """
+        The segments of each jordan curve
+        """
+        return self.__segments
+
+    def following(
+        self, index_jordan: int, index_segment: int
+    ) -> Tuple[int, int]:
+        """
+        Gives the pair (index_jordan, index_segment) of the segment that
+        follows the given one: the segment of the first other jordan that
+        starts at its end point, or the next segment of the same jordan
+        """
+        segment = self.__segments[index_jordan][index_segment]
+        vertex = self.__vertices(segment(segment.knots[-1]))
+        for i, j in self.__starts.get(vertex, ()):
+            if i != index_jordan:
+                return i, j
+        index_segment += 1
+        index_segment %= len(self.__segments[index_jordan])
+        return index_jordan, index_segment
+
+
 class FollowPath:
     """
     Class responsible to compute the final jordan curve
@@ -284,16 +476,25 @@ class FollowPath:
         Find the intersections between two jordan curves and call split on the
         nodes which intersects
         """
-        intersection = GeometricIntersectionCurves([])
         all_group_jordans = tuple(map(tuple, all_group_jordans))
-        for i, jordansi in enumerate(all_group_jordans):
-            for j in range(i + 1, len(all_group_jordans)):
-                jordansj = all_group_jordans[j]
-                for jordana in jordansi:
-                    for jordanb in jordansj:
-                        intersection |= (
-                            jordana.parametrize() & jordanb.parametrize()
-                        )
+        curves = tuple(
+            jordan.parametrize()
+            for jordans in all_group_jordans
+            for jordan in jordans
+        )
+        # Only the jordans of different groups are intersected
+        offsets = [0]
+        for jordans in all_group_jordans:
+            offsets.append(offsets[-1] + len(jordans))
+        pairs: List[Tuple[int, int]] = []
+        for k in range(len(all_group_jordans)):
+            for m in range(k + 1, len(all_group_jordans)):
+                pairs += (
+                    (i, j)
+                    for i in range(offsets[k], offsets[k + 1])
+                    for j in range(offsets[m], offsets[m + 1])
+                )
+        intersection = GeometricIntersectionCurves(curves, pairs)
         intersection.evaluate()
         for jordans in all_group_jordans:
             for jordan in jordans:
@@ -302,7 +503,10 @@ class FollowPath:
 
     @staticmethod
     def pursue_path(
-        index_jordan: int, index_segment: int, jordans: Tuple[JordanCurve]
+        index_jordan: int,
+        index_segment: int,
+        jordans: Tuple[JordanCurve],
+        graph: Optional[EndpointGraph] = None,
     ) -> CyclicContainer[Tuple[int, int]]:
         """
         Given a list of jordans, it returns a matrix of integers like
@@ -316,31 +520,21 @@ class FollowPath:
         The end point of jordans[an].segments[bn] is equal to
         the start point of jordans[a1].segments[b1]
 
+        The graph of the endpoints can be given to be shared between
+        many calls with the same jordans
+
         We suppose there's no triple intersection
         """
+        if graph is None:
+            graph = EndpointGraph(jordans)
+        index_segment %= len(graph.segments[index_jordan])
         matrix = []
-        all_segments = [tuple(jordan.parametrize()) for jordan in jordans]
-        while True:
-            index_segment %= len(all_segments[index_jordan])
-            segment = all_segments[index_jordan][index_segment]
-            if (index_jordan, index_segment) in matrix:
-                break
-            matrix.append((index_jordan, index_segment))
-            last_point = segment(segment.knots[-1])
-            possibles = []
-            for i, jordan in enumerate(jordans):
-                if i == index_jordan:
-                    continue
-                if last_point in jordan:
-                    possibles.append(i)
-            if len(possibles) == 0:
-                index_segment += 1
-                continue
-            index_jordan = possibles[0]
-            for j, segj in enumerate(all_segments[index_jordan]):
-                if segj(segj.knots[0]) == last_point:
-                    index_segment = j
-                    break
+        visited = set()
+        pair = (index_jordan, index_segment)
+        while pair not in visited:
+            visited.add(pair)
+            matrix.append(pair)
+            pair = graph.following(*pair)
         return CyclicContainer(matrix)
 
     @staticmethod
@@ -373,8 +567,11 @@ class FollowPath:
         """
         assert all(Is.instance(j, JordanCurve) for j in jordans)
         bez_indexs = []
+        graph = EndpointGraph(jordans)
         for ind_jord, ind_seg in start_indexs:
-            indices_matrix = FollowPath.pursue_path(ind_jord, ind_seg, jordans)
+            indices_matrix = FollowPath.pursue_path(
+                ind_jord, ind_seg, jordans, graph
+            )
             if indices_matrix not in bez_indexs:
                 bez_indexs.append(indices_matrix)
         new_jordans = []
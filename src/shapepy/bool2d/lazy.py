@@ -5,10 +5,11 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import Iterable, Iterator, Union
 
-from ..boolalg.simplify import simplify_tree
+from ..boolalg.simplify import cached_simplify
 from ..boolalg.tree import (
     BoolTree,
     Operators,
+    TreeKey,
     false_tree,
     items2tree,
     true_tree,
@@ -53,7 +54,7 @@ def tree2subset(tree: Union[SubSetR2, BoolTree]) -> SubSetR2:
 def operate(subsets: Iterable[SubSetR2], operator: Operators) -> SubSetR2:
     """Computes the operation of the items, such as union, intersection"""
     tree = items2tree(map(subset2tree, subsets), operator)
-    return tree2subset(simplify_tree(tree))
+    return tree2subset(cached_simplify(TreeKey(tree)))
 
 
 class RecipeLazy:
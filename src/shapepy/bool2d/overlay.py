@@ -0,0 +1,303 @@
+"""
+Defines the Overlay class, the planar arrangement of many shapes.
+
+All the jordan curves of the shapes are split at their intersections
+only once, and the resulting segments are the edges of the arrangement.
+The segments that coincide, like the common boundary of two shapes,
+become a single edge. Each edge stores which shapes cover the face at
+its left and the face at its right, so the boundary of any boolean
+expression of the shapes is extracted without computing the
+intersections again
+"""
+
+from __future__ import annotations
+
+import math
+from copy import copy
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..analytic.tools import where_minimum
+from ..geometry.intersection import GeometricIntersectionCurves
+from ..geometry.jordancurve import JordanCurve
+from ..geometry.piecewise import PiecewiseCurve
+from ..geometry.point import Point2D, inner
+from ..geometry.segment import Segment
+from ..geometry.unparam import USegment
+from ..loggers import debug
+from ..rbool import SingleR1
+from ..tools import Is
+from .base import SubSetR2
+from .shape import ConnectedShape, DisjointShape, SimpleShape
+
+Coverage = Tuple[bool, ...]
+
+
+class VertexIndex:
+    """
+    Gives the same index for the points that are closer than the
+    tolerance. The points are hashed in a grid of cells whose size is
+    the tolerance, and only the neighbor cells are compared
+
+    Example
+    -------
+    >>> index = VertexIndex(1e-6)
+    >>> index((0, 0)), index((1, 0)), index((1e-9, 0))
+    (0, 1, 0)
+    """
+
+    def __init__(self, tolerance: float = 1e-6):
+        self.tolerance = tolerance
+        self.__cells: Dict[Tuple[int, int], List[Tuple[int, float, float]]]
+        self.__cells = {}
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __call__(self, point: Point2D) -> int:
+        xcoord, ycoord = map(float, point)
+        celli = math.floor(xcoord / self.tolerance)
+        cellj = math.floor(ycoord / self.tolerance)
+        for i in (celli - 1, celli, celli + 1):
+            for j in (cellj - 1, cellj, cellj + 1):
+                for index, xval, yval in self.__cells.get((i, j), ()):
+                    if (
+                        math.hypot(xval - xcoord, yval - ycoord)
+                        < self.tolerance
+                    ):
+                        return index
+        index = self.__size
+        self.__cells.setdefault((celli, cellj), []).append(
+            (index, xcoord, ycoord)
+        )
+        self.__size += 1
+        return index
+
+
+def segment_angle(segment: Segment, node) -> float:
+    """Gives the angle of the tangent direction of the segment at the
+    node. Uses the chord if the derivative vanishes"""
+    xcoord, ycoord = map(float, segment.eval(node, 1))
+    if xcoord == 0 and ycoord == 0:
+        pointa = segment(segment.knots[0])
+        pointb = segment(segment.knots[-1])
+        xcoord, ycoord = map(float, pointb - pointa)
+    return math.atan2(ycoord, xcoord)
+
+
+class Overlay:
+    """
+    Planar arrangement of the boundaries of many shapes, a half-edge
+    structure whose edges know which shapes cover their two sides.
+
+    The jordan curves of the given shapes are not changed: the
+    arrangement splits copies of their parametrizations
+
+    Example
+    -------
+    >>> from shapepy.bool2d.primitive import Primitive
+    >>> squarea = Primitive.square(side=2)
+    >>> squareb = Primitive.square(side=2, center=(1, 0))
+    >>> overlay = Overlay([squarea, squareb])
+    >>> jordans = overlay.boundary(lambda cover: cover[0] and not cover[1])
+    >>> [float(jordan.area) for jordan in jordans]
+    [2.0]
+    """
+
+    def __init__(self, shapes: Iterable[SubSetR2]):
+        shapes = tuple(shapes)
+        for shape in shapes:
+            if not Is.instance(
+                shape, (SimpleShape, ConnectedShape, DisjointShape)
+            ):
+                raise TypeError(f"Invalid shape: {type(shape)}")
+        self.__shapes = shapes
+        self.__curves = tuple(
+            tuple(
+                PiecewiseCurve(jordan.parametrize())
+                for jordan in shape.jordans
+            )
+            for shape in shapes
+        )
+        curves = tuple(curve for group in self.__curves for curve in group)
+        intersection = GeometricIntersectionCurves(curves)
+        for curve in curves:
+            curve.split(intersection.all_knots[id(curve)])
+        self.__vertices = VertexIndex()
+        self.__edges: List[Tuple[Segment, int, int, Coverage, Coverage]] = []
+        self.__build()
+
+    @property
+    def shapes(self) -> Tuple[SubSetR2, ...]:
+        """
+        The shapes used to create the arrangement
+        """
+        return self.__shapes
+
+    @property
+    def edges(self) -> Tuple[Tuple[Segment, int, int, Coverage, Coverage]]:
+        """
+        The edges of the arrangement, each one given by the tuple
+        (segment, start, end, left, right), with the indexs of the
+        start and end vertices, and the coverages of the left and the
+        right faces: left[k] tells if the shape k covers the left face
+        """
+        return tuple(self.__edges)
+
+    def __build(self):
+        """Groups the coincident segments and computes the coverages.
+        Two segments between the same vertices are coincident when the
+        middle point of one of them is over the other"""
+        buckets: Dict[Tuple[int, int], List[List[Tuple[int, Segment]]]]
+        buckets = {}
+        for k, curves in enumerate(self.__curves):
+            for segment in (segment for curve in curves for segment in curve):
+                knota, knotb = segment.knots
+                start = self.__vertices(segment(knota))
+                end = self.__vertices(segment(knotb))
+                if start == end:  # Degenerated segment
+                    continue
+                midpoint = segment((knota + knotb) / 2)
+                groups = buckets.setdefault(
+                    (min(start, end), max(start, end)), []
+                )
+                for group in groups:
+                    if midpoint in group[0][1]:
+                        group.append((k, segment))
+                        break
+                else:
+                    groups.append([(k, segment)])
+        for groups in buckets.values():
+            for group in groups:
+                self.__edges.append(self.__group_edge(group))
+
+    def __group_edge(
+        self, group: List[Tuple[int, Segment]]
+    ) -> Tuple[Segment, int, int, Coverage, Coverage]:
+        """Creates the edge from the coincident segments of the shapes.
+        The region of each shape is at the left of its segments"""
+        segment = group[0][1]
+        knota, knotb = segment.knots
+        start = self.__vertices(segment(knota))
+        end = self.__vertices(segment(knotb))
+        node = (knota + knotb) / 2
+        sides = [
+            self.__coverage(k, segment, node) for k in range(len(self.shapes))
+        ]
+        for k, other in group:
+            forward = self.__vertices(other(other.knots[0])) == start
+            sides[k] = (forward, not forward)
+        left, right = zip(*sides)
+        return segment, start, end, left, right
+
+    def __coverage(
+        self, index: int, segment: Segment, node
+    ) -> Tuple[bool, bool]:
+        """Tells if the shape ``index`` covers the left and the right
+        faces of the segment, looking at the point ``segment(node)``"""
+        density = float(self.shapes[index].density(segment(node)))
+        if 0 < density < 1:
+            forward = self.__boundary_side(index, segment, node)
+            if forward is not None:
+                return forward, not forward
+        return density > 0.5, density > 0.5
+
+    def __boundary_side(
+        self, index: int, segment: Segment, node
+    ) -> Optional[bool]:
+        """Tells if the shape ``index`` is at the left of the segment
+        when the point ``segment(node)`` is over the boundary of the
+        shape: the shape's segment that passes by the point runs in
+        the same direction of the given segment.
+        Gives None if no segment of the shape passes by the point"""
+        point = segment(node)
+        tangent = segment.eval(node, 1)
+        for curve in self.__curves[index]:
+            for i in curve.bvh().query_point(point):
+                other = curve[i]
+                if point not in other:
+                    continue
+                deltax = other.xfunc - point.xcoord
+                deltay = other.yfunc - point.ycoord
+                place = where_minimum(
+                    deltax * deltax + deltay * deltay, other.domain
+                )
+                if not Is.instance(place, SingleR1):
+                    continue
+                return inner(other.eval(place.internal, 1), tangent) > 0
+        return None
+
+    @debug("shapepy.bool2d.overlay")
+    def boundary(
+        self, function: Callable[[Coverage], bool]
+    ) -> Tuple[JordanCurve, ...]:
+        """
+        Gives the jordan curves that bound the region where the function
+        is True. The function receives the coverage of a face, a tuple
+        whose k-th value tells if the shape k covers the face
+        """
+        directed: List[Tuple[Segment, int, int]] = []
+        for segment, start, end, left, right in self.__edges:
+            inleft, inright = bool(function(left)), bool(function(right))
+            if inleft and not inright:
+                directed.append((segment, start, end))
+            elif inright and not inleft:
+                directed.append((~segment, end, start))
+        loops = link_edges(directed)
+        return tuple(
+            JordanCurve(USegment(copy(directed[i][0])) for i in loop)
+            for loop in loops
+        )
+
+
+def link_edges(edges: List[Tuple[Segment, int, int]]) -> List[List[int]]:
+    """
+    Links the directed edges (segment, start, end) into closed loops.
+
+    When many edges leave the same vertex, the next edge is the one
+    that turns the most to the left, which gives the smallest face,
+    such the loops that touch at a vertex are kept apart
+    """
+    outgoing: Dict[int, List[int]] = {}
+    for i, (_, start, _) in enumerate(edges):
+        outgoing.setdefault(start, []).append(i)
+    used = [False] * len(edges)
+    loops = []
+    for first, _ in enumerate(edges):
+        if used[first]:
+            continue
+        loop = [first]
+        used[first] = True
+        while True:
+            following = next_edge(edges, outgoing, loop[-1])
+            if following == first:
+                break
+            if used[following]:
+                raise ValueError("Could not close the boundary")
+            used[following] = True
+            loop.append(following)
+        loops.append(loop)
+    return loops
+
+
+def next_edge(
+    edges: List[Tuple[Segment, int, int]],
+    outgoing: Dict[int, List[int]],
+    index: int,
+) -> int:
+    """Chooses the edge that follows the given edge in its face"""
+    segment, _, end = edges[index]
+    candidates = outgoing.get(end, ())
+    if not candidates:
+        raise ValueError("Could not close the boundary")
+    if len(candidates) == 1:
+        return candidates[0]
+    back = segment_angle(segment, segment.knots[-1]) + math.pi
+    tau = 2 * math.pi
+    return min(
+        candidates,
+        key=lambda i: (
+            (back - segment_angle(edges[i][0], edges[i][0].knots[0])) % tau
+            or tau
+        ),
+    )
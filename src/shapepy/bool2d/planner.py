@@ -0,0 +1,233 @@
+"""
+Defines the QueryPlan class, which chooses how a lazy union or a lazy
+intersection is evaluated, from the boxes and the areas of its operands.
+
+The boxes are compared before any intersection is computed: the
+intersection of bounded shapes whose boxes are disjoint is empty, and
+the union of bounded shapes whose boxes are disjoint is the disjoint
+shape of all of them. Only the shapes whose boxes overlap are given to
+the expensive evaluations, like ``FollowPath`` or the ``Overlay``
+
+Example
+-------
+>>> from shapepy.bool2d.lazy import LazyOr
+>>> from shapepy.bool2d.primitive import Primitive
+>>> squarea = Primitive.square(side=1)
+>>> squareb = Primitive.square(side=1, center=(5, 0))
+>>> print(QueryPlan(LazyOr([squarea, squareb])).explain())
+OR of 2 operands, estimated cost 0
+  keep: 1 operand, cost 0
+  keep: 1 operand, cost 0
+  join: 2 disjoint results, cost 0
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Tuple, Union
+
+from ..geometry.box import Box
+from ..tools import Is
+from .base import SubSetR2
+from .lazy import LazyAnd, LazyNot, LazyOr
+from .shape import ConnectedShape, DisjointShape, SimpleShape
+
+
+def is_bounded(subset: SubSetR2) -> bool:
+    """Tells if the subset is a cleaned shape of finite positive area,
+    which is inside its box"""
+    if not Is.instance(subset, (SimpleShape, ConnectedShape, DisjointShape)):
+        return False
+    return subset.area > 0
+
+
+def box_area(box: Box) -> float:
+    """Gives the area of the box"""
+    width = box.toppt[0] - box.lowpt[0]
+    height = box.toppt[1] - box.lowpt[1]
+    return float(width * height)
+
+
+def count_segments(subset: SubSetR2) -> int:
+    """Gives the number of segments of all the jordans of the subset"""
+    if Is.instance(subset, LazyNot):
+        return count_segments(~subset)
+    if Is.instance(subset, (LazyAnd, LazyOr)):
+        return sum(map(count_segments, subset))
+    if Is.instance(subset, (SimpleShape, ConnectedShape, DisjointShape)):
+        return sum(map(len, subset.jordans))
+    return 0
+
+
+def overlapping_groups(
+    shapes: Iterable[SubSetR2],
+) -> List[Tuple[SubSetR2, ...]]:
+    """
+    Separates the bounded shapes in groups, such the boxes of the
+    shapes of different groups are disjoint
+    """
+    groups: List[Tuple[Box, List[SubSetR2]]] = []
+    for shape in shapes:
+        box = shape.box()
+        merged, others = [shape], []
+        for group in groups:
+            if group[0] & box is None:
+                others.append(group)
+            else:
+                box |= group[0]
+                merged += group[1]
+        groups = others + [(box, merged)]
+    return [tuple(group[1]) for group in groups]
+
+
+class PlanStep:
+    """
+    A step of the plan: the ``action`` applied over the ``operands``.
+
+    The ``cost`` is the estimated number of pairs of segments that may
+    be intersected, zero when the boxes decide the result
+    """
+
+    EMPTY = "empty"
+    KEEP = "keep"
+    PAIR = "pair"
+    OVERLAY = "overlay"
+
+    def __init__(self, action: str, operands: Tuple[SubSetR2, ...]):
+        self.action = action
+        self.operands = operands
+        self.cost = 0
+        if action == PlanStep.PAIR:
+            self.cost = count_segments(operands[0])
+            self.cost *= count_segments(operands[1])
+        elif action == PlanStep.OVERLAY:
+            self.cost = PlanStep.overlay_cost(operands)
+
+    def __str__(self) -> str:
+        plural = "" if len(self.operands) == 1 else "s"
+        return (
+            f"{self.action}: {len(self.operands)} operand{plural}, "
+            + f"cost {self.cost}"
+        )
+
+    @staticmethod
+    def overlay_cost(operands: Tuple[SubSetR2, ...]) -> int:
+        """Estimates the cost of the overlay, from the pairs of operands
+        whose boxes overlap, or that are not bounded"""
+        boxes = [op.box() if is_bounded(op) else None for op in operands]
+        sizes = tuple(map(count_segments, operands))
+        cost = 0
+        for i, boxa in enumerate(boxes):
+            for j in range(i + 1, len(boxes)):
+                boxb = boxes[j]
+                if boxa is None or boxb is None or boxa & boxb is not None:
+                    cost += sizes[i] * sizes[j]
+        return cost
+
+    @staticmethod
+    def evaluate(operands: Tuple[SubSetR2, ...]) -> PlanStep:
+        """Gives the step that evaluates the operands together"""
+        if len(operands) == 1:
+            return PlanStep(PlanStep.KEEP, operands)
+        if len(operands) == 2:
+            return PlanStep(PlanStep.PAIR, operands)
+        return PlanStep(PlanStep.OVERLAY, operands)
+
+
+class QueryPlan:
+    """
+    Plan to evaluate a LazyAnd or a LazyOr, made by steps that are
+    evaluated independently. The results of the steps of an union
+    are disjoint, and they are joined in a DisjointShape
+
+    The ``operands`` are the ones of the subset by default, but the
+    cleaned operands may be given instead
+
+    Example
+    -------
+    >>> from shapepy.bool2d.primitive import Primitive
+    >>> squarea = Primitive.square(side=1)
+    >>> squareb = Primitive.square(side=1, center=(5, 0))
+    >>> squarec = Primitive.square(side=1, center=(0, 5))
+    >>> plan = QueryPlan(LazyAnd([squarea, squareb, squarec]))
+    >>> [step.action for step in plan.steps]
+    ['empty']
+    """
+
+    def __init__(
+        self,
+        subset: Union[LazyAnd, LazyOr],
+        operands: Optional[Iterable[SubSetR2]] = None,
+    ):
+        if not Is.instance(subset, (LazyAnd, LazyOr)):
+            raise TypeError(f"Invalid subset: {type(subset)}")
+        self.__subset = subset
+        operands = tuple(subset if operands is None else operands)
+        if Is.instance(subset, LazyAnd):
+            self.__steps = QueryPlan.plan_and(operands)
+        else:
+            self.__steps = QueryPlan.plan_or(operands)
+
+    @property
+    def subset(self) -> Union[LazyAnd, LazyOr]:
+        """
+        The lazy subset to be evaluated
+        """
+        return self.__subset
+
+    @property
+    def steps(self) -> Tuple[PlanStep, ...]:
+        """
+        The steps of the plan, at least one
+        """
+        return self.__steps
+
+    @property
+    def cost(self) -> int:
+        """
+        The estimated cost of all the steps
+        """
+        return sum(step.cost for step in self.steps)
+
+    def explain(self) -> str:
+        """
+        Describes the chosen steps and their estimated costs
+        """
+        name = "AND" if Is.instance(self.subset, LazyAnd) else "OR"
+        noperands = sum(len(step.operands) for step in self.steps)
+        lines = [f"{name} of {noperands} operands, estimated cost {self.cost}"]
+        lines += [f"  {step}" for step in self.steps]
+        if len(self.steps) > 1:
+            lines.append(f"  join: {len(self.steps)} disjoint results, cost 0")
+        return "\n".join(lines)
+
+    @staticmethod
+    def plan_and(operands: Tuple[SubSetR2, ...]) -> Tuple[PlanStep]:
+        """
+        Plans the intersection. The bounded operands are sorted by the
+        area of their boxes, such the common box becomes empty as soon
+        as possible, and then the intersection is empty
+        """
+        bounded = sorted(
+            filter(is_bounded, operands),
+            key=lambda operand: box_area(operand.box()),
+        )
+        if bounded:
+            box = bounded[0].box()
+            for operand in bounded[1:]:
+                box &= operand.box()
+                if box is None:
+                    return (PlanStep(PlanStep.EMPTY, operands),)
+        others = (operand for operand in operands if not is_bounded(operand))
+        return (PlanStep.evaluate(tuple(bounded) + tuple(others)),)
+
+    @staticmethod
+    def plan_or(operands: Tuple[SubSetR2, ...]) -> Tuple[PlanStep, ...]:
+        """
+        Plans the union. If all the operands are bounded, they are
+        separated in groups whose boxes are disjoint, and each group
+        is evaluated alone
+        """
+        if len(operands) < 2 or not all(map(is_bounded, operands)):
+            return (PlanStep.evaluate(operands),)
+        groups = overlapping_groups(operands)
+        return tuple(map(PlanStep.evaluate, groups))
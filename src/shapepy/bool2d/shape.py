@@ -10,7 +10,9 @@ or even unconnected shapes.
 from __future__ import annotations
 
 from copy import copy
-from typing import Iterable, Iterator, Tuple, Union
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
 
 from ..geometry.box import Box
 from ..geometry.jordancurve import JordanCurve
@@ -25,6 +27,7 @@ from .curve import SingleCurve
 from .density import (
     Density,
     intersect_densities,
+    lebesgue_densities_jordan,
     lebesgue_density_jordan,
     unite_densities,
 )
@@ -180,6 +183,37 @@ class SimpleShape(SubSetR2):
     def density(self, center: Point2D) -> Density:
         return lebesgue_density_jordan(self.jordan, center)
 
+    def densities(self, points: np.ndarray) -> np.ndarray:
+        """
+        Computes the density of many points at once
+
+        :param points: The array of points, of shape (npts, 2)
+        :return: The array of densities, of shape (npts, )
+        """
+        return lebesgue_densities_jordan(self.jordan, points)
+
+    def contains_points(
+        self, points: np.ndarray, boundary: Optional[bool] = None
+    ) -> np.ndarray:
+        """
+        Tells which of the points are inside the shape
+
+        :param points: The array of points, of shape (npts, 2)
+        :param boundary: If the points on the boundary are inside.
+            By default, uses the ``boundary`` of the shape
+        :return: The boolean array, of shape (npts, )
+
+        Example use
+        -----------
+        >>> from shapepy import Primitive
+        >>> square = Primitive.square(side = 2)
+        >>> square.contains_points([(0, 0), (1, 0), (2, 0)])
+        array([ True,  True, False])
+        """
+        if boundary is None:
+            boundary = self.boundary
+        return points_inside(self.densities(points), boundary)
+
 
 class ConnectedShape(SubSetR2):
     """
@@ -271,6 +305,33 @@ class ConnectedShape(SubSetR2):
         densities = (sub.density(center) for sub in self)
         return intersect_densities(densities)
 
+    def densities(self, points: np.ndarray) -> np.ndarray:
+        """
+        Computes the density of many points at once
+
+        :param points: The array of points, of shape (npts, 2)
+        :return: The array of densities, of shape (npts, )
+        """
+        points = np.asarray(points, dtype=np.float64)
+        values = np.array([sub.densities(points) for sub in self])
+        return merge_densities(self, points, values, np.min(values, axis=0))
+
+    def contains_points(
+        self, points: np.ndarray, boundary: Optional[bool] = None
+    ) -> np.ndarray:
+        """
+        Tells which of the points are inside the shape
+
+        :param points: The array of points, of shape (npts, 2)
+        :param boundary: If the points on the boundary are inside.
+            By default, uses the ``boundary`` of each subshape
+        :return: The boolean array, of shape (npts, )
+        """
+        if boundary is not None:
+            return points_inside(self.densities(points), boundary)
+        points = np.asarray(points, dtype=np.float64)
+        return np.all([sub.contains_points(points) for sub in self], axis=0)
+
 
 class DisjointShape(SubSetR2):
     """
@@ -370,3 +431,51 @@ class DisjointShape(SubSetR2):
     def density(self, center: Point2D) -> Real:
         center = To.point(center)
         return unite_densities((sub.density(center) for sub in self))
+
+    def densities(self, points: np.ndarray) -> np.ndarray:
+        """
+        Computes the density of many points at once
+
+        :param points: The array of points, of shape (npts, 2)
+        :return: The array of densities, of shape (npts, )
+        """
+        points = np.asarray(points, dtype=np.float64)
+        values = np.array([sub.densities(points) for sub in self])
+        return merge_densities(self, points, values, np.max(values, axis=0))
+
+    def contains_points(
+        self, points: np.ndarray, boundary: Optional[bool] = None
+    ) -> np.ndarray:
+        """
+        Tells which of the points are inside the shape
+
+        :param points: The array of points, of shape (npts, 2)
+        :param boundary: If the points on the boundary are inside.
+            By default, uses the ``boundary`` of each subshape
+        :return: The boolean array, of shape (npts, )
+        """
+        if boundary is not None:
+            return points_inside(self.densities(points), boundary)
+        points = np.asarray(points, dtype=np.float64)
+        return np.any([sub.contains_points(points) for sub in self], axis=0)
+
+
+def points_inside(densities: np.ndarray, boundary: bool) -> np.ndarray:
+    """Transforms the densities into the boolean array of the points
+    inside the shape, the same way as ``SimpleShape.__contains__``"""
+    return densities > 0 if boundary else densities == 1
+
+
+def merge_densities(
+    shape: Union[ConnectedShape, DisjointShape],
+    points: np.ndarray,
+    values: np.ndarray,
+    merged: np.ndarray,
+) -> np.ndarray:
+    """Corrects the densities merged from the subshapes' values at the
+    points on the boundaries, where the sectors must be combined"""
+    partial = np.any((0 < values) & (values < 1), axis=0)
+    for i in np.flatnonzero(partial):
+        point = (float(points[i, 0]), float(points[i, 1]))
+        merged[i] = float(shape.density(point))
+    return merged
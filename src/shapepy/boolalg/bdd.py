@@ -0,0 +1,260 @@
+"""
+Defines a reduced ordered binary decision diagram (ROBDD) engine,
+used to simplify boolean expressions without evaluating all the
+combinations of the variables
+
+Each node is an integer that refers to the triple (var, low, high):
+the function is ``low`` when the variable ``var`` is false and ``high``
+when it's true. The nodes are unique, such two equivalent functions
+are always the same integer
+
+Example
+-------
+>>> diagram = BDD(2)
+>>> vara, varb = diagram.variable(0), diagram.variable(1)
+>>> node = diagram.disjunction(vara, diagram.conjunction(vara, varb))
+>>> node == vara
+True
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ..loggers import debug
+from ..tools import Is, NotExpectedError
+from .tree import BoolTree, Operators
+
+T = TypeVar("T")
+
+Cube = Tuple[Tuple[int, bool], ...]
+
+
+class BDD:
+    """
+    Manager of the nodes of binary decision diagrams over ``nvars``
+    ordered variables. The variable 0 is the top of the diagrams.
+
+    The nodes are hash-consed in an unique table and the results of
+    ``ite`` are stored in a cache, such the operations between two
+    diagrams are proportional to the product of their sizes.
+
+    An OverflowError is raised when the number of nodes would pass
+    ``maxnodes``, since some functions have exponential diagrams
+    """
+
+    FALSE = 0
+    TRUE = 1
+
+    def __init__(self, nvars: int, maxnodes: Optional[int] = None):
+        self.__nvars = nvars
+        self.__maxnodes = maxnodes
+        self.__nodes: List[Tuple[int, int, int]] = [
+            (nvars, BDD.FALSE, BDD.FALSE),
+            (nvars, BDD.TRUE, BDD.TRUE),
+        ]
+        self.__unique: Dict[Tuple[int, int, int], int] = {}
+        self.__cache: Dict[Tuple[int, int, int], int] = {}
+        self.__isops: Dict[Tuple[int, int], Tuple[int, Tuple[Cube, ...]]]
+        self.__isops = {}
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+    @property
+    def nvars(self) -> int:
+        """
+        The number of variables of the diagrams
+        """
+        return self.__nvars
+
+    def node(self, var: int, low: int, high: int) -> int:
+        """
+        Gives the unique node (var, low, high), or the node ``low``
+        when both children are equal
+        """
+        if low == high:
+            return low
+        key = (var, low, high)
+        if key not in self.__unique:
+            if self.__maxnodes and len(self.__nodes) >= self.__maxnodes:
+                raise OverflowError(f"Passed {self.__maxnodes} nodes")
+            self.__unique[key] = len(self.__nodes)
+            self.__nodes.append(key)
+        return self.__unique[key]
+
+    def variable(self, var: int) -> int:
+        """
+        Gives the node of the function that is true only when
+        the variable ``var`` is true
+        """
+        if not 0 <= var < self.__nvars:
+            raise ValueError(f"Invalid variable {var}")
+        return self.node(var, BDD.FALSE, BDD.TRUE)
+
+    def top(self, node: int) -> int:
+        """
+        Gives the variable of the node, ``nvars`` for the terminals
+        """
+        return self.__nodes[node][0]
+
+    def cofactors(self, node: int, var: int) -> Tuple[int, int]:
+        """
+        Gives the pair of nodes (low, high), the functions when the
+        variable ``var`` is false or true. ``var`` is not below the node
+        """
+        top, low, high = self.__nodes[node]
+        return (low, high) if top == var else (node, node)
+
+    def ite(self, cond: int, then: int, other: int) -> int:
+        """
+        Computes the node of 'if cond then `then` else `other`',
+        which is the base of all the other operations
+        """
+        if cond == BDD.TRUE or then == other:
+            return then
+        if cond == BDD.FALSE:
+            return other
+        if then == BDD.TRUE and other == BDD.FALSE:
+            return cond
+        key = (cond, then, other)
+        if key not in self.__cache:
+            var = min(self.top(cond), self.top(then), self.top(other))
+            cond0, cond1 = self.cofactors(cond, var)
+            then0, then1 = self.cofactors(then, var)
+            other0, other1 = self.cofactors(other, var)
+            low = self.ite(cond0, then0, other0)
+            high = self.ite(cond1, then1, other1)
+            self.__cache[key] = self.node(var, low, high)
+        return self.__cache[key]
+
+    def negate(self, node: int) -> int:
+        """Computes the complementar function: NOT[f]"""
+        return self.ite(node, BDD.FALSE, BDD.TRUE)
+
+    def conjunction(self, nodea: int, nodeb: int) -> int:
+        """Computes the conjunction: AND[f, g]"""
+        return self.ite(nodea, nodeb, BDD.FALSE)
+
+    def disjunction(self, nodea: int, nodeb: int) -> int:
+        """Computes the disjunction: OR[f, g]"""
+        return self.ite(nodea, BDD.TRUE, nodeb)
+
+    def exclusive(self, nodea: int, nodeb: int) -> int:
+        """Computes the exclusive disjunction: XOR[f, g]"""
+        return self.ite(nodea, self.negate(nodeb), nodeb)
+
+    def support(self, node: int) -> Set[int]:
+        """
+        Gives the variables on which the function really depends
+        """
+        variables = set()
+        visited = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node in visited or node in (BDD.FALSE, BDD.TRUE):
+                continue
+            visited.add(node)
+            var, low, high = self.__nodes[node]
+            variables.add(var)
+            stack += [low, high]
+        return variables
+
+    def isop(self, lower: int, upper: int) -> Tuple[int, Tuple[Cube, ...]]:
+        """
+        Computes an irredundant sum of products, by the Minato-Morreale
+        algorithm, of a function between ``lower`` and ``upper``.
+
+        Returns the node of the computed function and its cubes. Each
+        cube is a tuple of pairs (var, value) for the literals
+        """
+        if lower == BDD.FALSE:
+            return BDD.FALSE, ()
+        if upper == BDD.TRUE:
+            return BDD.TRUE, ((),)
+        key = (lower, upper)
+        if key not in self.__isops:
+            self.__isops[key] = self.__isop(lower, upper)
+        return self.__isops[key]
+
+    def __isop(self, lower: int, upper: int) -> Tuple[int, Tuple[Cube, ...]]:
+        """Computes the isop of non-terminal bounds, splitting them
+        by the cofactors of their top variable"""
+        var = min(self.top(lower), self.top(upper))
+        lowers = self.cofactors(lower, var)
+        uppers = self.cofactors(upper, var)
+        node0, cubes0 = self.isop(
+            self.conjunction(lowers[0], self.negate(uppers[1])), uppers[0]
+        )
+        node1, cubes1 = self.isop(
+            self.conjunction(lowers[1], self.negate(uppers[0])), uppers[1]
+        )
+        rest = self.disjunction(
+            self.conjunction(lowers[0], self.negate(node0)),
+            self.conjunction(lowers[1], self.negate(node1)),
+        )
+        noded, cubesd = self.isop(rest, self.conjunction(*uppers))
+        node = self.disjunction(self.node(var, node0, node1), noded)
+        cubes = tuple(((var, False),) + cube for cube in cubes0)
+        cubes += tuple(((var, True),) + cube for cube in cubes1)
+        return node, cubes + cubesd
+
+    @debug("shapepy.boolalg.bdd")
+    def from_table(self, table: Iterable[bool]) -> int:
+        """
+        Builds the diagram from the truth table of the function: the
+        row ``i`` is the value when the variables are the bits of ``i``,
+        with the variable 0 as the most significant bit
+        """
+        nodes = [BDD.TRUE if value else BDD.FALSE for value in table]
+        if len(nodes) != 2**self.__nvars:
+            raise ValueError(f"Invalid table size: {len(nodes)}")
+        for var in range(self.__nvars - 1, -1, -1):
+            nodes = [
+                self.node(var, nodes[i], nodes[i + 1])
+                for i in range(0, len(nodes), 2)
+            ]
+        return nodes[0]
+
+    @debug("shapepy.boolalg.bdd")
+    def from_tree(
+        self, tree: Union[T, BoolTree[T]], indexs: Dict[int, int]
+    ) -> int:
+        """
+        Builds the diagram of the boolean expression, in which the
+        object ``var`` is the variable of index ``indexs[id(var)]``
+        """
+        if not Is.instance(tree, BoolTree):
+            return self.variable(indexs[id(tree)])
+        nodes = [self.from_tree(item, indexs) for item in tree]
+        if tree.operator == Operators.NOT:
+            return self.negate(nodes[0])
+        # The operands are joined from the deepest top variable, such
+        # each operation only walks the new operand's diagram
+        nodes.sort(key=self.top, reverse=True)
+        if tree.operator == Operators.AND:
+            result = BDD.TRUE
+            for node in nodes:
+                result = self.conjunction(node, result)
+            return result
+        if tree.operator == Operators.OR:
+            result = BDD.FALSE
+            for node in nodes:
+                result = self.disjunction(node, result)
+            return result
+        if tree.operator == Operators.XOR:
+            result = BDD.FALSE
+            for node in nodes:
+                result = self.exclusive(node, result)
+            return result
+        raise NotExpectedError(f"Invalid operator: {tree.operator}")
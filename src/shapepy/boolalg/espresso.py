@@ -0,0 +1,333 @@
+"""
+Defines a heuristic two-level minimizer, in the spirit of Espresso,
+used to simplify the boolean expressions that are too big to be
+converted into a binary decision diagram
+
+The function is stored as a cover, a list of cubes, and the loop of
+expand, irredundant and reduce is made until the cover stops improving.
+The cover is not the minimum, but its size doesn't depend on 2^n
+
+Each cube is an implicant (value, mask), with the variable 0 as the
+most significant bit: the bits of mask are the variables that don't
+matter, and the other bits of value are the values of the variables
+
+Example
+-------
+>>> from shapepy.boolalg.converter import string2tree
+>>> from shapepy.boolalg.simplify import find_variables
+>>> tree = string2tree("a*b+a*!b+a*c")
+>>> indexs = {id(var): i for i, var in enumerate(find_variables(tree))}
+>>> espresso = Espresso(3)
+>>> cover = espresso.from_tree(tree, indexs)
+>>> espresso.minimize(cover)
+[(4, 3)]
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from ..loggers import debug
+from ..tools import Is, NotExpectedError
+from .tree import BoolTree, Operators
+
+T = TypeVar("T")
+
+Implicant = Tuple[int, int]
+
+
+def weight(cube: Implicant) -> int:
+    """Gives the number of variables that don't matter for the cube"""
+    return bin(cube[1]).count("1")
+
+
+class Espresso:
+    """
+    Minimizer of covers over ``nbits`` variables.
+
+    The covers made from the trees are limited to ``maxcubes`` cubes,
+    since the product of big covers grows too fast
+    """
+
+    def __init__(self, nbits: int, maxcubes: Optional[int] = 4096):
+        self.__nbits = nbits
+        self.__full = 2**nbits - 1
+        self.__maxcubes = maxcubes
+
+    @property
+    def nbits(self) -> int:
+        """
+        The number of variables of the cubes
+        """
+        return self.__nbits
+
+    @property
+    def universe(self) -> Implicant:
+        """
+        The cube that contains all the points, without literals
+        """
+        return (0, self.__full)
+
+    def literal(self, var: int, value: bool) -> Implicant:
+        """
+        Gives the cube of the single literal of the variable ``var``
+        """
+        bit = 1 << (self.__nbits - var - 1)
+        return (bit if value else 0, self.__full ^ bit)
+
+    def intersect(
+        self, cubea: Implicant, cubeb: Implicant
+    ) -> Optional[Implicant]:
+        """
+        Gives the intersection of the two cubes, or None if it's empty
+        """
+        literals = self.__full ^ (cubea[1] | cubeb[1])
+        if (cubea[0] ^ cubeb[0]) & literals:
+            return None
+        return (cubea[0] | cubeb[0], cubea[1] & cubeb[1])
+
+    @staticmethod
+    def contains(cubea: Implicant, cubeb: Implicant) -> bool:
+        """
+        Tells if the cube A contains the cube B
+        """
+        if cubeb[1] & ~cubea[1]:
+            return False
+        return not (cubea[0] ^ cubeb[0]) & ~cubea[1]
+
+    def cofactor(
+        self, cubes: List[Implicant], cube: Implicant
+    ) -> List[Implicant]:
+        """
+        Gives the cofactor of the cover with respect to the cube: the
+        cover restricted to the cube, without the literals of the cube
+        """
+        literals = self.__full ^ cube[1]
+        return [
+            (other[0] & cube[1], other[1] | literals)
+            for other in cubes
+            if self.intersect(other, cube) is not None
+        ]
+
+    def __split(self, cubes: List[Implicant], binate: bool) -> int:
+        """Chooses the variable that appears in most of the cubes,
+        only between the ones with both polarities if ``binate``"""
+        positive, negative = 0, 0
+        for value, mask in cubes:
+            positive |= value & ~mask
+            negative |= ~value & ~mask
+        candidates = positive & negative if binate else positive | negative
+        candidates &= self.__full
+        if not candidates:
+            return -1
+        counts: Dict[int, int] = {}
+        for _, mask in cubes:
+            literals = candidates & ~mask
+            while literals:
+                bit = literals & -literals
+                literals ^= bit
+                counts[bit] = counts.get(bit, 0) + 1
+        bit = max(counts, key=counts.get)
+        return self.__nbits - bit.bit_length()
+
+    def tautology(self, cubes: List[Implicant]) -> bool:
+        """
+        Tells if the cover contains all the points
+        """
+        if any(mask == self.__full for _, mask in cubes):
+            return True
+        var = self.__split(cubes, binate=True)
+        if var < 0:  # A unate cover needs the universe cube
+            return False
+        return all(
+            self.tautology(self.cofactor(cubes, self.literal(var, value)))
+            for value in (True, False)
+        )
+
+    def covers(self, cubes: List[Implicant], cube: Implicant) -> bool:
+        """
+        Tells if the cube is inside the cover
+        """
+        return self.tautology(self.cofactor(cubes, cube))
+
+    def complement(
+        self, cubes: List[Implicant], limit: Optional[int] = None
+    ) -> List[Implicant]:
+        """
+        Gives a cover of the complementar function, by the recursive
+        expansion over the variable that appears in most cubes.
+
+        An OverflowError is raised if it has more than ``limit`` cubes
+        """
+        if not cubes:
+            return [self.universe]
+        if any(mask == self.__full for _, mask in cubes):
+            return []
+        if len(cubes) == 1:
+            value, mask = cubes[0]
+            result = []
+            for var in range(self.__nbits):
+                bit = 1 << (self.__nbits - var - 1)
+                if not mask & bit:
+                    result.append(self.literal(var, value & bit == 0))
+            return result
+        var = self.__split(cubes, binate=False)
+        result = []
+        for value in (True, False):
+            literal = self.literal(var, value)
+            cofactor = self.cofactor(cubes, literal)
+            for cube in self.complement(cofactor, limit):
+                result.append(self.intersect(cube, literal))
+        return self.absorb(result, limit)
+
+    def absorb(
+        self, cubes: Iterable[Implicant], limit: Optional[int] = None
+    ) -> List[Implicant]:
+        """
+        Removes the cubes that are inside other cube of the cover.
+
+        An OverflowError is raised if more than ``limit`` cubes remain,
+        by default the ``maxcubes`` of the instance
+        """
+        limit = limit or self.__maxcubes
+        cubes = sorted(set(cubes), key=lambda cube: -weight(cube))
+        result: List[Implicant] = []
+        for cube in cubes:
+            if not any(self.contains(other, cube) for other in result):
+                result.append(cube)
+            if limit and len(result) > limit:
+                raise OverflowError(f"Cover with more than {limit} cubes")
+        return result
+
+    def product(
+        self, cubesa: List[Implicant], cubesb: List[Implicant]
+    ) -> List[Implicant]:
+        """
+        Gives the cover of the conjunction of two covers
+        """
+        result = (self.intersect(a, b) for a in cubesa for b in cubesb)
+        return self.absorb(cube for cube in result if cube is not None)
+
+    @debug("shapepy.boolalg.espresso")
+    def from_tree(
+        self, tree: Union[T, BoolTree[T]], indexs: Dict[int, int]
+    ) -> List[Implicant]:
+        """
+        Gives the cover of the boolean expression, in which the object
+        ``var`` is the variable of index ``indexs[id(var)]``
+        """
+        if not Is.instance(tree, BoolTree):
+            return [self.literal(indexs[id(tree)], True)]
+        covers = [self.from_tree(item, indexs) for item in tree]
+        if tree.operator == Operators.NOT:
+            return self.complement(covers[0])
+        if tree.operator == Operators.OR:
+            return self.absorb(cube for cover in covers for cube in cover)
+        if tree.operator == Operators.AND:
+            result = [self.universe]
+            for cover in covers:
+                result = self.product(result, cover)
+            return result
+        if tree.operator == Operators.XOR:
+            result = []
+            for cover in covers:
+                inverse = self.complement(result)
+                result = self.absorb(
+                    self.product(result, self.complement(cover))
+                    + self.product(inverse, cover)
+                )
+            return result
+        raise NotExpectedError(f"Invalid operator: {tree.operator}")
+
+    def expand(
+        self, cubes: List[Implicant], offset: Optional[List[Implicant]]
+    ) -> List[Implicant]:
+        """
+        Removes the literals of each cube while it doesn't intersect
+        the offset, and then the cubes covered by the expanded ones.
+
+        If the offset is None, the expanded cube must be inside the
+        cover instead, which is slower but doesn't need the complement
+        """
+
+        def valid(cube: Implicant) -> bool:
+            if offset is None:
+                return self.covers(cubes, cube)
+            return all(self.intersect(cube, off) is None for off in offset)
+
+        result = []
+        for value, mask in sorted(cubes, key=lambda cube: -weight(cube)):
+            literals = self.__full ^ mask
+            while literals:
+                bit = literals & -literals
+                literals ^= bit
+                if valid((value & ~bit, mask | bit)):
+                    value, mask = value & ~bit, mask | bit
+            result.append((value, mask))
+        return self.absorb(result)
+
+    def irredundant(self, cubes: List[Implicant]) -> List[Implicant]:
+        """
+        Removes the cubes that are covered by the other cubes,
+        starting from the smallest ones
+        """
+        result = sorted(cubes, key=weight)
+        index = 0
+        while index < len(result):
+            others = result[:index] + result[index + 1 :]
+            if self.covers(others, result[index]):
+                result = others
+            else:
+                index += 1
+        return result
+
+    def reduce(self, cubes: List[Implicant]) -> List[Implicant]:
+        """
+        Adds literals to each cube while the removed part is still
+        covered by the other cubes, which allows other expansions.
+
+        Only the variables of the cubes that share some variable with
+        the reduced cube are tried
+        """
+        result = list(cubes)
+        for index, (value, mask) in enumerate(result):
+            others = result[:index] + result[index + 1 :]
+            near = 0
+            for _, other in others:
+                if ~other & ~mask & self.__full:
+                    near |= ~other & self.__full
+            free = mask & near
+            while free:
+                bit = free & -free
+                free ^= bit
+                for boolean in (True, False):
+                    kept = (value | bit if boolean else value, mask ^ bit)
+                    removed = (value if boolean else value | bit, mask ^ bit)
+                    if self.covers(others, removed):
+                        value, mask = kept
+                        break
+            result[index] = (value, mask)
+        return result
+
+    @debug("shapepy.boolalg.espresso")
+    def minimize(self, cubes: List[Implicant]) -> List[Implicant]:
+        """
+        Minimizes the cover by the loop of expand, irredundant and
+        reduce, until the number of cubes and literals stop decreasing
+        """
+
+        def cost(cover: List[Implicant]) -> Tuple[int, int]:
+            literals = sum(self.__nbits - weight(cube) for cube in cover)
+            return len(cover), literals
+
+        try:
+            offset = self.complement(cubes, 4 * len(cubes) + 64)
+        except OverflowError:
+            offset = None
+        cubes = self.irredundant(self.expand(cubes, offset))
+        while True:
+            trial = self.reduce(cubes)
+            trial = self.irredundant(self.expand(trial, offset))
+            if cost(trial) >= cost(cubes):
+                return cubes
+            cubes = trial
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Iterator, Set, Tuple, TypeVar, Union
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+import numpy as np
 
 from ..loggers import debug
 from ..tools import Is, NotExpectedError
-from .tree import BoolTree, Operators, false_tree, true_tree
+from .bdd import BDD, Cube
+from .espresso import Espresso, Implicant
+from .tree import BoolTree, Operators, TreeKey, false_tree, true_tree
 
 T = TypeVar("T")
 
@@ -35,204 +40,202 @@ def find_variables(tree: BoolTree[T]) -> Iterator[T]:
 
 @debug("shapepy.boolalg.simplify")
 def simplify_tree(
-    tree: Union[T, BoolTree[T]], maxvars: int = 16
+    tree: Union[T, BoolTree[T]],
+    maxvars: Optional[int] = None,
+    maxnodes: Optional[int] = 2**16,
 ) -> BoolTree[T]:
-    """Simplifies given boolean expression"""
+    """Simplifies given boolean expression
+
+    The expression is converted into a binary decision diagram, from
+    which an irredundant sum of products is extracted. The diagrams of
+    few variables are built from the bit-parallel truth table. If the diagram
+    passes ``maxnodes`` nodes, the heuristic minimizer Espresso is used.
+    If ``maxvars`` is given, the expressions with more variables are
+    not simplified
+    """
     if not Is.instance(tree, BoolTree):
         return tree
+    if tree.operator in (Operators.AND, Operators.OR) and not any(
+        Is.instance(item, BoolTree) for item in tree
+    ):  # Distinct variables, already simplified
+        return tree
     variables = tuple(find_variables(tree))
     if maxvars and len(variables) > maxvars:
         return tree
-    idsvars = tuple(map(id, variables))
-    table = Implicants.evaluate_table(tree, idsvars)
-    if len(variables) == 0:
-        result = bool(tuple(table)[0])
-        return true_tree() if result else false_tree()
-    implicants = Implicants.find_prime_implicants(table)
-    implicants = Implicants.merge_prime_implicants(implicants)
-    implicants = Implicants.sort_implicants(implicants)
+    try:
+        implicants = bdd_implicants(tree, variables, maxnodes)
+    except OverflowError:
+        implicants = espresso_implicants(tree, variables)
+    if implicants is None:
+        return tree
+    implicants = Implicants.sort_implicants(implicants, len(variables))
+    if not implicants or implicants[0][1] == 2 ** len(variables) - 1:
+        return true_tree() if implicants else false_tree()
     return Implicants.implicants2tree(implicants, variables)
 
 
+def bdd_implicants(
+    tree: BoolTree[T], variables: Tuple[T], maxnodes: Optional[int] = None
+) -> Tuple[Implicant]:
+    """Gives the irredundant sum of products of the tree, computed
+    from its binary decision diagram
+
+    With up to ``Implicants.maxtable`` variables, the diagram is built
+    from the truth table, evaluated over all the rows at once, instead
+    of combining the diagrams of each operator of the tree"""
+    diagram = BDD(len(variables), maxnodes)
+    if len(variables) <= Implicants.maxtable:
+        table = Implicants.evaluate_table(tree, map(id, variables))
+        node = diagram.from_table(table)
+    else:
+        indexs = {id(var): i for i, var in enumerate(variables)}
+        node = diagram.from_tree(tree, indexs)
+    _, cubes = diagram.isop(node, node)
+    return tuple(
+        Implicants.cube2implicant(cube, len(variables)) for cube in cubes
+    )
+
+
+def espresso_implicants(
+    tree: BoolTree[T], variables: Tuple[T]
+) -> Optional[Tuple[Implicant]]:
+    """Gives the sum of products of the tree found by the heuristic
+    minimizer, or None if the cover of the tree is too big"""
+    indexs = {id(var): i for i, var in enumerate(variables)}
+    espresso = Espresso(len(variables))
+    try:
+        cover = espresso.from_tree(tree, indexs)
+    except OverflowError:
+        return None
+    return tuple(espresso.minimize(cover))
+
+
+@lru_cache(maxsize=1024)
+def cached_simplify(key: TreeKey) -> BoolTree:
+    """Simplifies the tree of the key, keeping the last results.
+
+    The trees with the same structure and the same variables are
+    simplified only once. The statistics are given by
+    ``cached_simplify.cache_info()`` and the results are removed by
+    ``cached_simplify.cache_clear()``
+    """
+    return simplify_tree(key.tree)
+
+
 class Implicants:
-    """Class to store static methods used to simplify implicants"""
+    """Class to store static methods used to simplify implicants
+
+    An implicant is a pair of integers (value, mask): the bits of mask
+    are the variables that don't matter, and the other bits of value
+    are the values of the variables. The variable 0 is the most
+    significant bit, such the implicant (0b100, 0b010) is written '1-0'
+    """
 
-    TRUE = "1"
-    FALSE = "0"
-    NOTCARE = "-"
+    maxtable = 10
 
     @staticmethod
     @debug("shapepy.boolalg.simplify")
-    def evaluate(tree: BoolTree, idsvars: Tuple[int], binary: int) -> bool:
-        """Evaluates a single boolean expression"""
+    def evaluate_table(tree: BoolTree, idsvars: Iterable[int]) -> np.ndarray:
+        """Evaluates all the combination of boolean variables
+
+        Each variable is a boolean column of the 2^n rows, and the
+        operators are applied over the whole columns at once
+        """
         if not Is.instance(tree, BoolTree):
-            index = len(idsvars) - idsvars.index(id(tree)) - 1
-            return bool(binary & (2**index))
-        values = (Implicants.evaluate(i, idsvars, binary) for i in tree)
+            raise TypeError(f"Invalid typo: {type(tree)}")
+        idsvars = tuple(idsvars)
+        nbits = len(idsvars)
+        rows = np.arange(2**nbits, dtype=np.uint64)
+        columns = {
+            idvar: ((rows >> np.uint64(nbits - i - 1)) & np.uint64(1)) != 0
+            for i, idvar in enumerate(idsvars)
+        }
+        return Implicants.evaluate_columns(tree, columns, 2**nbits)
+
+    @staticmethod
+    def evaluate_columns(
+        tree: BoolTree, columns: Dict[int, np.ndarray], size: int
+    ) -> np.ndarray:
+        """Evaluates the tree over the columns of the variables"""
+        if not Is.instance(tree, BoolTree):
+            return columns[id(tree)]
+        values = (Implicants.evaluate_columns(i, columns, size) for i in tree)
         if tree.operator == Operators.NOT:
-            return not tuple(values)[0]
+            return ~next(values)
         if tree.operator == Operators.OR:
-            return any(values)
+            result = np.zeros(size, dtype=bool)
+            for value in values:
+                result |= value
+            return result
         if tree.operator == Operators.AND:
-            return all(values)
+            result = np.ones(size, dtype=bool)
+            for value in values:
+                result &= value
+            return result
         if tree.operator == Operators.XOR:
-            return sum(values) % 2
+            result = np.zeros(size, dtype=bool)
+            for value in values:
+                result ^= value
+            return result
         raise NotExpectedError(f"Invalid operator: {tree.operator}")
 
     @staticmethod
-    @debug("shapepy.boolalg.simplify")
-    def evaluate_table(
-        tree: BoolTree, idsvars: Iterable[int]
-    ) -> Iterator[bool]:
-        """Evaluates all the combination of boolean variables"""
-        if not Is.instance(tree, BoolTree):
-            raise TypeError(f"Invalid typo: {type(tree)}")
-        results = []
-        for counter in range(2 ** len(idsvars)):
-            results.append(Implicants.evaluate(tree, idsvars, counter))
-        return tuple(map(bool, results))
-
-    @staticmethod
-    def binary2number(binary: str) -> int:
-        """Converts a binary representation to a number
+    def cube2implicant(cube: Cube, nbits: int) -> Implicant:
+        """Converts a cube, the pairs (var, value) of its literals,
+        into an implicant
 
         Example
         -------
-        >>> binary2number("0000")
-        0
-        >>> binary2number("0001")
-        1
-        >>> binary2number("0010")
-        2
-        >>> binary2number("1111")
-        15
-        """
-        number = 0
-        for char in binary:
-            number *= 2
-            number += 1 if (char == Implicants.TRUE) else 0
-        return number
-
-    @staticmethod
-    def number2binary(number: int, nbits: int) -> str:
-        """Converts a number into a binary representation
-
-        Example
-        -------
-        >>> number2binary(0, 4)
-        0000
-        >>> number2binary(1, 4)
-        0001
-        >>> number2binary(2, 4)
-        0010
-        >>> number2binary(15, 4)
-        1111
-        """
-        chars = []
-        while number > 0:
-            char = Implicants.TRUE if number % 2 else Implicants.FALSE
-            chars.insert(0, char)
-            number //= 2
-        return Implicants.FALSE * (nbits - len(chars)) + "".join(chars)
-
-    @staticmethod
-    def find_prime_implicants(results: Iterable[bool]) -> Iterator[str]:
-        """Finds the prime implicants
-
-        A minterm is of the form '1001', '1010', etc
+        >>> cube2implicant(((0, True), (2, False)), 4)
+        (8, 5)
         """
-        results = tuple(results)
-        nbits = 0
-        length = len(results)
-        while length > 2**nbits:
-            nbits += 1
-        if length != 2**nbits:
-            raise ValueError(f"Invalid results: {results}")
-        implicants = []
-        for i, result in enumerate(results):
-            if result:
-                implicants.append(Implicants.number2binary(i, nbits))
-        return tuple(implicants)
+        value, mask = 0, 2**nbits - 1
+        for var, boolean in cube:
+            bit = 1 << (nbits - var - 1)
+            mask ^= bit
+            if boolean:
+                value |= bit
+        return value, mask
 
     @staticmethod
     @debug("shapepy.boolalg.simplify")
-    def merge_prime_implicants(minterms: Iterable[str]) -> Set[str]:
-        """Merge the prime implicants
-
-        A minterm is of the form '1001', '1010', etc
+    def sort_implicants(
+        implicants: Iterable[Implicant], nbits: int
+    ) -> Tuple[Implicant]:
+        """Sorts the implicants by the simplest first
+
+        The ties are sorted as the binary representations, with the
+        order '1' > '0' > '-'. The digits 3, 1, 0 are given to them
+        by spreading the bits of value and mask in base 4
         """
-        minterms = tuple(minterms)
-        while True:
-            new_minterms = set()
-            length = len(minterms)
-            merges = [False] * length
-            for i, mini in enumerate(minterms):
-                for j in range(i + 1, length):
-                    minj = minterms[j]
-                    if Implicants.can_merge(mini, minj):
-                        merges[i] = True
-                        merges[j] = True
-                        merged = Implicants.merge_two(mini, minj)
-                        if merged not in minterms:
-                            new_minterms.add(merged)
-            if len(new_minterms) == 0:
-                break
-            minterms = (m for i, m in enumerate(minterms) if not merges[i])
-            minterms = tuple(set(minterms) | set(new_minterms))
-
-        return minterms
+        full = 2**nbits - 1
 
-    @staticmethod
-    def can_merge(mini: str, minj: str) -> bool:
-        """Tells if it's possible to merge two implicants"""
-        assert Is.instance(mini, str)
-        assert Is.instance(minj, str)
-        assert len(mini) == len(minj)
-        for chari, charj in zip(mini, minj):
-            if (chari == Implicants.NOTCARE) ^ (charj == Implicants.NOTCARE):
-                return False
-        numi = Implicants.binary2number(mini)
-        numj = Implicants.binary2number(minj)
-        res = numi ^ numj
-        return res != 0 and (res & res - 1) == 0
+        def weight(implicant: Implicant) -> Tuple[int, int]:
+            value, mask = implicant
+            digits = 2 * int(f"0{value:b}", 4) + int(f"0{full ^ mask:b}", 4)
+            return bin(mask).count("1"), digits
 
-    @staticmethod
-    def merge_two(mini: str, minj: str) -> bool:
-        """Merge two implicants"""
-        result = []
-        for chari, charj in zip(mini, minj):
-            new_char = Implicants.NOTCARE if chari != charj else chari
-            result.append(new_char)
-        return "".join(result)
-
-    @staticmethod
-    @debug("shapepy.boolalg.simplify")
-    def sort_implicants(implicants: Iterable[str]) -> Iterable[str]:
-        """Sorts the implicants by the simplest first"""
-        implicants = tuple(implicants)
-        weights = tuple(
-            sum(c == Implicants.NOTCARE for c in imp) for imp in implicants
-        )
-        return tuple(
-            i for _, i in sorted(zip(weights, implicants), reverse=True)
-        )
+        return tuple(sorted(implicants, key=weight, reverse=True))
 
     @staticmethod
     def implicants2tree(
-        implicants: Iterable[str], variables: Tuple[T]
+        implicants: Iterable[Implicant], variables: Tuple[T]
     ) -> BoolTree[T]:
         """
         Tranforms the implicants into a tree
         """
+        nbits = len(variables)
         invvars = tuple(BoolTree((v,), Operators.NOT) for v in variables)
         ands = []
-        for implicant in implicants:
+        full = 2**nbits - 1
+        for value, mask in implicants:
             parts = []
-            for i, imp in enumerate(implicant):
-                if imp == Implicants.FALSE:
-                    parts.append(invvars[i])
-                elif imp == Implicants.TRUE:
-                    parts.append(variables[i])
+            literals = full ^ mask
+            while literals:
+                bit = 1 << (literals.bit_length() - 1)
+                literals ^= bit
+                i = nbits - bit.bit_length()
+                parts.append(variables[i] if value & bit else invvars[i])
             if len(parts) == 1:
                 ands.append(parts[0])
             else:
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from collections import Counter
 from enum import Enum
-from typing import Generic, Iterable, Iterator, TypeVar
+from typing import Generic, Iterable, Iterator, TypeVar, Union
 
 from ..loggers import debug
 from ..tools import NotExpectedError
@@ -116,6 +116,51 @@ class BoolTree(Generic[T]):
         return ope2str[self.operator] + "[" + ",".join(map(repr, self)) + "]"
 
 
+class TreeKey:
+    """
+    Hashable key of a boolean tree, given by its structure: the operator
+    of each node and the ids of the variables at the leafs.
+
+    The children of the commutative operators are sorted, such the trees
+    that differ only by the order of the items give equal keys
+
+    Example
+    -------
+    >>> from shapepy.boolalg.converter import string2tree
+    >>> TreeKey(string2tree("a+b*c")) == TreeKey(string2tree("c*b+a"))
+    True
+    """
+
+    def __init__(self, tree: Union[T, BoolTree[T]]):
+        self.tree = tree
+        self.fingerprint = fingerprint(tree)
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TreeKey):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+
+def fingerprint(tree: Union[T, BoolTree[T]]) -> tuple:
+    """Gives the structure of the tree as nested tuples
+
+    A variable is replaced by the pair (0, id), and a tree by the pair
+    with the value of its operator and the fingerprints of its items.
+    Since the operators' values are positive, the fingerprints are
+    totally ordered, and the items of the commutative operators are
+    sorted by them, not depending on the hashes
+    """
+    if not isinstance(tree, BoolTree):
+        return (0, id(tree))
+    items = tuple(map(fingerprint, tree))
+    if tree.operator != Operators.NOT:
+        items = tuple(sorted(items))
+    return (tree.operator.value, items)
+
+
 def false_tree() -> BoolTree:
     """Gets a boolean tree that is equivalent to false boolean value"""
     return BoolTree([], Operators.OR)
@@ -0,0 +1,235 @@
+"""
+Defines the JordanArrays class, a compact and read-only view of the
+jordan curve that stores the polynomial coefficients of all segments
+in a single float64 array, allowing to evaluate, bound, integrate
+and tessellate all the segments at once with numpy
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+from ..analytic.polynomial import shift_coefs
+from ..analytic.tools import PolynomialFunctions
+from ..tools import Is, To
+from .box import Box
+
+
+def multiply_rows(coefsa: np.ndarray, coefsb: np.ndarray) -> np.ndarray:
+    """
+    Multiplies the polynomials line by line: the coefficients
+    of the matrices (m, p+1) and (m, q+1) give the matrix (m, p+q+1)
+
+    Example
+    -------
+    >>> multiply_rows(np.array([[1, 1]]), np.array([[-1, 1]]))
+    array([[-1.,  0.,  1.]])
+    """
+    nrows, sizea = coefsa.shape
+    sizeb = coefsb.shape[1]
+    result = np.zeros((nrows, sizea + sizeb - 1), dtype=np.float64)
+    for i in range(sizea):
+        result[:, i : i + sizeb] += coefsa[:, i : i + 1] * coefsb
+    return result
+
+
+def derivate_rows(coefs: np.ndarray) -> np.ndarray:
+    """
+    Derivates the polynomials line by line, keeping the shape
+
+    Example
+    -------
+    >>> derivate_rows(np.array([[1., 2., 3.]]))
+    array([[2., 6., 0.]])
+    """
+    result = np.zeros(coefs.shape, dtype=np.float64)
+    degrees = np.arange(1, coefs.shape[-1])
+    result[..., :-1] = degrees * coefs[..., 1:]
+    return result
+
+
+class JordanArrays:
+    """
+    Read-only view of a jordan curve, with the coefficients of each
+    segment in the local parameter u in [0, 1], stored in the array
+    ``coefs`` of shape (nsegments, degree+1, 2).
+
+    The knots follow the parametrization of the ``UPiecewiseCurve``:
+    the segment ``i`` is described for the parameter t in [i, i+1]
+
+    Example
+    -------
+    >>> from shapepy.geometry.factory import FactoryJordan
+    >>> jordan = FactoryJordan.polygon([(0, 0), (4, 0), (0, 3)])
+    >>> arrays = jordan.as_arrays()
+    >>> arrays.coefs.shape
+    (3, 2, 2)
+    >>> arrays.area()
+    6.0
+    """
+
+    def __init__(self, segments: Iterable):
+        lines = []
+        for segment in segments:
+            knota, knotb = segment.knots
+            if not Is.finite(knota) or not Is.finite(knotb):
+                raise ValueError(f"Segment not bounded: {segment.domain}")
+            lines.append(
+                tuple(
+                    tuple(
+                        coef * (knotb - knota) ** i
+                        for i, coef in enumerate(shift_coefs(func, -knota))
+                    )
+                    for func in (segment.xfunc, segment.yfunc)
+                )
+            )
+        degree = max(len(coefs) for line in lines for coefs in line) - 1
+        coefs = np.zeros((len(lines), degree + 1, 2), dtype=np.float64)
+        for i, line in enumerate(lines):
+            for j, values in enumerate(line):
+                coefs[i, : len(values), j] = tuple(map(float, values))
+        knots = np.arange(len(lines) + 1, dtype=np.float64)
+        coefs.flags.writeable = False
+        knots.flags.writeable = False
+        self.__coefs = coefs
+        self.__knots = knots
+
+    def __len__(self) -> int:
+        return self.__coefs.shape[0]
+
+    @property
+    def coefs(self) -> np.ndarray:
+        """
+        The coefficients of the segments, of shape (nsegs, degree+1, 2)
+        """
+        return self.__coefs
+
+    @property
+    def knots(self) -> np.ndarray:
+        """
+        The knots of the curve, of shape (nsegs+1, )
+        """
+        return self.__knots
+
+    @property
+    def degree(self) -> int:
+        """
+        The maximum degree of the segments
+        """
+        return self.__coefs.shape[1] - 1
+
+    def eval(self, nodes: Iterable[float], derivate: int = 0) -> np.ndarray:
+        """
+        Evaluates the curve at the given parameters, in [0, nsegs],
+        giving the array of points of shape (npts, 2)
+
+        Example
+        -------
+        >>> from shapepy.geometry.factory import FactoryJordan
+        >>> jordan = FactoryJordan.polygon([(0, 0), (4, 0), (0, 3)])
+        >>> jordan.as_arrays().eval([0, 0.5, 1.5])
+        array([[0. , 0. ],
+               [2. , 0. ],
+               [2. , 1.5]])
+        """
+        nodes = np.asarray(nodes, dtype=np.float64)
+        spans = np.clip(np.floor(nodes).astype(np.int64), 0, len(self) - 1)
+        params = nodes - spans
+        coefs = self.__coefs
+        for _ in range(derivate):
+            coefs = derivate_rows(coefs.transpose(0, 2, 1)).transpose(0, 2, 1)
+        coefs = coefs[spans]
+        results = np.zeros(nodes.shape + (2,), dtype=np.float64)
+        for k in range(self.degree, -1, -1):
+            results = results * params[..., None] + coefs[:, k]
+        return results
+
+    def boxes(self) -> np.ndarray:
+        """
+        Gives the array of shape (nsegs, 2, 2) with the lower and the
+        upper points of the box that encloses each segment.
+
+        The extremities are the ends of the segments and the points
+        where the derivative is zero, found at once for all segments.
+        The real parts of all the complex roots are used as candidates:
+        they are points of the curve, so the spurious ones never
+        enlarge the box, while no real root is lost by a tolerance
+        """
+        nsegs = len(self)
+        points = [self.__coefs[:, 0], self.__coefs.sum(axis=1)]
+        dcoefs = derivate_rows(self.__coefs.transpose(0, 2, 1))[:, :, :-1]
+        roots = PolynomialFunctions.companion_roots(
+            dcoefs.reshape(2 * nsegs, -1)
+        )
+        size = max(map(len, roots), default=0)
+        params = np.full((2 * nsegs, max(1, size)), np.nan)
+        for i, line in enumerate(roots):
+            params[i, : len(line)] = line.real
+        params[(params <= 0) | (params >= 1)] = np.nan
+        params = params.reshape(nsegs, 2, -1)
+        values = np.zeros(params.shape, dtype=np.float64)
+        for k in range(self.degree, -1, -1):
+            values = values * params + self.__coefs[:, k, :, None]
+        values = np.concatenate((np.stack(points, axis=2), values), axis=2)
+        return np.stack(
+            (np.nanmin(values, axis=2), np.nanmax(values, axis=2)), axis=1
+        )
+
+    def box(self) -> Box:
+        """
+        Gives the box that encloses all the curve
+        """
+        boxes = self.boxes()
+        lowpt = boxes[:, 0].min(axis=0)
+        toppt = boxes[:, 1].max(axis=0)
+        return Box(tuple(map(float, lowpt)), tuple(map(float, toppt)))
+
+    def moment(self, expx: int, expy: int) -> float:
+        """
+        Computes the integral over the area inside the curve
+
+        I = int_A x^expx * y^expy * dA
+
+        using the Green's theorem over all the segments at once
+        """
+        expx = To.integer(expx)
+        expy = To.integer(expy)
+        xcoefs = self.__coefs[:, :, 0]
+        ycoefs = self.__coefs[:, :, 1]
+        function = multiply_rows(xcoefs, derivate_rows(ycoefs))
+        function -= multiply_rows(ycoefs, derivate_rows(xcoefs))
+        for _ in range(expx):
+            function = multiply_rows(function, xcoefs)
+        for _ in range(expy):
+            function = multiply_rows(function, ycoefs)
+        weights = 1 / np.arange(1, function.shape[1] + 1)
+        return float(np.sum(function @ weights)) / (expx + expy + 2)
+
+    def area(self) -> float:
+        """
+        Computes the internal area of the curve.
+        If the curve is clockwise, then the area is negative
+        """
+        return self.moment(0, 0)
+
+    def tessellate(self, npts: int) -> np.ndarray:
+        """
+        Gives the array of shape (nsegs * npts, 2) with the points of
+        the polygon that approximates the curve, taking ``npts``
+        equally spaced parameters in each segment, without repeating
+        the end point of the segment
+        """
+        npts = To.integer(npts)
+        if npts < 1:
+            raise ValueError(f"npts must be positive, not {npts}")
+        params = np.arange(npts, dtype=np.float64) / npts
+        nodes = self.__knots[:-1, None] + params
+        return self.eval(nodes.ravel())
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"JordanArrays({len(self)} segments, degree {self.degree})"
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return str(self)
@@ -0,0 +1,168 @@
+"""
+Defines the BoundingTree class, a bounding volume hierarchy built over
+the boxes of the segments of a curve.
+
+The queries of points, boxes and pairs of curves visit only the
+segments whose boxes are near, instead of scanning all the segments
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from .box import Box
+from .point import Point2D
+
+
+class BoundingTree:
+    """
+    Bounding volume hierarchy of axis aligned boxes.
+
+    Each node keeps the box that encloses its children, and the leafs
+    keep at most ``leafsize`` boxes. The tree is built by splitting the
+    boxes at the median of the centers, along the largest direction.
+
+    The boxes are enlarged by ``Box.dx`` and ``Box.dy``, the same
+    tolerance used by ``Box.__contains__``
+
+    Example
+    -------
+    >>> boxes = [Box((0, 0), (1, 1)), Box((2, 0), (3, 1))]
+    >>> tree = BoundingTree(boxes)
+    >>> tuple(tree.query_point((2.5, 0.5)))
+    (1,)
+    """
+
+    leafsize = 4
+
+    def __init__(self, boxes: Iterable[Box]):
+        boxes = tuple(boxes)
+        lowpts = np.array(
+            [tuple(map(float, box.lowpt)) for box in boxes], dtype=np.float64
+        ).reshape(-1, 2)
+        toppts = np.array(
+            [tuple(map(float, box.toppt)) for box in boxes], dtype=np.float64
+        ).reshape(-1, 2)
+        margin = np.array((Box.dx, Box.dy), dtype=np.float64)
+        self.__lowpts = lowpts - margin
+        self.__toppts = toppts + margin
+        # Each node is (lowpt, toppt, children, isleaf), where children is
+        # the tuple of the boxes' indexs for a leaf, or the nodes' indexs
+        self.__nodes: List[Tuple[np.ndarray, np.ndarray, tuple, bool]] = []
+        if boxes:
+            self.__build(np.arange(len(boxes)))
+
+    def __len__(self) -> int:
+        return self.__lowpts.shape[0]
+
+    def __build(self, indexs: np.ndarray) -> int:
+        """Creates the node that encloses the boxes of given indexs,
+        returning the index of the created node"""
+        lowpt = self.__lowpts[indexs].min(axis=0)
+        toppt = self.__toppts[indexs].max(axis=0)
+        position = len(self.__nodes)
+        self.__nodes.append((lowpt, toppt, tuple(indexs.tolist()), True))
+        if len(indexs) <= self.leafsize:
+            return position
+        axis = int(np.argmax(toppt - lowpt))
+        centers = self.__lowpts[indexs, axis] + self.__toppts[indexs, axis]
+        order = indexs[np.argsort(centers, kind="stable")]
+        half = len(order) // 2
+        left = self.__build(order[:half])
+        right = self.__build(order[half:])
+        self.__nodes[position] = (lowpt, toppt, (left, right), False)
+        return position
+
+    @property
+    def lowpts(self) -> np.ndarray:
+        """
+        The lower points of the enlarged boxes, of shape (nboxes, 2)
+        """
+        return self.__lowpts
+
+    @property
+    def toppts(self) -> np.ndarray:
+        """
+        The upper points of the enlarged boxes, of shape (nboxes, 2)
+        """
+        return self.__toppts
+
+    @property
+    def nodes(self) -> Tuple[Tuple[np.ndarray, np.ndarray, tuple, bool]]:
+        """
+        The nodes of the tree, the first one is the root
+        """
+        return tuple(self.__nodes)
+
+    def query_box(
+        self, lowpt: Tuple[float, float], toppt: Tuple[float, float]
+    ) -> Iterator[int]:
+        """
+        Gives, in increasing order, the indexs of the boxes that
+        intersect the box [lowpt, toppt]. The coordinates can be infinite
+        """
+        lowpt = np.array(tuple(map(float, lowpt)), dtype=np.float64)
+        toppt = np.array(tuple(map(float, toppt)), dtype=np.float64)
+        result = []
+        stack = [0] if self.__nodes else []
+        while stack:
+            nodelow, nodetop, children, isleaf = self.__nodes[stack.pop()]
+            if np.any(nodetop < lowpt) or np.any(toppt < nodelow):
+                continue
+            if not isleaf:
+                stack.extend(children)
+                continue
+            children = list(children)
+            mask = np.all(self.__toppts[children] >= lowpt, axis=1)
+            mask &= np.all(self.__lowpts[children] <= toppt, axis=1)
+            result += [children[k] for k in np.flatnonzero(mask)]
+        return iter(sorted(result))
+
+    def query_point(self, point: Point2D, radius: float = 0) -> Iterator[int]:
+        """
+        Gives, in increasing order, the indexs of the boxes that
+        are at a distance smaller than ``radius`` from the point
+        """
+        xcoord, ycoord = map(float, point)
+        return self.query_box(
+            (xcoord - radius, ycoord - radius),
+            (xcoord + radius, ycoord + radius),
+        )
+
+    def query_tree(self, other: BoundingTree) -> Iterator[Tuple[int, int]]:
+        """
+        Gives the pairs (i, j) such the box i of this tree intersects
+        the box j of the other tree, traversing both trees together
+        """
+        othernodes = other.nodes
+        result = []
+        stack = [(0, 0)] if self.__nodes and othernodes else []
+        while stack:
+            nodei, nodej = stack.pop()
+            lowi, topi, childi, leafi = self.__nodes[nodei]
+            lowj, topj, childj, leafj = othernodes[nodej]
+            if np.any(topi < lowj) or np.any(topj < lowi):
+                continue
+            if leafi and leafj:
+                result += self.__leaf_pairs(other, childi, childj)
+            elif leafj or (
+                not leafi and np.prod(topi - lowi) >= np.prod(topj - lowj)
+            ):
+                stack.extend((child, nodej) for child in childi)
+            else:
+                stack.extend((nodei, child) for child in childj)
+        return iter(sorted(result))
+
+    def __leaf_pairs(
+        self, other: BoundingTree, indexsi: tuple, indexsj: tuple
+    ) -> List[Tuple[int, int]]:
+        """Gives the pairs of boxes of two leafs that intersect"""
+        lowi = self.__lowpts[list(indexsi)]
+        topi = self.__toppts[list(indexsi)]
+        lowj = other.lowpts[list(indexsj)]
+        topj = other.toppts[list(indexsj)]
+        mask = np.all(lowi[:, None] <= topj[None, :], axis=2)
+        mask &= np.all(lowj[None, :] <= topi[:, None], axis=2)
+        return [(indexsi[i], indexsj[j]) for i, j in zip(*np.nonzero(mask))]
@@ -0,0 +1,259 @@
+"""
+Defines the functions to intersect two bezier curves by the bezier
+clipping method: the fat line of one curve clips the parameter's
+interval of the other curve, using the convex hull property.
+When the clipping doesn't reduce enough the interval, the curve
+is subdivided at the middle.
+
+It works only with the control points, as float numpy arrays,
+in the local parameter u in [0, 1]
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..analytic.bezier import polynomial2bezier
+from ..analytic.polynomial import shift_coefs
+from .segment import Segment
+
+
+def control_points(segment: Segment) -> np.ndarray:
+    """
+    Gives the control points of the segment, in the local parameter,
+    as an array of shape (degree+1, 2)
+    """
+    knota, knotb = segment.knots
+    degree = max(segment.xfunc.degree, segment.yfunc.degree)
+    ctrlpoints = np.zeros((degree + 1, 2), dtype=np.float64)
+    for j, func in enumerate((segment.xfunc, segment.yfunc)):
+        coefs = [0] * (degree + 1)
+        for i, coef in enumerate(shift_coefs(func, -knota)):
+            coefs[i] = coef * (knotb - knota) ** i
+        ctrlpoints[:, j] = tuple(map(float, polynomial2bezier(coefs)))
+    return ctrlpoints
+
+
+def split_points(
+    ctrlpoints: np.ndarray, param: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Subdivides the control points at the parameter by the de Casteljau's
+    algorithm, giving the control points of the left and the right parts
+    """
+    points = ctrlpoints
+    left = [points[0]]
+    right = [points[-1]]
+    for _ in range(len(ctrlpoints) - 1):
+        points = (1 - param) * points[:-1] + param * points[1:]
+        left.append(points[0])
+        right.append(points[-1])
+    return np.array(left), np.array(right[::-1])
+
+
+def section_points(
+    ctrlpoints: np.ndarray, parama: float, paramb: float
+) -> np.ndarray:
+    """
+    Gives the control points of the part of the curve in [parama, paramb]
+    """
+    if paramb < 1:
+        ctrlpoints, _ = split_points(ctrlpoints, paramb)
+    if parama > 0:
+        _, ctrlpoints = split_points(ctrlpoints, parama / paramb)
+    return ctrlpoints
+
+
+def fat_line_clip(
+    ctrlpoints: np.ndarray, others: np.ndarray, tolerance: float = 0
+) -> Optional[Tuple[float, float]]:
+    """
+    Gives the interval [tmin, tmax] of the curve ``others`` that can be
+    inside the fat line of the curve ``ctrlpoints``, or None if the
+    curves cannot intersect.
+
+    The fat line is the strip, parallel to the line that connects the
+    extremities, which contains all the control points. The distances of
+    the other control points to this line are the bezier coefficients
+    of a function, whose convex hull bounds the interval.
+    The strip is enlarged by ``tolerance`` at both sides
+    """
+    direction = ctrlpoints[-1] - ctrlpoints[0]
+    if not np.any(direction):  # Closed curve, uses the farthest point
+        deltas = ctrlpoints - ctrlpoints[0]
+        direction = deltas[np.argmax(np.hypot(deltas[:, 0], deltas[:, 1]))]
+    norm = np.hypot(*direction)
+    if norm == 0:
+        return 0.0, 1.0
+    normal = np.array((-direction[1], direction[0])) / norm
+    dists = (ctrlpoints - ctrlpoints[0]) @ normal
+    dmin, dmax = np.min(dists) - tolerance, np.max(dists) + tolerance
+    values = (others - ctrlpoints[0]) @ normal
+    params = np.linspace(0, 1, len(values))
+    inside = (dmin <= values) & (values <= dmax)
+    candidates = list(params[inside])
+    candidates += hull_crossings(params, values, (dmin, dmax))
+    if not candidates:
+        return None
+    return float(min(candidates)), float(max(candidates))
+
+
+def hull_crossings(
+    params: np.ndarray, values: np.ndarray, levels: Tuple[float, ...]
+) -> List[float]:
+    """
+    Gives the parameters where the segments that connect each pair of
+    points (params[i], values[i]) cross the horizontal levels.
+    The extremal values bound the crossings of the convex hull
+    """
+    result = []
+    for i, (parami, valuei) in enumerate(zip(params, values)):
+        for paramj, valuej in zip(params[i + 1 :], values[i + 1 :]):
+            if valuei == valuej:
+                continue
+            for level in levels:
+                ratio = (level - valuei) / (valuej - valuei)
+                if 0 <= ratio <= 1:
+                    result.append(parami + ratio * (paramj - parami))
+    return result
+
+
+def boxes_overlap(
+    pointsa: np.ndarray, pointsb: np.ndarray, tolerance: float
+) -> bool:
+    """Tells if the boxes of the control points overlap"""
+    lowa, topa = np.min(pointsa, axis=0), np.max(pointsa, axis=0)
+    lowb, topb = np.min(pointsb, axis=0), np.max(pointsb, axis=0)
+    return bool(
+        np.all(lowa <= topb + tolerance) and np.all(lowb <= topa + tolerance)
+    )
+
+
+# pylint: disable=too-many-locals
+def bezier_clipping(
+    pointsa: np.ndarray,
+    pointsb: np.ndarray,
+    tolerance: float = 1e-9,
+    budget: int = 1024,
+) -> Optional[List[Tuple[float, float]]]:
+    """
+    Finds the pairs (u, v) in [0, 1] x [0, 1] such A(u) = B(v).
+
+    Each pair of sub-curves is clipped by the fat line of the other
+    curve, which converges quadratically at the transversal
+    intersections. If the interval is not reduced by 20%, the curve
+    with the largest interval is subdivided at the middle.
+
+    Gives None if more than ``budget`` pairs of sub-curves are visited,
+    which happens when the curves overlap or are tangent
+
+    Example
+    -------
+    >>> pointsa = np.array([[0, 0], [1, 2], [2, 0]], dtype=float)
+    >>> pointsb = np.array([[0, 0.5], [2, 0.5]], dtype=float)
+    >>> pairs = bezier_clipping(pointsa, pointsb)
+    >>> [(round(u, 6), round(v, 6)) for u, v in pairs]
+    [(0.146447, 0.146447), (0.853553, 0.853553)]
+    """
+    scale = max(1, np.max(np.abs(pointsa)), np.max(np.abs(pointsb)))
+    results = []
+    stack = [(pointsa, pointsb, (0.0, 1.0), (0.0, 1.0))]
+    while stack:
+        budget -= 1
+        if budget < 0:
+            return None
+        ptsa, ptsb, (ua0, ua1), (vb0, vb1) = stack.pop()
+        if not boxes_overlap(ptsa, ptsb, tolerance * scale):
+            continue
+        if (ua1 - ua0 < tolerance and vb1 - vb0 < tolerance) or (
+            np.ptp(ptsa, axis=0).max() < tolerance * scale
+            and np.ptp(ptsb, axis=0).max() < tolerance * scale
+        ):
+            results.append(((ua0 + ua1) / 2, (vb0 + vb1) / 2))
+            continue
+        clipped = fat_line_clip(ptsa, ptsb, 1e-12 * scale)
+        if clipped is None:
+            continue
+        tmin, tmax = clipped
+        ptsb = section_points(ptsb, tmin, tmax)
+        vb0, vb1 = vb0 + tmin * (vb1 - vb0), vb0 + tmax * (vb1 - vb0)
+        clipped = fat_line_clip(ptsb, ptsa, 1e-12 * scale)
+        if clipped is None:
+            continue
+        smin, smax = clipped
+        ptsa = section_points(ptsa, smin, smax)
+        ua0, ua1 = ua0 + smin * (ua1 - ua0), ua0 + smax * (ua1 - ua0)
+        if (tmax - tmin) * (smax - smin) < 0.64:
+            stack.append((ptsa, ptsb, (ua0, ua1), (vb0, vb1)))
+        elif ua1 - ua0 >= vb1 - vb0:
+            lefta, righta = split_points(ptsa, 0.5)
+            umid = (ua0 + ua1) / 2
+            stack.append((lefta, ptsb, (ua0, umid), (vb0, vb1)))
+            stack.append((righta, ptsb, (umid, ua1), (vb0, vb1)))
+        else:
+            leftb, rightb = split_points(ptsb, 0.5)
+            vmid = (vb0 + vb1) / 2
+            stack.append((ptsa, leftb, (ua0, ua1), (vb0, vmid)))
+            stack.append((ptsa, rightb, (ua0, ua1), (vmid, vb1)))
+    pairs = merge_pairs(results, 1e-6)
+    return [polish_pair(pointsa, pointsb, pair) for pair in pairs]
+
+
+def eval_points(ctrlpoints: np.ndarray, param: float) -> np.ndarray:
+    """Evaluates the bezier curve and its derivative at the parameter,
+    giving the array [point, derivative]"""
+    points = ctrlpoints
+    while len(points) > 2:
+        points = (1 - param) * points[:-1] + param * points[1:]
+    if len(points) == 1:
+        return np.array([points[0], 0 * points[0]])
+    point = (1 - param) * points[0] + param * points[1]
+    return np.array([point, (len(ctrlpoints) - 1) * (points[1] - points[0])])
+
+
+def polish_pair(
+    pointsa: np.ndarray, pointsb: np.ndarray, pair: Tuple[float, float]
+) -> Tuple[float, float]:
+    """Improves the pair (u, v) such A(u) = B(v) by Newton's iterations,
+    keeping the pair if the jacobian is singular, like at tangent points"""
+    param, other = pair
+    for _ in range(3):
+        pointa, deriva = eval_points(pointsa, param)
+        pointb, derivb = eval_points(pointsb, other)
+        delta = pointb - pointa
+        deter = derivb[0] * deriva[1] - derivb[1] * deriva[0]
+        scale = np.hypot(*deriva) * np.hypot(*derivb)
+        if abs(deter) <= 1e-6 * scale:
+            break
+        newparam = (
+            param + (derivb[0] * delta[1] - derivb[1] * delta[0]) / deter
+        )
+        newother = (
+            other + (deriva[0] * delta[1] - deriva[1] * delta[0]) / deter
+        )
+        param = min(1.0, max(0.0, float(newparam)))
+        other = min(1.0, max(0.0, float(newother)))
+    return param, other
+
+
+def merge_pairs(
+    pairs: List[Tuple[float, float]], tolerance: float
+) -> List[Tuple[float, float]]:
+    """
+    Merges the pairs (u, v) whose parameters are closer than tolerance,
+    sorting them by u, and gives the average of each group
+    """
+    groups: List[List[Tuple[float, float]]] = []
+    for pair in sorted(pairs):
+        for group in groups[::-1]:
+            if pair[0] - group[-1][0] >= tolerance:
+                groups.append([pair])
+                break
+            if abs(pair[1] - group[-1][1]) < tolerance:
+                group.append(pair)
+                break
+        else:
+            groups.append([pair])
+    return [tuple(np.mean(group, axis=0)) for group in groups]
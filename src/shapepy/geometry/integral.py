@@ -4,11 +4,13 @@ Contains functions to integrate over a segment
 
 from __future__ import annotations
 
+import math
 from functools import partial
 
 from ..analytic.base import IAnalytic
-from ..analytic.tools import find_minimum
+from ..analytic.tools import find_minimum, find_roots, is_constant
 from ..loggers import debug, get_logger
+from ..rbool import extract_knots
 from ..scalar.quadrature import AdaptativeIntegrator, IntegratorFactory
 from ..scalar.reals import Math
 from ..tools import Is, To
@@ -72,6 +74,41 @@ class IntegrateSegment:
         radians = IntegrateSegment.adaptative.integrate(function, curve.domain)
         return radians / Math.tau
 
+    @staticmethod
+    def crossings(curve: Segment, point: Point2D) -> int:
+        """
+        Counts the signed crossings of the curve with the horizontal
+        ray that starts at the point and goes towards +x.
+
+        The upward crossings count +1 and the downward count -1.
+        The ray is lifted by 1e-9, which doesn't change the region of
+        the points that are away from the curve, but avoids counting
+        twice a crossing at a vertex, where the ends of the consecutive
+        segments may differ by rounding errors
+        """
+        point = To.point(point)
+        height = point.ycoord + To.rational(1, 10**9)
+        box = curve.box()
+        if (
+            point.xcoord > box.toppt.xcoord
+            or height < box.lowpt.ycoord
+            or height > box.toppt.ycoord
+        ):
+            return 0
+        deltay: IAnalytic = curve.yfunc - height
+        if is_constant(deltay):
+            return 0
+        roots = sorted(set(extract_knots(find_roots(deltay, curve.domain))))
+        nodes = [curve.knots[0]] + roots + [curve.knots[-1]]
+        middles = ((na + nb) / 2 for na, nb in zip(nodes, nodes[1:]))
+        above = [deltay(node) > 0 for node in middles]
+        result = 0
+        for i, root in enumerate(roots):
+            before, after = above[i], above[i + 1]
+            if before != after and curve.xfunc(root) > point.xcoord:
+                result += 1 if after else -1
+        return result
+
 
 class IntegrateJordan:
     """
@@ -105,15 +142,27 @@ class IntegrateJordan:
         u = jordan.x - point.x
         v = jordan.y - point.y
 
-        This function should return values other than
-        [-1, -0.5, 0, 0.5, 1]
-        It happens when the functions is discontinuous
+        The result is the winding number of the curve around the point,
+        counted by the crossings of the curve with an horizontal ray.
+        If the point is on the curve, gives 0.5 or -0.5
         """
-        result = 0
-        for usegment in jordan:
-            seg = usegment.parametrize()
-            delta_result = IntegrateSegment.turns(seg, point)
-            if delta_result == 0.5:
-                return 0.5 if jordan.area > 0 else -0.5
-            result += delta_result
-        return result
+        point = To.point(point)
+        segments = tuple(usegment.parametrize() for usegment in jordan)
+        tree = jordan.bvh()
+        for i in tree.query_point(point, 1e-3):
+            if IntegrateJordan.__touches(segments[i], point):
+                half = To.rational(1, 2)
+                return half if jordan.area > 0 else -half
+        indexs = tree.query_box(point, (math.inf, point.ycoord))
+        return sum(
+            IntegrateSegment.crossings(segments[i], point) for i in indexs
+        )
+
+    @staticmethod
+    def __touches(segment: Segment, point: Point2D) -> bool:
+        """Tells if the distance between the point and the segment
+        is smaller than 1e-3"""
+        deltax: IAnalytic = segment.xfunc - point.xcoord
+        deltay: IAnalytic = segment.yfunc - point.ycoord
+        radius_square = deltax * deltax + deltay * deltay
+        return find_minimum(radius_square, segment.domain) < 1e-6
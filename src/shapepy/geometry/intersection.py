@@ -11,9 +11,25 @@ Also defines methods to find the intersection points
 from __future__ import annotations
 
 import math
-from fractions import Fraction
-from typing import Dict, Iterable, Set, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from copy import copy
+from functools import lru_cache
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
+from ..analytic.polynomial import Polynomial
+from ..analytic.tools import find_roots, is_constant
 from ..loggers import debug, get_logger
 from ..rbool import (
     EmptyR1,
@@ -23,10 +39,12 @@ from ..rbool import (
     extract_knots,
     from_any,
 )
-from ..scalar.nodes_sample import NodeSampleFactory
-from ..scalar.reals import Real
-from ..tools import Is
+from ..scalar.reals import Backend, Real
+from ..tools import Is, To
+from .arrays import JordanArrays
 from .base import IGeometricCurve, IParametrizedCurve
+from .box import Box
+from .clipping import bezier_clipping, control_points
 from .piecewise import PiecewiseCurve
 from .point import cross, inner
 from .segment import Segment
@@ -49,12 +67,17 @@ class GeometricIntersectionCurves:
     a heavy tank when requested
 
     It stores inside 'curves' the a
+
+    The pairs of segments are intersected in the current process,
+    unless ``executor`` is a number of worker processes or an instance
+    of ``concurrent.futures.Executor``, used only by this instance
     """
 
     def __init__(
         self,
         curves: Iterable[IGeometricCurve],
         pairs: Union[None, Iterable[Tuple[int, int]]] = None,
+        executor: Union[None, int, Executor] = None,
     ):
         curves = tuple(curves)
         if not all(Is.instance(curve, IGeometricCurve) for curve in curves):
@@ -69,6 +92,7 @@ class GeometricIntersectionCurves:
             pairs = set(map(tuple, pairs))
         self.__pairs = pairs
         self.__curves = curves
+        self.executor = executor
         self.__all_knots = None
         self.__all_subsets = None
 
@@ -144,6 +168,9 @@ class GeometricIntersectionCurves:
     def evaluate(self):
         """
         Computes the intersection between all the curves
+
+        The pairs of segments whose boxes overlap are found at once by
+        ``sweep_and_prune``, then only these pairs are intersected
         """
         self.__all_knots = {}
         self.__all_subsets = {}
@@ -151,31 +178,80 @@ class GeometricIntersectionCurves:
             knots = curve.parametrize().knots
             self.__all_knots[id(curve)] = set(knots)
             self.__all_subsets[id(curve)] = EmptyR1()
-        for i, j in self.pairs:
-            self.__evaluate_two(self.curves[i], self.curves[j])
+        curves, pairs = self.__unique_pairs()
+        segments = [
+            (curve, segment)
+            for curve in curves
+            for segment in split_segments(curve.parametrize())
+        ]
+        boxes = (segment.box() for _, segment in segments)
+        candidates = [
+            (segments[k], segments[m])
+            for k, m in sweep_and_prune(boxes)
+            if frozenset((id(segments[k][0]), id(segments[m][0]))) in pairs
+        ]
+        results = intersect_many(
+            ((sega, segb) for (_, sega), (_, segb) in candidates),
+            self.executor,
+        )
+        for ((curvea, _), (curveb, _)), subsets in zip(candidates, results):
+            self.__add_subsets(curvea, curveb, *subsets)
 
-    def __evaluate_two(self, curvea: IGeometricCurve, curveb: IGeometricCurve):
-        """
-        Private function two compute the intersection between two curves
-        """
-        subseta, subsetb = self.__compute_two(curvea, curveb)
+    def __unique_pairs(
+        self,
+    ) -> Tuple[Tuple[IGeometricCurve, ...], Set[frozenset]]:
+        """Gives the curves without repetition and the pairs of their ids
+        that must be intersected. The curves paired with themselves are
+        evaluated directly"""
+        unique = {}
+        pairs = set()
+        for i, j in self.pairs:
+            curvea, curveb = self.curves[i], self.curves[j]
+            if id(curvea) == id(curveb):
+                self.__evaluate_same(curvea)
+                continue
+            unique.setdefault(id(curvea), curvea)
+            unique.setdefault(id(curveb), curveb)
+            pairs.add(frozenset((id(curvea), id(curveb))))
+        return tuple(unique.values()), pairs
+
+    def __evaluate_same(self, curve: IGeometricCurve):
+        """Adds the intersection of the curve with itself"""
+        param = curve.parametrize()
+        subset = create_interval(param.knots[0], param.knots[-1])
+        self.__add_subsets(curve, curve, subset, subset)
+
+    def __add_subsets(
+        self,
+        curvea: IGeometricCurve,
+        curveb: IGeometricCurve,
+        subseta: SubSetR1,
+        subsetb: SubSetR1,
+    ):
+        """Stores the subsets of the parameters shared by two curves"""
         if Is.instance(subseta, EmptyR1):
             return
         self.all_subsets[id(curvea)] |= subseta
-        self.all_knots[id(curvea)] |= set(extract_knots(subseta))
+        self.__add_knots(curvea, extract_knots(subseta))
         self.all_subsets[id(curveb)] |= subsetb
-        self.all_knots[id(curveb)] |= set(extract_knots(subsetb))
+        self.__add_knots(curveb, extract_knots(subsetb))
 
-    def __compute_two(
-        self, curvea: IGeometricCurve, curveb: IGeometricCurve
-    ) -> Tuple[SubSetR1, SubSetR1]:
-        if curvea.box() & curveb.box() is None:
-            return EmptyR1(), EmptyR1()
-        if id(curvea) == id(curveb):  # Check if curves are equal
-            curvea = curvea.parametrize()
-            subset = create_interval(curvea.knots[0], curvea.knots[-1])
-            return subset, subset
-        return curve_and_curve(curvea, curveb)
+    def __add_knots(self, curve: IGeometricCurve, knots: Iterable[Real]):
+        """Stores the knots in which the curve must be split.
+
+        With the float backend, a knot closer than ``tol_du`` to a stored
+        knot is the same point with round-off errors, and it's dropped
+        """
+        stored = self.all_knots[id(curve)]
+        if not Backend.floats:
+            stored.update(knots)
+            return
+        param = curve.parametrize()
+        width = param.knots[-1] - param.knots[0]
+        tolerance = IntersectionSegments.tol_du * width
+        for knot in knots:
+            if all(abs(knot - other) > tolerance for other in stored):
+                stored.add(knot)
 
     def __or__(
         self, other: GeometricIntersectionCurves
@@ -188,12 +264,56 @@ class GeometricIntersectionCurves:
         for i in range(len(self.curves)):
             for j in range(len(other.curves)):
                 newparis.append((i, n + j))
-        return GeometricIntersectionCurves(newcurves, newparis)
+        return GeometricIntersectionCurves(
+            newcurves, newparis, self.executor or other.executor
+        )
 
     def __bool__(self):
         return all(v == EmptyR1() for v in self.all_subsets.values())
 
 
+def split_segments(curve: IParametrizedCurve) -> Tuple[Segment, ...]:
+    """Gives the segments of the parametrized curve"""
+    if Is.instance(curve, PiecewiseCurve):
+        return tuple(curve)
+    return (curve,)
+
+
+def sweep_and_prune(boxes: Iterable[Box]) -> Iterator[Tuple[int, int]]:
+    """
+    Gives the pairs (i, j), with i < j, of the boxes that overlap.
+
+    The boxes are sorted by their lower x value, then each box is swept
+    only against the next boxes that start before its upper x value.
+    The boxes are enlarged by ``Box.dx`` and ``Box.dy``
+
+    Example
+    -------
+    >>> boxes = [Box((0, 0), (2, 2)), Box((5, 0), (6, 1)), Box((1, 1), (3, 3))]
+    >>> tuple(sweep_and_prune(boxes))
+    ((0, 2),)
+    """
+    coords = np.array(
+        [
+            tuple(map(float, box.lowpt)) + tuple(map(float, box.toppt))
+            for box in boxes
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+    coords -= (Box.dx, Box.dy, -Box.dx, -Box.dy)
+    order = np.argsort(coords[:, 0], kind="stable")
+    coords = coords[order]
+    ends = np.searchsorted(coords[:, 0], coords[:, 2], side="right")
+    result: List[Tuple[int, int]] = []
+    for k, end in enumerate(ends):
+        others = coords[k + 1 : end]
+        mask = (others[:, 1] <= coords[k, 3]) & (coords[k, 1] <= others[:, 3])
+        for m in order[k + 1 + np.flatnonzero(mask)]:
+            i, j = int(order[k]), int(m)
+            result.append((i, j) if i < j else (j, i))
+    return iter(sorted(result))
+
+
 def curve_and_curve(
     curvea: IGeometricCurve, curveb: IGeometricCurve
 ) -> Tuple[SubSetR1, SubSetR1]:
@@ -210,9 +330,16 @@ def param_and_param(
     if curvea.box() & curveb.box() is None:
         return EmptyR1(), EmptyR1()
     if Is.instance(curvea, PiecewiseCurve):
+        if Is.instance(curveb, PiecewiseCurve):
+            pairs = curvea.bvh().query_tree(curveb.bvh())
+        else:
+            box = curveb.box()
+            indexs = curvea.bvh().query_box(box.lowpt, box.toppt)
+            pairs = ((i, None) for i in indexs)
         subseta, subsetb = EmptyR1(), EmptyR1()
-        for segmenta in curvea:
-            subb, suba = param_and_param(segmenta, curveb)
+        for i, j in pairs:
+            segmentb = curveb if j is None else curveb[j]
+            suba, subb = segment_and_segment(curvea[i], segmentb)
             subseta |= suba
             subsetb |= subb
         return subseta, subsetb
@@ -227,48 +354,306 @@ def segment_is_linear(segment: Segment) -> bool:
     return segment.xfunc.degree <= 1 and segment.yfunc.degree <= 1
 
 
+def segment_is_rational(segment: Segment) -> bool:
+    """Tells if the knots and the coefficients of the segment are
+    rationals, such its intersection parameters should be exact"""
+    values = tuple(segment.knots) + tuple(segment.xfunc) + tuple(segment.yfunc)
+    return not Backend.floats and all(map(Is.rational, values))
+
+
+class SegmentKey:
+    """
+    Hashable key of a segment, given by its content: the coefficients
+    of the functions x(t) and y(t), and the knots.
+
+    Two segments with the same content give equal keys, even if
+    they are different objects
+    """
+
+    def __init__(self, segment: Segment):
+        self.segment = segment
+        self.fingerprint = (
+            tuple(segment.xfunc),
+            tuple(segment.yfunc),
+            tuple(segment.knots),
+        )
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other: object) -> bool:
+        if not Is.instance(other, SegmentKey):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the IntersectionCache, like ``lru_cache``"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class IntersectionCache:
+    """
+    Keeps the last intersections between pairs of segments, by the
+    content of both segments, by the numeric backend and by the method
+    ``IntersectionSegments.method`` used to compute them, such changing
+    the method or the backend never gives a stale result.
+
+    The least recently used results are discarded when there are more
+    than ``maxsize`` of them. The results computed elsewhere, like by
+    worker processes, are inserted by ``store``
+
+    Example
+    -------
+    >>> from shapepy.geometry.factory import FactorySegment
+    >>> cache = IntersectionCache()
+    >>> sega = FactorySegment.bezier([(0, 0), (2, 2)])
+    >>> segb = FactorySegment.bezier([(0, 2), (2, 0)])
+    >>> cache(SegmentKey(sega), SegmentKey(segb))
+    (SingleR1(0.5), SingleR1(0.5))
+    >>> cache.cache_info()
+    CacheInfo(hits=0, misses=1, maxsize=4096, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.__maxsize = maxsize
+        self.__results: OrderedDict = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def key(keya: SegmentKey, keyb: SegmentKey) -> tuple:
+        """Gives the key of the results of the pair of segments"""
+        return (keya, keyb, IntersectionSegments.method, Backend.floats)
+
+    def lookup(
+        self, keya: SegmentKey, keyb: SegmentKey
+    ) -> Union[None, Tuple[SubSetR1, SubSetR1]]:
+        """Gives the stored intersection of the segments, or None"""
+        key = IntersectionCache.key(keya, keyb)
+        result = self.__results.get(key, None)
+        if result is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__results.move_to_end(key)
+        return tuple(map(copy, result))
+
+    def store(
+        self,
+        keya: SegmentKey,
+        keyb: SegmentKey,
+        result: Tuple[SubSetR1, SubSetR1],
+    ):
+        """Stores the intersection of the segments"""
+        self.__results[IntersectionCache.key(keya, keyb)] = tuple(result)
+        while len(self.__results) > self.__maxsize:
+            self.__results.popitem(last=False)
+
+    def __call__(
+        self, keya: SegmentKey, keyb: SegmentKey
+    ) -> Tuple[SubSetR1, SubSetR1]:
+        """Computes the intersection between the segments of the keys,
+        or gives a copy of the stored result"""
+        result = self.lookup(keya, keyb)
+        if result is None:
+            result = solve_segments(keya.segment, keyb.segment)
+            self.store(keya, keyb, result)
+            result = tuple(map(copy, result))
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Gives the statistics of the cache"""
+        return CacheInfo(
+            self.__hits, self.__misses, self.__maxsize, len(self.__results)
+        )
+
+    def cache_clear(self):
+        """Removes all the results and resets the statistics"""
+        self.__results.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
+cached_intersection = IntersectionCache()
+
+
+def ordered_keys(
+    curvea: Segment, curveb: Segment
+) -> Tuple[SegmentKey, SegmentKey, bool]:
+    """Gives the keys of the segments in the order of their fingerprints,
+    such the pairs (A, B) and (B, A) share the same cached result, and
+    tells if they were swapped"""
+    keya, keyb = SegmentKey(curvea), SegmentKey(curveb)
+    if keyb.fingerprint < keya.fingerprint:
+        return keyb, keya, True
+    return keya, keyb, False
+
+
+def fingerprint_segment(fingerprint: Tuple[tuple, tuple, tuple]) -> Segment:
+    """Creates the segment from the fingerprint of a SegmentKey"""
+    xcoefs, ycoefs, (knota, knotb) = fingerprint
+    return Segment(
+        Polynomial(xcoefs),
+        Polynomial(ycoefs),
+        domain=create_interval(knota, knotb),
+    )
+
+
+def fingerprints_intersection(
+    fingerprinta: Tuple[tuple, tuple, tuple],
+    fingerprintb: Tuple[tuple, tuple, tuple],
+    method: str,
+) -> Tuple[SubSetR1, SubSetR1]:
+    """Computes the intersection between the segments given by their
+    fingerprints. It's called by the worker processes, which receive
+    only the coefficients and knots of the segments, and the method
+    of the main process"""
+    IntersectionSegments.method = method
+    curvea = fingerprint_segment(fingerprinta)
+    curveb = fingerprint_segment(fingerprintb)
+    return solve_segments(curvea, curveb)
+
+
+@lru_cache(maxsize=None)
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """Gives the pool with the given number of worker processes.
+    It's created only once and reused by the next evaluations, since
+    starting the processes costs more than most of the intersections"""
+    return ProcessPoolExecutor(workers)
+
+
+def intersect_many(
+    pairs: Iterable[Tuple[Segment, Segment]],
+    executor: Union[None, int, Executor] = None,
+) -> List[Tuple[SubSetR1, SubSetR1]]:
+    """Computes the intersection of each pair of segments.
+
+    If ``executor`` is None, the pairs are computed in this process.
+    If it's an integer, the pool with this number of processes given by
+    ``process_pool`` is used. Else, it must be a
+    ``concurrent.futures.Executor``, that receives the fingerprints of
+    the segments, which can be pickled.
+    Only the pairs that are not in the cache are sent to the executor,
+    and their results are stored in the cache
+    """
+    pairs = tuple(pairs)
+    if executor is None or not pairs:
+        return [segment_and_segment(sega, segb) for sega, segb in pairs]
+    if Is.integer(executor):
+        executor = process_pool(executor)
+    keys = tuple(ordered_keys(sega, segb) for sega, segb in pairs)
+    results = [
+        cached_intersection.lookup(keya, keyb) for keya, keyb, _ in keys
+    ]
+    missing = [i for i, result in enumerate(results) if result is None]
+    computed = executor.map(
+        fingerprints_intersection,
+        [keys[i][0].fingerprint for i in missing],
+        [keys[i][1].fingerprint for i in missing],
+        [IntersectionSegments.method] * len(missing),
+        chunksize=16,
+    )
+    for i, result in zip(missing, computed):
+        cached_intersection.store(keys[i][0], keys[i][1], result)
+        results[i] = result
+    return [
+        result[::-1] if swapped else result
+        for (_, _, swapped), result in zip(keys, results)
+    ]
+
+
 def segment_and_segment(
     curvea: Segment, curveb: Segment
 ) -> Tuple[SubSetR1, SubSetR1]:
-    """Computes the intersection between two segment curves"""
+    """Computes the intersection between two segment curves
+
+    The results are cached by the content of both segments, such the
+    pairs (A, B) and (B, A) are solved only once
+    """
     assert Is.instance(curvea, Segment)
     assert Is.instance(curveb, Segment)
+    keya, keyb, swapped = ordered_keys(curvea, curveb)
+    result = cached_intersection(keya, keyb)
+    return result[::-1] if swapped else result
+
+
+def solve_segments(
+    curvea: Segment, curveb: Segment
+) -> Tuple[SubSetR1, SubSetR1]:
+    """Computes the intersection between two segment curves,
+    without using the cache"""
     if curvea == curveb:
         return curvea.domain, curveb.domain
+    if curvea.box() & curveb.box() is None:
+        return EmptyR1(), EmptyR1()
     if segment_is_linear(curvea) and segment_is_linear(curveb):
         return IntersectionSegments.lines(curvea, curveb)
-    nptsa = max(curvea.xfunc.degree, curvea.yfunc.degree) + 4
-    nptsb = max(curveb.xfunc.degree, curveb.yfunc.degree) + 4
-    usample = [
-        curvea.knots[0] + u * (curvea.knots[-1] - curvea.knots[0])
-        for u in NodeSampleFactory.closed_linspace(nptsa)
-    ]
-    vsample = [
-        curveb.knots[0] + u * (curveb.knots[-1] - curveb.knots[0])
-        for u in NodeSampleFactory.closed_linspace(nptsb)
-    ]
-    pairs = []
-    for ui in usample:
-        pairs += [(ui, vj) for vj in vsample]
-    for _ in range(3):
-        pairs = IntersectionSegments.bezier_and_bezier(curvea, curveb, pairs)
-        pairs.insert(0, (curvea.knots[0], curveb.knots[0]))
-        pairs.insert(0, (curvea.knots[0], curveb.knots[-1]))
-        pairs.insert(0, (curvea.knots[-1], curveb.knots[0]))
-        pairs.insert(0, (curvea.knots[-1], curveb.knots[-1]))
-        # Filter values by distance of points
-        tol_norm = 1e-6
-        pairs = IntersectionSegments.filter_distance(
-            curvea, curveb, pairs, tol_norm
-        )
-        # Filter values by distance abs(ui-uj, vi-vj)
-        tol_du = 1e-6
-        pairs = IntersectionSegments.filter_parameters(pairs, tol_du)
+    pairs = None
+    if max(curvea.degree, curveb.degree) <= 2:
+        pairs = IntersectionSegments.implicit(curvea, curveb)
+    if pairs is None and IntersectionSegments.method == "clipping":
+        pairs = IntersectionSegments.clipping(curvea, curveb)
+    if pairs is None:
+        pairs = IntersectionSegments.newton(curvea, curveb)
     subseta = from_any({pair[0] for pair in pairs})
     subsetb = from_any({pair[1] for pair in pairs})
     return subseta, subsetb
 
 
+def newton_step(
+    arraysa: JordanArrays, arraysb: JordanArrays, params: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the newton's steps that minimize the distance between the
+    points A(u) and B(v), for all the pairs (u, v) of the array at once.
+
+    Gives the steps of shape (npairs, 2) and the mask of the pairs
+    whose hessian is not singular
+    """
+    pointsa = [arraysa.eval(params[:, 0], i) for i in range(3)]
+    pointsb = [arraysb.eval(params[:, 1], i) for i in range(3)]
+    diff = pointsa[0] - pointsb[0]
+    vect0 = np.einsum("ij,ij->i", pointsa[1], diff)
+    vect1 = -np.einsum("ij,ij->i", pointsb[1], diff)
+    mat00 = np.einsum("ij,ij->i", pointsa[1], pointsa[1])
+    mat00 += np.einsum("ij,ij->i", pointsa[2], diff)
+    mat01 = -np.einsum("ij,ij->i", pointsa[1], pointsb[1])
+    mat11 = np.einsum("ij,ij->i", pointsb[1], pointsb[1])
+    mat11 -= np.einsum("ij,ij->i", pointsb[2], diff)
+    deter = mat00 * mat11 - mat01**2
+    valid = np.abs(deter) >= 1e-6
+    deter[~valid] = 1
+    steps = np.stack(
+        (mat11 * vect0 - mat01 * vect1, mat00 * vect1 - mat01 * vect0), -1
+    )
+    return steps / deter[:, None], valid
+
+
+def newton_pairs(
+    arraysa: JordanArrays,
+    arraysb: JordanArrays,
+    params: np.ndarray,
+    tolerance: float,
+) -> np.ndarray:
+    """
+    Refines the pairs (u, v) in [0, 1] x [0, 1] by newton's iterations,
+    all the pairs at once, stopping when all the steps are smaller
+    than the tolerance. The pairs with singular hessian are discarded
+    """
+    for _ in range(20):  # Maximum number of newton iterations
+        steps, valid = newton_step(arraysa, arraysb, params)
+        steps = steps[valid]
+        params = np.clip(params[valid] - steps, 0, 1)
+        if not np.any(np.abs(steps) > tolerance):
+            break
+    return params
+
+
 class IntersectionSegments:
     """
     Defines the methods used to compute the intersection between curves
@@ -277,6 +662,146 @@ class IntersectionSegments:
     tol_du = 1e-9  # tolerance convergence
     tol_norm = 1e-9  # tolerance convergence
     max_denom = math.ceil(1 / tol_du)
+    method = "clipping"  # Either "clipping" or "newton"
+
+    @staticmethod
+    def newton(
+        curvea: Segment, curveb: Segment
+    ) -> Tuple[Tuple[Real, Real], ...]:
+        """Finds the pairs (u*, v*) such A(u*) = B(v*)
+
+        Seeds a grid of parameters and refines it by Newton's method
+        """
+        nptsa = max(curvea.xfunc.degree, curvea.yfunc.degree) + 4
+        nptsb = max(curveb.xfunc.degree, curveb.yfunc.degree) + 4
+        knotsa = tuple(map(float, curvea.knots))
+        knotsb = tuple(map(float, curveb.knots))
+        usample = np.linspace(knotsa[0], knotsa[-1], nptsa)
+        vsample = np.linspace(knotsb[0], knotsb[-1], nptsb)
+        seeds = np.stack(np.meshgrid(usample, vsample, indexing="ij"), -1)
+        pairs = [
+            (curvea.knots[-1], curveb.knots[-1]),
+            (curvea.knots[-1], curveb.knots[0]),
+            (curvea.knots[0], curveb.knots[-1]),
+            (curvea.knots[0], curveb.knots[0]),
+        ]
+        pairs += IntersectionSegments.bezier_and_bezier(
+            curvea, curveb, seeds.reshape(-1, 2)
+        )
+        # Filter values by distance of points
+        pairs = IntersectionSegments.filter_distance(
+            curvea, curveb, pairs, 1e-6
+        )
+        # Filter values by distance abs(ui-uj, vi-vj)
+        return IntersectionSegments.filter_parameters(pairs, 1e-6)
+
+    @staticmethod
+    def clipping(
+        curvea: Segment, curveb: Segment
+    ) -> Union[None, Tuple[Tuple[Real, Real], ...]]:
+        """Finds the pairs (u*, v*) such A(u*) = B(v*)
+
+        Uses the bezier clipping method over the control points.
+        Gives None if the curves overlap, when the clipping doesn't
+        converge in the given budget
+        """
+        pairs = bezier_clipping(control_points(curvea), control_points(curveb))
+        if pairs is None:
+            return None
+        pairs = (
+            (
+                IntersectionSegments.__unit_to_knot(curvea, u),
+                IntersectionSegments.__unit_to_knot(curveb, v),
+            )
+            for u, v in pairs
+        )
+        return tuple(pair for pair in pairs if None not in pair)
+
+    @staticmethod
+    def implicit(
+        curvea: Segment, curveb: Segment
+    ) -> Union[None, Tuple[Tuple[Real, Real], ...]]:
+        """Finds the pairs (u*, v*) such A(u*) = B(v*), for segments
+        of degree at most 2.
+
+        The segment of smallest degree is implicitized as f(x, y) = 0,
+        then the values v* are the real roots of the polynomial f(B(v)),
+        of degree at most 4, and u* are given by the inversion formula.
+        Gives None if the segments overlap or if the quadratic segment
+        degenerates into a line
+        """
+        if curveb.degree < curvea.degree:
+            # pylint: disable=arguments-out-of-order
+            pairs = IntersectionSegments.__implicit(curveb, curvea)
+            return None if pairs is None else tuple((u, v) for v, u in pairs)
+        return IntersectionSegments.__implicit(curvea, curveb)
+
+    @staticmethod
+    def __implicit(
+        curvea: Segment, curveb: Segment
+    ) -> Union[None, Tuple[Tuple[Real, Real], ...]]:
+        """Implicitizes the segment A, of degree 1 or 2, and
+        finds the pairs (u*, v*) such A(u*) = B(v*)
+
+        If A(u) = a0 + a1 * u + a2 * u^2, and P = B(v) - a0, then
+
+        u = cross(a2, P) / cross(a2, a1)
+        cross(a1, a2) * cross(a1, P) = cross(a2, P)^2
+        """
+        xcoefs = tuple(curvea.xfunc) + (0, 0)
+        ycoefs = tuple(curvea.yfunc) + (0, 0)
+        deltax = curveb.xfunc - xcoefs[0]
+        deltay = curveb.yfunc - ycoefs[0]
+        crossa1 = xcoefs[1] * deltay - ycoefs[1] * deltax
+        if curvea.degree == 1:
+            function = crossa1
+            numerator = xcoefs[1] * deltax + ycoefs[1] * deltay
+            denominator = xcoefs[1] ** 2 + ycoefs[1] ** 2
+        else:
+            numerator = xcoefs[2] * deltay - ycoefs[2] * deltax
+            denominator = xcoefs[2] * ycoefs[1] - ycoefs[2] * xcoefs[1]
+            if denominator == 0:
+                return None
+            function = numerator * numerator + denominator * crossa1
+        if is_constant(function):
+            return None if function(curveb.knots[0]) == 0 else ()
+        pairs = []
+        for param in extract_knots(find_roots(function, curveb.domain)):
+            node = numerator(param) / denominator
+            node = IntersectionSegments.__snap_knot(curvea, node)
+            param = IntersectionSegments.__snap_knot(curveb, param)
+            if node is not None and param is not None:
+                pairs.append((node, param))
+        return tuple(pairs)
+
+    @staticmethod
+    def __snap_knot(curve: Segment, node: Real) -> Union[None, Real]:
+        """Snaps the parameter of the segment's domain like the function
+        ``__unit_to_knot``, cause the implicit values are not clamped"""
+        knota, knotb = curve.knots
+        unit = (node - knota) / (knotb - knota)
+        return IntersectionSegments.__unit_to_knot(curve, unit)
+
+    @staticmethod
+    def __unit_to_knot(curve: Segment, param: Real) -> Union[None, Real]:
+        """Maps the parameter in [0, 1] into the segment's domain.
+
+        The values outside [0, 1] by more than ``tol_du`` give None, and
+        the values near the extremities are snapped into the knots.
+        The float values over rational segments are snapped into the
+        nearest fraction of denominator up to ``max_denom``, such the
+        exact pipeline splits both curves at the same exact parameters
+        """
+        tolerance = IntersectionSegments.tol_du
+        if param < tolerance:
+            return None if param < -tolerance else curve.knots[0]
+        if param > 1 - tolerance:
+            return None if param > 1 + tolerance else curve.knots[-1]
+        if not Is.rational(param) and segment_is_rational(curve):
+            param = To.rational(*float(param).as_integer_ratio())
+            param = param.limit_denominator(IntersectionSegments.max_denom)
+        knota, knotb = curve.knots
+        return knota + param * (knotb - knota)
 
     # pylint: disable=invalid-name, too-many-return-statements, too-many-locals
     @staticmethod
@@ -338,53 +863,28 @@ class IntersectionSegments:
         logger.debug("7) Interval, Interval")
         return create_interval(t0, t1), create_interval(u0, u1)
 
-    # pylint: disable=too-many-locals
     @staticmethod
     def bezier_and_bezier(
         curvea: Segment, curveb: Segment, pairs: Tuple[Tuple[float]]
-    ) -> Tuple[Tuple[float]]:
+    ) -> List[Tuple[float, float]]:
         """Finds all the pairs (u*, v*) such A(u*) = B(v*)
 
-        Uses newton's method
+        Uses newton's method, updating all the pairs at once, until
+        the steps are smaller than ``tol_du``. The pairs that reach
+        a singular jacobian are discarded
         """
-        dcurvea = curvea.derivate()
-        ddcurvea = dcurvea.derivate()
-        dcurveb = curveb.derivate()
-        ddcurveb = dcurveb.derivate()
-
-        # Start newton iteration
-        for _ in range(20):  # Number of newton iteration
-            new_pairs = set()
-            for u, v in pairs:
-                ssu = curvea(u)
-                dsu = dcurvea(u)
-                ddu = ddcurvea(u)
-                oov = curveb(v)
-                dov = dcurveb(v)
-                ddv = ddcurveb(v)
-
-                dif = ssu - oov
-                vect0 = inner(dsu, dif)
-                vect1 = -inner(dov, dif)
-                mat00 = inner(dsu, dsu) + inner(ddu, dif)
-                mat01 = -inner(dsu, dov)
-                mat11 = inner(dov, dov) - inner(ddv, dif)
-                deter = mat00 * mat11 - mat01**2
-                if abs(deter) < 1e-6:
-                    continue
-                newu = u - (mat11 * vect0 - mat01 * vect1) / deter
-                newv = v - (mat00 * vect1 - mat01 * vect0) / deter
-                newu = min(curvea.knots[-1], max(curvea.knots[0], newu))
-                newv = min(curveb.knots[-1], max(curveb.knots[0], newv))
-                new_pairs.add((newu, newv))
-            pairs = list(new_pairs)
-            for i, (ui, vi) in enumerate(pairs):
-                if Is.instance(ui, Fraction):
-                    ui = ui.limit_denominator(10000)
-                if Is.instance(vi, Fraction):
-                    vi = vi.limit_denominator(10000)
-                pairs[i] = (ui, vi)
-        return pairs
+        knotsa = np.array(tuple(map(float, curvea.knots)))
+        knotsb = np.array(tuple(map(float, curveb.knots)))
+        starts = np.array((knotsa[0], knotsb[0]))
+        widths = np.array((knotsa[-1], knotsb[-1])) - starts
+        params = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+        params = newton_pairs(
+            JordanArrays([curvea]),
+            JordanArrays([curveb]),
+            (params - starts) / widths,
+            IntersectionSegments.tol_du,
+        )
+        return list(map(tuple, (starts + params * widths).tolist()))
 
     @staticmethod
     def filter_distance(
@@ -397,16 +897,19 @@ class IntersectionSegments:
         Filter the pairs values, since the intersection pair
         (0.5, 1) is almost the same as (1e-6, 0.99999)
         """
-        pairs = list(pairs)
-        index = 0
-        while index < len(pairs):
-            ui, vi = pairs[index]
-            diff = curvea(ui) - curveb(vi)
-            if abs(diff) < max_dist:
-                index += 1
-            else:
-                pairs.pop(index)
-        return tuple(pairs)
+        pairs = tuple(pairs)
+        if not pairs:
+            return pairs
+        params = np.array(pairs, dtype=np.float64)
+        for j, curve in enumerate((curvea, curveb)):
+            knota, knotb = map(float, curve.knots)
+            params[:, j] = (params[:, j] - knota) / (knotb - knota)
+        pointsa = JordanArrays([curvea]).eval(params[:, 0])
+        pointsb = JordanArrays([curveb]).eval(params[:, 1])
+        distances = np.linalg.norm(pointsa - pointsb, axis=1)
+        return tuple(
+            pair for pair, dist in zip(pairs, distances) if dist < max_dist
+        )
 
     @staticmethod
     def filter_parameters(
@@ -414,18 +917,27 @@ class IntersectionSegments:
     ) -> Tuple[Tuple[float]]:
         """
         Filter the parameters values, cause 0 is almost the same as 1e-6
+
+        The first pairs are kept. The kept pairs are hashed in a grid
+        of cells of size ``max_dist``, then each pair is compared only
+        with the pairs inside the neighbor cells
         """
-        pairs = list(pairs)
-        index = 0
-        while index < len(pairs):
-            ui, vi = pairs[index]
-            j = index + 1
-            while j < len(pairs):
-                uj, vj = pairs[j]
-                dist2 = (ui - uj) ** 2 + (vi - vj) ** 2
-                if dist2 < max_dist**2:
-                    pairs.pop(j)
-                else:
-                    j += 1
-            index += 1
-        return tuple(pairs)
+        cells: Dict[Tuple[int, int], List[Tuple[float]]] = {}
+        result = []
+        for ui, vi in pairs:
+            celli = math.floor(ui / max_dist)
+            cellj = math.floor(vi / max_dist)
+            neighbors = (
+                cells.get((celli + i, cellj + j), ())
+                for i in (-1, 0, 1)
+                for j in (-1, 0, 1)
+            )
+            if any(
+                (ui - uj) ** 2 + (vi - vj) ** 2 < max_dist**2
+                for group in neighbors
+                for uj, vj in group
+            ):
+                continue
+            cells.setdefault((celli, cellj), []).append((ui, vi))
+            result.append((ui, vi))
+        return tuple(result)
@@ -12,6 +12,7 @@ from ..analytic import IAnalytic
 from ..loggers import debug, get_logger
 from ..scalar.reals import Real
 from ..tools import CyclicContainer, Is, pairs, reverse
+from .arrays import JordanArrays
 from .base import Future
 from .point import Point2D, cross
 from .segment import Segment
@@ -30,6 +31,7 @@ class JordanCurve(UPiecewiseCurve):
             if self_intersect(usegi):
                 raise ValueError(f"Segment self-intersect! {usegi}")
         self.__area = None
+        self.__arrays = None
 
     @property
     def area(self) -> Real:
@@ -38,6 +40,29 @@ class JordanCurve(UPiecewiseCurve):
             self.__area = compute_area(self)
         return self.__area
 
+    def as_arrays(self) -> JordanArrays:
+        """Gives a compact and read-only view of the curve, with the
+        coefficients of all the segments stored in a single array
+
+        :return: The arrays of coefficients and knots
+        :rtype: JordanArrays
+
+        Example use
+        -----------
+
+        >>> from shapepy import JordanCurve
+        >>> vertices = [(0, 0), (4, 0), (0, 3)]
+        >>> jordan = FactoryJordan.polygon(vertices)
+        >>> jordan.as_arrays().knots
+        array([0., 1., 2., 3.])
+
+        """
+        if self.__arrays is None:
+            self.__arrays = JordanArrays(
+                usegment.parametrize() for usegment in self
+            )
+        return self.__arrays
+
     def vertices(self) -> Iterator[Point2D]:
         """Vertices
 
@@ -13,6 +13,7 @@ from ..scalar.reals import Real
 from ..tools import Is, To, pairs
 from .base import IParametrizedCurve
 from .box import Box
+from .bvh import BoundingTree
 from .point import Point2D
 from .segment import Segment
 
@@ -42,6 +43,9 @@ class PiecewiseCurve(IParametrizedCurve):
         self.__domain = IntervalR1(knots[0], knots[-1])
         self.__segments = segments
         self.__knots = tuple(knots)
+        self.__length = None
+        self.__box = None
+        self.__bvh = None
 
     def __str__(self):
         return r"{" + ", ".join(map(str, self)) + r"}"
@@ -62,7 +66,9 @@ class PiecewiseCurve(IParametrizedCurve):
         """
         Gets the length of the curve
         """
-        return sum(seg.length for seg in self)
+        if self.__length is None:
+            self.__length = sum(seg.length for seg in self)
+        return self.__length
 
     def __iter__(self) -> Iterator[Segment]:
         yield from self.__segments
@@ -110,10 +116,12 @@ class PiecewiseCurve(IParametrizedCurve):
         :return: The box which encloses the piecewise curve
         :rtype: Box
         """
-        box = None
-        for bezier in self:
-            box |= bezier.box()
-        return box
+        if self.__box is None:
+            box = None
+            for bezier in self:
+                box |= bezier.box()
+            self.__box = box
+        return self.__box
 
     @debug("shapepy.geometry.piecewise")
     def split(self, nodes: Iterable[Real]) -> None:
@@ -145,10 +153,24 @@ class PiecewiseCurve(IParametrizedCurve):
                 newsegments.append(segmenti.section([ka, kb]))
         self.__knots = tuple(sorted(list(self.knots) + list(nodes)))
         self.__segments = tuple(newsegments)
+        self.__length = None
+        self.__box = None
+        self.__bvh = None
 
     def eval(self, node: float, derivate: int = 0) -> Point2D:
         return self[self.span(node)].eval(node, derivate)
 
     def __contains__(self, point: Point2D) -> bool:
         """Tells if the point is on the boundary"""
-        return any(point in bezier for bezier in self)
+        return any(point in self[i] for i in self.bvh().query_point(point))
+
+    def bvh(self) -> BoundingTree:
+        """The bounding volume hierarchy over the segments' boxes,
+        built only once, when it's requested for the first time
+
+        :return: The tree of the boxes of the segments
+        :rtype: BoundingTree
+        """
+        if self.__bvh is None:
+            self.__bvh = BoundingTree(segment.box() for segment in self)
+        return self.__bvh
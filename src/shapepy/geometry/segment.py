@@ -13,7 +13,7 @@ File that defines the classes
 from __future__ import annotations
 
 from copy import copy
-from typing import Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
 from ..analytic.base import IAnalytic
 from ..analytic.bezier import Bezier
@@ -54,6 +54,8 @@ class Segment(IParametrizedCurve):
                 f"Given domain must be in {xfunc.domain & yfunc.domain}"
             )
         self.__length = None
+        self.__box = None
+        self.__derivates: Dict[int, Segment] = {}
         self.__domain = domain
         self.__knots = (infimum(self.domain), supremum(self.domain))
         self.__xfunc = xfunc
@@ -81,6 +83,13 @@ class Segment(IParametrizedCurve):
         """
         return self.__yfunc
 
+    @property
+    def degree(self) -> int:
+        """
+        Gives the maximum degree of the functions x(t) and y(t)
+        """
+        return max(self.__xfunc.degree, self.__yfunc.degree)
+
     @property
     def length(self) -> Real:
         if self.__length is None:
@@ -119,23 +128,33 @@ class Segment(IParametrizedCurve):
     def derivate(self, times: Optional[int] = 1) -> Segment:
         """
         Gives the first derivative of the curve
+
+        The segment is immutable, then the derivatives are computed
+        only once and stored for the next calls
         """
         if not Is.integer(times) or times <= 0:
             raise ValueError(f"Times must be integer >= 1, not {times}")
-        dxfunc = self.xfunc.derivate(times)
-        dyfunc = self.yfunc.derivate(times)
-        return Segment(dxfunc, dyfunc, domain=self.domain)
+        if times not in self.__derivates:
+            dxfunc = self.xfunc.derivate(times)
+            dyfunc = self.yfunc.derivate(times)
+            dsegment = Segment(dxfunc, dyfunc, domain=self.domain)
+            self.__derivates[times] = dsegment
+        return self.__derivates[times]
 
     def box(self) -> Box:
         """Returns two points which defines the minimal exterior rectangle
 
         Returns the pair (A, B) with A[0] <= B[0] and A[1] <= B[1]
+
+        The box is computed only once, since the segment is immutable
         """
-        xmin = find_minimum(self.xfunc, self.domain)
-        xmax = -find_minimum(-self.xfunc, self.domain)
-        ymin = find_minimum(self.yfunc, self.domain)
-        ymax = -find_minimum(-self.yfunc, self.domain)
-        return Box(cartesian(xmin, ymin), cartesian(xmax, ymax))
+        if self.__box is None:
+            xmin = find_minimum(self.xfunc, self.domain)
+            xmax = -find_minimum(-self.xfunc, self.domain)
+            ymin = find_minimum(self.yfunc, self.domain)
+            ymax = -find_minimum(-self.yfunc, self.domain)
+            self.__box = Box(cartesian(xmin, ymin), cartesian(xmax, ymax))
+        return self.__box
 
     def __copy__(self) -> Segment:
         return self.__deepcopy__(None)
@@ -12,6 +12,7 @@ from ..scalar.reals import Real
 from ..tools import Is
 from .base import IGeometricCurve
 from .box import Box
+from .bvh import BoundingTree
 from .piecewise import PiecewiseCurve
 from .point import Point2D
 from .segment import Segment
@@ -75,11 +76,16 @@ class UPiecewiseCurve(IGeometricCurve):
     def __init__(self, usegments: Iterable[Union[Segment, USegment]]):
         self.__usegments = tuple(usegments)
         self.__piecewise = None
+        self.__length = None
+        self.__box = None
+        self.__bvh = None
 
     @property
     def length(self) -> Real:
         """The length of the curve"""
-        return sum(useg.length for useg in self)
+        if self.__length is None:
+            self.__length = sum(useg.length for useg in self)
+        return self.__length
 
     def __iter__(self) -> Iterator[Union[Segment, USegment]]:
         """Unparametrized Segments
@@ -113,7 +119,21 @@ class UPiecewiseCurve(IGeometricCurve):
 
     def __contains__(self, point: Point2D) -> bool:
         """Tells if the point is on the boundary"""
-        return any(point in useg for useg in self)
+        usegments = self.__usegments
+        return any(
+            point in usegments[i] for i in self.bvh().query_point(point)
+        )
+
+    def bvh(self) -> BoundingTree:
+        """The bounding volume hierarchy over the segments' boxes,
+        built only once, when it's requested for the first time
+
+        :return: The tree of the boxes of the segments
+        :rtype: BoundingTree
+        """
+        if self.__bvh is None:
+            self.__bvh = BoundingTree(useg.box() for useg in self)
+        return self.__bvh
 
     def box(self) -> Box:
         """The box which encloses the jordan curve
@@ -131,10 +151,12 @@ class UPiecewiseCurve(IGeometricCurve):
         Box with vertices (0, 0) and (4, 3)
 
         """
-        box = None
-        for usegment in self:
-            box |= usegment.box()
-        return box
+        if self.__box is None:
+            box = None
+            for usegment in self:
+                box |= usegment.box()
+            self.__box = box
+        return self.__box
 
     def parametrize(self) -> PiecewiseCurve:
         """Gives a parametrized curve"""
@@ -15,7 +15,7 @@ from shapepy.bool2d.shape import ConnectedShape, DisjointShape, SubSetR2
 from shapepy.geometry.jordancurve import JordanCurve
 from shapepy.geometry.segment import Segment
 
-from ..analytic import Bezier
+from ..analytic.bezier import to_bezier
 from ..tools import Is
 
 Path = matplotlib.path.Path
@@ -33,10 +33,12 @@ def patch_segment(segment: Segment):
     if xfunc.degree <= 1 and yfunc.degree <= 1:
         vertices.append(segment(segment.knots[-1]))
         commands.append(Path.LINETO)
-    elif xfunc.degree == 2 and yfunc.degree == 2:
-        xfunc: Bezier = segment.xfunc
-        yfunc: Bezier = segment.yfunc
-        ctrlpoints = tuple(zip(xfunc, yfunc))
+    elif max(xfunc.degree, yfunc.degree) == 2:
+        xbezier = to_bezier(xfunc, segment.knots)
+        ybezier = to_bezier(yfunc, segment.knots)
+        xbezier = xbezier.elevate(2 - xfunc.degree)
+        ybezier = ybezier.elevate(2 - yfunc.degree)
+        ctrlpoints = tuple(zip(xbezier.ctrlpoints, ybezier.ctrlpoints))
         vertices += list(ctrlpoints[1:])
         commands += [Path.CURVE3] * 2
     return vertices, commands
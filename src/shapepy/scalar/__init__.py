@@ -6,6 +6,13 @@ defines the methods of numerical integration (quadrature)"""
 
 from ..tools import To
 from .angle import Angle, to_angle
-from .reals import Math, Rational, Real
+from .reals import (
+    Backend,
+    Math,
+    Rational,
+    Real,
+    float_backend,
+    set_float_backend,
+)
 
 To.angle = to_angle
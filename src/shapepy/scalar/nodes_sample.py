@@ -2,12 +2,11 @@
 Defines the NodeSampleFactory
 """
 
-from functools import lru_cache
 from typing import Tuple
 
 from ..tools import Is, To
 from .angle import turns
-from .reals import Rational, Real
+from .reals import Rational, Real, backend_cache
 
 
 class NodeSampleFactory:
@@ -16,7 +15,7 @@ class NodeSampleFactory:
     """
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @backend_cache
     def closed_linspace(npts: int) -> Tuple[Rational, ...]:
         """
         Gives a set of numbers in interval [0, 1]
@@ -37,7 +36,7 @@ class NodeSampleFactory:
         return tuple(To.rational(num, npts - 1) for num in range(npts))
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @backend_cache
     def closed_newton_cotes(npts: int) -> Tuple[Real]:
         """
         Gives a set of numbers in interval [0, 1]
@@ -58,7 +57,7 @@ class NodeSampleFactory:
         return tuple(To.rational(num, npts - 1) for num in range(npts))
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @backend_cache
     def open_newton_cotes(npts: int) -> Tuple[Real]:
         """
         Gives a set of numbers in interval (0, 1)
@@ -79,7 +78,7 @@ class NodeSampleFactory:
         return tuple(To.rational(num, npts + 1) for num in range(1, npts + 1))
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @backend_cache
     def custom_open_formula(npts: int) -> Tuple[Real]:
         """
         Gives a set of numbers in interval (0, 1)
@@ -102,7 +101,7 @@ class NodeSampleFactory:
         )
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @backend_cache
     def chebyshev(npts: int) -> Tuple[Real]:
         """
         Gives a set of numbers in interval (0, 1)
@@ -10,7 +10,7 @@ import numpy as np
 from ..loggers import debug
 from ..tools import Is, To
 from .nodes_sample import NodeSampleFactory
-from .reals import Math, Real
+from .reals import Math, Real, backend_cache
 from .reals import to_rational as frac
 
 
@@ -263,7 +263,7 @@ class IntegratorFactory:
         return DirectIntegrator(map(convert, nodes), map(convert, weights))
 
     @staticmethod
-    @lru_cache(maxsize=None)
+    @backend_cache
     def custom_open_formula(
         npts: int, convert: type = To.rational
     ) -> DirectIntegrator:
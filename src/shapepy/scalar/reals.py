@@ -13,18 +13,86 @@ Example of use are:
 * `numpy` offers `numpy.float64` instead of float
 * `mpmath` offers the `mpmath.mpf` of arbitrary precision of float
 * `sympy` offers `sympy.core.numbers.Rational` instead of `fractions.Fraction`
+
+The float backend, enabled by `set_float_backend` or temporarily by the
+context manager `float_backend`, makes `To.rational` give floats instead
+of fractions, such the entire package computes with floats.
+The exact mode remains the default, useful for validation
 """
 
 from __future__ import annotations
 
 import math
+from contextlib import contextmanager
 from fractions import Fraction
+from functools import lru_cache, wraps
 from numbers import Integral, Rational, Real
 from typing import Any, Callable
 
 from ..tools import Is, To
 
 
+# pylint: disable=too-few-public-methods
+class Backend:
+    """Static class that contains the flags of the numeric backend"""
+
+    floats = False
+
+
+def set_float_backend(value: bool = True):
+    """
+    Enables or disables globally the float backend
+
+    Example
+    -------
+    >>> set_float_backend(True)
+    >>> To.rational(1, 2)
+    0.5
+    >>> set_float_backend(False)
+    >>> To.rational(1, 2)
+    Fraction(1, 2)
+    """
+    Backend.floats = bool(value)
+
+
+@contextmanager
+def float_backend(value: bool = True):
+    """
+    Context manager that enables/disables temporarily the float backend
+
+    Example
+    -------
+    >>> with float_backend():
+    ...     To.rational(1, 2)
+    0.5
+    """
+    old = Backend.floats
+    Backend.floats = bool(value)
+    try:
+        yield
+    finally:
+        Backend.floats = old
+
+
+def backend_cache(function: Callable) -> Callable:
+    """
+    Decorator that caches the results of the function separately
+    for each numeric backend, used instead of ``lru_cache`` for
+    the functions that give rational numbers
+    """
+
+    @lru_cache(maxsize=None)
+    def cached(floats: bool, args: tuple, kwargs: tuple):
+        del floats  # Only used as a key of the cache
+        return function(*args, **dict(kwargs))
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        return cached(Backend.floats, args, tuple(sorted(kwargs.items())))
+
+    return wrapper
+
+
 def is_finite(number: Real) -> bool:
     """
     Check if a number is finite.
@@ -258,9 +326,14 @@ def to_rational(numerator: Rational, denominator: Rational = 1) -> Rational:
     Fraction(4, 3)
     >>> To.rational(22, 7)
     Fraction(22, 7)
+    >>> with float_backend():
+    ...     To.rational(1, 2)
+    0.5
     """
     numerator = To.real(numerator)
     denominator = To.real(denominator)
+    if Backend.floats:
+        return float(numerator) / float(denominator)
     return Fraction(numerator, denominator)
 
 
@@ -7,6 +7,7 @@ from shapepy.analytic.bezier import (
     bezier_caract_matrix,
     inverse_caract_matrix,
     polynomial2bezier,
+    to_bezier,
 )
 from shapepy.analytic.polynomial import Polynomial
 
@@ -202,6 +203,40 @@ def test_clean():
     assert Bezier([1, 2, 3, 4]) == Bezier([1, 4])
 
 
+@pytest.mark.order(4)
+@pytest.mark.dependency(depends=["test_build", "test_evaluate"])
+def test_bernstein():
+    bezier = Bezier([1, -1, 2], [2, 5])
+    assert bezier.ctrlpoints == (1, -1, 2)
+    assert bezier.reparam == (2, 5)
+    assert bezier.bounds() == (-1, 2)
+    nodes = np.linspace(2, 5, 13)
+    values = tuple(map(bezier, nodes))
+    assert all(-1 <= value <= 2 for value in values)
+
+    left, right = bezier.split(3)
+    assert left.ctrlpoints[0] == 1
+    assert left.ctrlpoints[-1] == right.ctrlpoints[0]
+    assert abs(left.ctrlpoints[-1] - bezier(3)) < 1e-12
+    assert right.ctrlpoints[-1] == 2
+    for node in nodes:
+        part = left if node <= 3 else right
+        assert abs(part(node) - bezier(node)) < 1e-12
+    with pytest.raises(ValueError):
+        bezier.split(5)
+
+    elevated = bezier.elevate(2)
+    assert len(elevated.ctrlpoints) == 5
+    assert elevated == bezier
+    assert Bezier([1, 3]).elevate().ctrlpoints == (1, 2, 3)
+
+    poly = Polynomial([0, 0, 1])  # p(t) = t^2
+    assert to_bezier(poly, (-1, 1)).ctrlpoints == (1, -1, 1)
+    assert to_bezier(poly, (0, 1)).ctrlpoints == (0, 0, 1)
+    ctrlpoints = to_bezier(bezier, (2, 5)).ctrlpoints
+    np.testing.assert_allclose(ctrlpoints, (1, -1, 2))
+
+
 @pytest.mark.order(4)
 @pytest.mark.dependency(
     depends=[
@@ -214,6 +249,7 @@ def test_clean():
         "test_print",
         "test_conversions",
         "test_clean",
+        "test_bernstein",
     ]
 )
 def test_all():
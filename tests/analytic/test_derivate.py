@@ -52,12 +52,25 @@ def test_bezier():
     assert bezier.eval(1, 1) == 0
 
 
+@pytest.mark.order(9)
+@pytest.mark.dependency(depends=["test_begin", "test_polynomial"])
+def test_table():
+    poly = Polynomial([1, 1, 1, 1, 1])
+    assert poly.derivate(2) is poly.derivate(2)
+    assert poly.derivate().derivate() == poly.derivate(2)
+    assert poly.derivate(7) == 0
+    for node in range(-3, 4):
+        for times in range(6):
+            assert poly.eval(node, times) == poly.derivate(times).eval(node)
+
+
 @pytest.mark.order(9)
 @pytest.mark.dependency(
     depends=[
         "test_begin",
         "test_polynomial",
         "test_bezier",
+        "test_table",
     ]
 )
 def test_all():
@@ -1,5 +1,8 @@
+import math
 import random
+from fractions import Fraction
 
+import numpy as np
 import pytest
 
 from shapepy.analytic.polynomial import Polynomial
@@ -148,6 +151,18 @@ def test_print():
     assert str(poly) == "1 + 2 * t + 3 * t^2"
     repr(poly)
 
+    poly = Polynomial([Fraction(1, 3), 2, Fraction(1, 7)])
+    values = poly.eval_many(np.linspace(0, 1, 3))
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values, [1 / 3, 1 / 3 + 1 + 1 / 28, 52 / 21])
+    values = poly.eval_many([0, 1, 2])
+    assert values.dtype == object
+    assert tuple(values) == (
+        Fraction(1, 3),
+        Fraction(52, 21),
+        Fraction(103, 21),
+    )
+
     poly = Polynomial([1, 2, 3], domain=[0, 1])
     assert repr(poly) == "[0, 1]: 1 + 2 * t + 3 * t^2"
 
@@ -179,6 +194,88 @@ def test_infinity_evaluation():
         assert poly(Math.POSINF) == Math.NEGINF
 
 
+@pytest.mark.order(3)
+@pytest.mark.dependency(depends=["test_evaluate", "test_infinity_evaluation"])
+def test_eval_many():
+    poly = Polynomial([1, 2, 3])  # p(t) = 1 + 2 * t + 3 * t^2
+    values = poly.eval_many([0, 1, 2])
+    assert values.dtype == object
+    assert tuple(values) == (1, 6, 17)
+    values = poly.eval_many([Fraction(1, 2), Fraction(1, 3)], 1)
+    assert tuple(values) == (5, 4)
+    assert tuple(poly.eval_many(range(3), 2)) == (6, 6, 6)
+    assert tuple(poly.eval_many(range(3), 3)) == (0, 0, 0)
+
+    nodes = np.linspace(-1, 1, 17)
+    values = poly.eval_many(nodes)
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values, [poly.eval(t) for t in nodes])
+    np.testing.assert_allclose(poly(nodes), values)
+    np.testing.assert_allclose(poly.eval_many(nodes, 1), 2 + 6 * nodes)
+
+    values = poly.eval_many([Math.NEGINF, 0.0, Math.POSINF])
+    assert tuple(values) == (Math.POSINF, 1, Math.POSINF)
+
+    poly = Polynomial([Fraction(1, 3), 2, Fraction(1, 7)])
+    values = poly.eval_many(np.linspace(0, 1, 3))
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values, [1 / 3, 1 / 3 + 1 + 1 / 28, 52 / 21])
+    values = poly.eval_many([0, 1, 2])
+    assert values.dtype == object
+    assert tuple(values) == (
+        Fraction(1, 3),
+        Fraction(52, 21),
+        Fraction(103, 21),
+    )
+
+    poly = Polynomial([1, 2, 3], domain=[0, 1])
+    np.testing.assert_allclose(poly.eval_many([0.0, 0.5, 1.0]), [1, 2.75, 6])
+    with pytest.raises(ValueError):
+        poly.eval_many([0.5, 2.0])
+    # Every node is checked, not only the smallest and the biggest
+    with pytest.raises(ValueError):
+        poly.eval_many([0.0, float("nan"), 1.0])
+    poly = Polynomial([1, 2, 3], domain="(0, 1)")
+    np.testing.assert_allclose(poly.eval_many([0.5]), [2.75])
+    for nodes in ([0, Fraction(1, 2)], [0.5, 1.0]):
+        with pytest.raises(ValueError):
+            poly.eval_many(nodes)
+    poly = Polynomial([1, 2, 3], domain=[0, Fraction(1, 3)])
+    assert tuple(poly.eval_many([0, Fraction(1, 3)])) == (1, 2)
+    with pytest.raises(ValueError):
+        poly.eval_many([0.0, 0.34])
+
+
+@pytest.mark.order(3)
+@pytest.mark.dependency(depends=["test_mul", "test_pow"])
+def test_high_degree_mul():
+    coefsa = tuple(Fraction(i % 7 - 3, 1 + i % 4) for i in range(50))
+    coefsb = tuple(i % 5 - 2 for i in range(40))
+    polya = Polynomial(coefsa)
+    polyb = Polynomial(coefsb)
+    expected = [0] * (len(coefsa) + len(coefsb) - 1)
+    for i, coefi in enumerate(coefsa):
+        for j, coefj in enumerate(coefsb):
+            expected[i + j] += coefi * coefj
+    assert polya * polyb == Polynomial(expected)
+    assert polyb * polya == Polynomial(expected)
+
+    # Float coefficients
+    polyc = Polynomial([float(coef) for coef in coefsa])
+    product = polyc * polyb
+    assert all(isinstance(coef, float) for coef in product)
+    np.testing.assert_allclose(tuple(product), list(map(float, expected)))
+
+    # Power by squaring
+    poly = Polynomial([1, 1])
+    assert tuple(poly**20) == tuple(math.comb(20, i) for i in range(21))
+    assert poly**0 == 1
+    poly = Polynomial([0.5, 2])
+    np.testing.assert_allclose(tuple(poly**3), (0.125, 1.5, 6, 8))
+    with pytest.raises(ValueError):
+        poly ** (-1)
+
+
 @pytest.mark.order(3)
 @pytest.mark.dependency(
     depends=[
@@ -189,6 +286,8 @@ def test_infinity_evaluation():
         "test_mul",
         "test_pow",
         "test_infinity_evaluation",
+        "test_eval_many",
+        "test_high_degree_mul",
     ]
 )
 def test_all():
@@ -6,8 +6,13 @@ import pytest
 
 from shapepy.analytic.bezier import Bezier
 from shapepy.analytic.polynomial import Polynomial
-from shapepy.analytic.tools import find_minimum, find_roots, where_minimum
-from shapepy.rbool import EmptyR1, WholeR1
+from shapepy.analytic.tools import (
+    find_minimum,
+    find_roots,
+    find_roots_many,
+    where_minimum,
+)
+from shapepy.rbool import EmptyR1, WholeR1, extract_knots, from_any
 from shapepy.scalar.reals import Math
 
 
@@ -78,6 +83,111 @@ def test_bezier_roots():
     assert find_roots(bezier, [0, 1]) == {1 / 2}
 
 
+@pytest.mark.order(9)
+@pytest.mark.dependency(depends=["test_begin", "test_polynomial_roots"])
+def test_roots_in_domain():
+    x = Polynomial([0, 1])
+    poly = (x - 1) * (x - 2) * (x - 3) * (x - 4) * (x - 5)
+    assert find_roots(poly) == {1, 2, 3, 4, 5}
+    assert find_roots(poly, [2, 4]) == {2, 3, 4}
+    assert find_roots(poly, (2, 4)) == {3}
+    assert find_roots(poly, [1.5, 3.5]) == {2, 3}
+    assert find_roots(poly, "[-1, 0] U [4.5, 10]") == {5}
+    assert find_roots(poly, [6, 10]) == EmptyR1()
+
+    # Multiple roots are given only once
+    poly = (x - Fraction(1, 3)) ** 2 * (x + 3) ** 3
+    assert find_roots(poly) == {1 / 3, -3}
+    poly = (x - 1) ** 2 * (x - 3) * (x + 0.5)
+    assert find_roots(poly) == {-0.5, 1, 3}
+
+    # Irrational roots are the nearest floats
+    assert find_roots(x**3 - 2) == {2 ** (1 / 3)}
+    poly = (x * x - 2) * (x * x - 3) * (x + 10)
+    roots = {-10, -math.sqrt(3), -math.sqrt(2), math.sqrt(2), math.sqrt(3)}
+    assert find_roots(poly) == roots
+    assert find_roots(poly, [0, 10]) == {math.sqrt(2), math.sqrt(3)}
+
+    # Compare with random polynomials, with float coefficients
+    for _ in range(20):
+        values = sorted(random.uniform(-10, 10) for _ in range(5))
+        poly = Polynomial([1])
+        for value in values:
+            poly *= x - value
+        roots = sorted(extract_knots(find_roots(poly, [-10, 10])))
+        assert len(roots) == len(values)
+        for root, value in zip(roots, values):
+            assert abs(root - value) < 1e-6
+
+
+@pytest.mark.order(9)
+@pytest.mark.dependency(depends=["test_begin", "test_roots_in_domain"])
+def test_roots_whole_line():
+    x = Polynomial([0, 1])
+    # Close roots are not merged by the large Cauchy's bound
+    poly = Polynomial([1])
+    for root in range(1, 13):
+        poly *= x - root
+    assert find_roots(poly) == set(range(1, 13))
+    assert find_roots(poly, WholeR1()) == set(range(1, 13))
+
+    roota = Fraction(3, 41)
+    rootb = roota + Fraction(1, 10**5)
+    poly = (x - roota) * (x - rootb) * (x + 10**7) * Fraction(1, 10**7)
+    roots = {-(10**7), float(roota), float(rootb)}
+    assert find_roots(poly) == roots
+
+    poly = Polynomial(map(float, poly))
+    roots = sorted(extract_knots(find_roots(poly)))
+    assert len(roots) == 3
+    for root, good in zip(roots, (-(10**7), roota, rootb)):
+        assert abs(root - good) < 1e-9 * max(1, abs(good))
+
+    # The cluster of two complex roots is not a root
+    poly = (x - roota) * (x - rootb) + Fraction(1, 10**7) * x**3
+    assert len(tuple(extract_knots(find_roots(poly)))) == 1
+
+
+@pytest.mark.order(9)
+@pytest.mark.dependency(depends=["test_begin", "test_roots_whole_line"])
+def test_roots_many():
+    x = Polynomial([0, 1])
+    roota = Fraction(3, 41)
+    rootb = roota + Fraction(1, 10**5)
+    polys = [
+        x**3 - x,
+        x**3 - 8,
+        x**3 + x,
+        (x - 1) ** 2 * (x - 3) * (x + Fraction(1, 2)),
+        (x - roota) ** 3 * (x + 2),
+        (x - roota) ** 4 * (x - 5) * (x + 3),
+        (x - roota) * (x - rootb) * (x + 10**7) * Fraction(1, 10**7),
+        (x - roota) * (x - rootb) + Fraction(1, 10**7) * x**3,
+        2 * x - 1,
+        x**2 - 2,
+        Polynomial([3]),
+    ]
+    polys.append(Polynomial([1]))
+    for root in range(1, 13):
+        polys[-1] *= x - root
+    random.seed(0)
+    for degree in range(3, 8):
+        for _ in range(4):
+            coefs = [random.randint(-10, 10) for _ in range(degree)]
+            polys.append(Polynomial(coefs + [random.randint(1, 10)]))
+    polys += [Polynomial(map(float, poly)) for poly in polys]
+    domains = [WholeR1(), from_any([-1, 1]), from_any("[-3, 0] U [1, 4]")]
+    for domain in domains:
+        goods = tuple(find_roots(poly, domain) for poly in polys)
+        assert find_roots_many(polys, domain) == goods
+    domains = [domains[i % 3] for i in range(len(polys))]
+    goods = tuple(map(find_roots, polys, domains))
+    assert find_roots_many(polys, domains) == goods
+    assert find_roots_many([]) == ()
+    with pytest.raises(ValueError):
+        find_roots_many(polys, domains[:2])
+
+
 @pytest.mark.order(9)
 @pytest.mark.dependency(depends=["test_begin"])
 def test_where_minimal_polynomial():
@@ -178,6 +288,9 @@ def test_minimum_value_bezier():
         "test_begin",
         "test_polynomial_roots",
         "test_bezier_roots",
+        "test_roots_in_domain",
+        "test_roots_whole_line",
+        "test_roots_many",
         "test_where_minimal_polynomial",
         "test_where_minimal_bezier",
         "test_minimal_value_polynomial",
@@ -8,6 +8,7 @@ import pytest
 from shapepy.bool2d.primitive import Primitive
 from shapepy.bool2d.shape import SimpleShape
 from shapepy.geometry.factory import FactoryJordan
+from shapepy.tools import Is
 
 
 @pytest.mark.order(42)
@@ -84,6 +85,25 @@ class TestIntersectionSimple:
         assert square0 - square1 == left_shape
         assert square1 - square0 == right_shape
 
+    @pytest.mark.order(42)
+    @pytest.mark.timeout(40)
+    @pytest.mark.dependency(depends=["TestIntersectionSimple::test_begin"])
+    def test_circle_and_square(self):
+        # The end of the float circle is not exactly over the square
+        circle = Primitive.circle(radius=1)
+        square = Primitive.square(side=2, center=(1, 1))
+        quarter = circle.area / 4
+
+        union = (circle | square).clean()
+        assert Is.instance(union, SimpleShape)
+        assert abs(union.area - (4 + 3 * quarter)) < 1e-9
+
+        circle = Primitive.circle(radius=1)
+        square = Primitive.square(side=2, center=(1, 1))
+        inter = (circle & square).clean()
+        assert Is.instance(inter, SimpleShape)
+        assert abs(inter.area - quarter) < 1e-9
+
     @pytest.mark.order(42)
     @pytest.mark.dependency(
         depends=[
@@ -91,6 +111,7 @@ class TestIntersectionSimple:
             "TestIntersectionSimple::test_or_two_rombos",
             "TestIntersectionSimple::test_and_two_rombos",
             "TestIntersectionSimple::test_sub_two_rombos",
+            "TestIntersectionSimple::test_circle_and_square",
         ]
     )
     def test_end(self):
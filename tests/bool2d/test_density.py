@@ -5,6 +5,7 @@ of an object with respect to another
 
 from fractions import Fraction as frac
 
+import numpy as np
 import pytest
 
 from shapepy import lebesgue_density
@@ -418,6 +419,51 @@ def test_disjoint_shape():
         assert shape.density(point) == value
 
 
+@pytest.mark.order(23)
+@pytest.mark.dependency(
+    depends=[
+        "test_begin",
+        "test_simple_shape",
+        "test_connected_shape",
+        "test_disjoint_shape",
+    ]
+)
+def test_many_points():
+    big = Primitive.square(side=6)
+    small = Primitive.square(side=2)
+    squarel = Primitive.square(side=2, center=(-3, 0))
+    squarer = Primitive.square(side=2, center=(3, 0))
+    circle = Primitive.circle(radius=2)
+    shapes = (
+        big,
+        -small,
+        circle,
+        ConnectedShape([big, -small]),
+        DisjointShape([squarel, squarer]),
+    )
+    points = np.random.default_rng(0).uniform(-4, 4, (100, 2))
+    points = np.vstack([points, [(0, 0), (1, 1), (3, 0), (-2, 1), (2, 0)]])
+    for shape in shapes:
+        densities = shape.densities(points)
+        assert densities.shape == (len(points),)
+        for point, density in zip(points, densities):
+            point = tuple(map(float, point))
+            assert shape.density(point) == density
+        inside = shape.contains_points(points)
+        assert inside.dtype == np.bool_
+        for point, value in zip(points, inside):
+            assert (tuple(map(float, point)) in shape) == value
+    assert tuple(big.contains_points([(0, 0), (3, 0), (4, 0)])) == (
+        True,
+        True,
+        False,
+    )
+    values = big.contains_points([(0, 0), (3, 0), (4, 0)], boundary=False)
+    assert tuple(values) == (True, False, False)
+    with pytest.raises(ValueError):
+        big.densities([0, 0])
+
+
 @pytest.mark.order(23)
 @pytest.mark.dependency(
     depends=[
@@ -427,6 +473,7 @@ def test_disjoint_shape():
         "test_simple_shape",
         "test_connected_shape",
         "test_disjoint_shape",
+        "test_many_points",
     ]
 )
 def test_end():
@@ -0,0 +1,197 @@
+"""
+This module tests the boolean operations between many shapes at once,
+computed over the planar arrangement of the module overlay.py
+"""
+
+import pytest
+
+from shapepy.bool2d.base import EmptyShape, WholeShape
+from shapepy.bool2d.boolean import (
+    EndpointGraph,
+    FollowPath,
+    overlay_bool2d,
+    xor_bool2d,
+)
+from shapepy.bool2d.lazy import LazyAnd, LazyNot, LazyOr
+from shapepy.bool2d.overlay import Overlay, VertexIndex
+from shapepy.bool2d.primitive import Primitive
+from shapepy.bool2d.shape import DisjointShape
+
+
+@pytest.mark.order(44)
+@pytest.mark.dependency(
+    depends=[
+        "tests/bool2d/test_bool_overlap.py::test_end",
+    ],
+    scope="session",
+)
+def test_begin():
+    pass
+
+
+def three_squares():
+    """Three squares of side 2, each one overlapping the two others"""
+    return tuple(
+        Primitive.square(side=2, center=center)
+        for center in [(0, 0), (1, 0), (0, 1)]
+    )
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin"])
+def test_vertex_index():
+    index = VertexIndex(1e-6)
+    assert index((0, 0)) == 0
+    assert index((1, 0)) == 1
+    assert index((1 + 1e-9, 0)) == 1
+    assert index((0, 1e-7)) == 0
+    assert len(index) == 2
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_vertex_index"])
+def test_endpoint_graph():
+    squarea = Primitive.square(side=2)
+    squareb = Primitive.square(side=2, center=(1, 1))
+    # The jordans of the same group are not intersected
+    squarec = Primitive.square(side=1, center=(5, 5))
+    groups = [squarea.jordans + squareb.jordans, squarec.jordans]
+    FollowPath.split_on_intersection(groups)
+    assert len(squarea.jordans[0].parametrize()) == 4
+    assert len(squareb.jordans[0].parametrize()) == 4
+    FollowPath.split_on_intersection([squarea.jordans, squareb.jordans])
+    jordans = tuple(squarea.jordans) + tuple(squareb.jordans)
+    graph = EndpointGraph(jordans)
+    assert tuple(map(len, graph.segments)) == (6, 6)
+    # At the intersection points the path changes of jordan
+    assert graph.following(0, 4) == (1, 4)
+    assert graph.following(1, 1) == (0, 1)
+    # Elsewhere it continues over the same jordan
+    assert graph.following(0, 5) == (0, 0)
+    assert graph.following(1, 5) == (1, 0)
+
+    matrix = FollowPath.pursue_path(0, 1, jordans, graph)
+    assert tuple(matrix) == (
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (0, 4),
+        (1, 4),
+        (1, 5),
+        (1, 0),
+        (1, 1),
+    )
+    assert FollowPath.pursue_path(0, 1, jordans) == matrix
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(20)
+@pytest.mark.dependency(depends=["test_begin", "test_vertex_index"])
+def test_expressions():
+    squarea, squareb, squarec = three_squares()
+    overlay = Overlay([squarea, squareb, squarec])
+    # The common segments of the squares are a single edge
+    assert len(overlay.edges) == 18
+
+    def area(subset):
+        return overlay_bool2d(subset, overlay).area
+
+    assert area(LazyOr([squarea, squareb, squarec])) == 8
+    assert area(LazyAnd([squarea, squareb, squarec])) == 1
+    assert area(LazyAnd([squarea, LazyNot(squareb)])) == 2
+    assert area(LazyAnd([squarea, LazyNot(squareb), LazyNot(squarec)])) == 1
+    assert area(LazyNot(LazyOr([squarea, squareb]))) == -6
+
+    result = overlay_bool2d(LazyAnd([squareb, LazyNot(squareb)]), overlay)
+    assert result is EmptyShape()
+    result = overlay_bool2d(LazyOr([squareb, LazyNot(squareb)]), overlay)
+    assert result is WholeShape()
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(20)
+@pytest.mark.dependency(depends=["test_begin", "test_expressions"])
+def test_shapes_unchanged():
+    squares = three_squares()
+    nsegments = [len(square.jordans[0].parametrize()) for square in squares]
+    Overlay(squares)
+    overlay_bool2d(LazyOr(squares))
+    assert [len(sq.jordans[0].parametrize()) for sq in squares] == nsegments
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(20)
+@pytest.mark.dependency(depends=["test_begin", "test_expressions"])
+def test_shared_edge():
+    # The left edge of the small square is over the right edge of big one
+    big = Primitive.square(side=2)
+    small = Primitive.square(side=1, center=(1.5, 0))
+    overlay = Overlay([big, small])
+    for segment, _, _, left, right in overlay.edges:
+        midpoint = segment(sum(segment.knots) / 2)
+        if midpoint == (1, 0):
+            assert left == (True, False)
+            assert right == (False, True)
+            break
+    else:
+        raise AssertionError("Shared edge not found")
+
+    def area(subset):
+        return overlay_bool2d(subset, overlay).area
+
+    assert area(LazyOr([big, small])) == 5
+    assert area(LazyAnd([big, LazyNot(small)])) == 4
+    assert overlay_bool2d(LazyAnd([big, small]), overlay) is EmptyShape()
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(20)
+@pytest.mark.dependency(depends=["test_begin", "test_expressions"])
+def test_clean():
+    result = LazyOr(three_squares()).clean()
+    assert result.area == 8
+
+    squarea, squareb, squarec = three_squares()
+    result = xor_bool2d([squarea, squareb, squarec]).clean()
+    assert Primitive.square(side=1, center=(0.5, 0.5)) in result
+    assert result.area == 6
+
+    squares = [
+        Primitive.square(side=1, center=(0, 0)),
+        Primitive.square(side=1, center=(1, 1)),
+        Primitive.square(side=1, center=(5, 5)),
+    ]
+    result = LazyOr(squares).clean()
+    assert isinstance(result, DisjointShape)
+    assert result.area == 3
+
+
+@pytest.mark.order(44)
+@pytest.mark.timeout(40)
+@pytest.mark.dependency(depends=["test_begin", "test_expressions"])
+def test_circles():
+    circles = [Primitive.circle(radius=1, center=(x, 0)) for x in (0, 1, 2)]
+    united = overlay_bool2d(LazyOr(circles))
+    assert abs(float(united.area) - 6.968) < 1e-2
+    # The first and the last circles touch at a single point
+    circles = [Primitive.circle(radius=1, center=(x, 0)) for x in (0, 1, 2)]
+    assert overlay_bool2d(LazyAnd(circles)) is EmptyShape()
+
+
+@pytest.mark.order(44)
+@pytest.mark.dependency(
+    depends=[
+        "test_begin",
+        "test_vertex_index",
+        "test_endpoint_graph",
+        "test_expressions",
+        "test_shapes_unchanged",
+        "test_shared_edge",
+        "test_clean",
+        "test_circles",
+    ]
+)
+def test_end():
+    pass
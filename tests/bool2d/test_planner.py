@@ -0,0 +1,117 @@
+"""
+This module tests the planner of the lazy boolean operations,
+which uses the boxes of the shapes to avoid the intersections
+"""
+
+import pytest
+
+from shapepy.bool2d.base import EmptyShape
+from shapepy.bool2d.lazy import LazyAnd, LazyNot, LazyOr
+from shapepy.bool2d.planner import PlanStep, QueryPlan
+from shapepy.bool2d.primitive import Primitive
+from shapepy.bool2d.shape import DisjointShape
+
+
+@pytest.mark.order(45)
+@pytest.mark.dependency(
+    depends=[
+        "tests/bool2d/test_overlay.py::test_end",
+    ],
+    scope="session",
+)
+def test_begin():
+    pass
+
+
+@pytest.mark.order(45)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin"])
+def test_plan_and():
+    squarea = Primitive.square(side=1)
+    squareb = Primitive.square(side=1, center=(5, 0))
+    squarec = Primitive.square(side=4, center=(5, 0))
+    plan = QueryPlan(LazyAnd([squarea, squareb, squarec]))
+    assert [step.action for step in plan.steps] == [PlanStep.EMPTY]
+    assert plan.cost == 0
+    assert LazyAnd([squarea, squareb]).clean() is EmptyShape()
+
+    # The smallest boxes come first
+    plan = QueryPlan(LazyAnd([squarec, squareb, LazyNot(squarea)]))
+    (step,) = plan.steps
+    assert step.action == PlanStep.OVERLAY
+    assert step.operands[:2] == (squareb, squarec)
+
+    plan = QueryPlan(LazyAnd([squareb, squarec]))
+    assert [step.action for step in plan.steps] == [PlanStep.PAIR]
+    assert plan.cost == 16
+    assert LazyAnd([squareb, squarec]).clean() == squareb
+
+
+@pytest.mark.order(45)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin"])
+def test_plan_or():
+    squarea = Primitive.square(side=2)
+    squareb = Primitive.square(side=2, center=(1, 1))
+    squarec = Primitive.square(side=1, center=(5, 0))
+    plan = QueryPlan(LazyOr([squarea, squareb, squarec]))
+    actions = sorted(step.action for step in plan.steps)
+    assert actions == [PlanStep.KEEP, PlanStep.PAIR]
+    result = LazyOr([squarea, squareb, squarec]).clean()
+    assert isinstance(result, DisjointShape)
+    assert result.area == 8
+
+    # The lazy operands are cleaned before the plan
+    result = LazyOr([squarec, LazyAnd([squarea, squareb])]).clean()
+    assert isinstance(result, DisjointShape)
+    assert result.area == 2
+
+    # Not bounded operands are evaluated together
+    plan = QueryPlan(LazyOr([squarec, LazyNot(squarea)]))
+    assert [step.action for step in plan.steps] == [PlanStep.PAIR]
+
+    circles = [
+        Primitive.circle(radius=1, center=(3 * x, 0)) for x in range(10)
+    ]
+    plan = QueryPlan(LazyOr(circles))
+    assert len(plan.steps) == 10
+    assert plan.cost == 0
+    assert len(tuple(LazyOr(circles).clean())) == 10
+
+
+@pytest.mark.order(45)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_plan_and", "test_plan_or"])
+def test_explain():
+    squarea = Primitive.square(side=1)
+    squareb = Primitive.square(side=1, center=(5, 0))
+    squarec = Primitive.square(side=2, center=(0.5, 0.5))
+    plan = QueryPlan(LazyOr([squarea, squareb, squarec]))
+    lines = plan.explain().splitlines()
+    assert lines[0] == "OR of 3 operands, estimated cost 16"
+    assert sorted(lines[1:3]) == [
+        "  keep: 1 operand, cost 0",
+        "  pair: 2 operands, cost 16",
+    ]
+    assert lines[3] == "  join: 2 disjoint results, cost 0"
+
+    plan = QueryPlan(LazyAnd([squarea, squareb]))
+    assert plan.explain() == "\n".join(
+        [
+            "AND of 2 operands, estimated cost 0",
+            "  empty: 2 operands, cost 0",
+        ]
+    )
+
+
+@pytest.mark.order(45)
+@pytest.mark.dependency(
+    depends=[
+        "test_begin",
+        "test_plan_and",
+        "test_plan_or",
+        "test_explain",
+    ]
+)
+def test_end():
+    pass
@@ -0,0 +1,137 @@
+import pytest
+
+from shapepy.boolalg.bdd import BDD
+from shapepy.boolalg.converter import string2tree, tree2string
+from shapepy.boolalg.simplify import (
+    Implicants,
+    find_variables,
+    simplify_tree,
+)
+from shapepy.boolalg.tree import Operators, items2tree
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency()
+def test_unique_nodes():
+    diagram = BDD(3)
+    vara, varb, varc = map(diagram.variable, range(3))
+    assert diagram.variable(0) == vara
+    assert diagram.node(1, varc, varc) == varc
+
+    nodea = diagram.conjunction(vara, diagram.disjunction(varb, varc))
+    nodeb = diagram.disjunction(
+        diagram.conjunction(varc, vara), diagram.conjunction(vara, varb)
+    )
+    assert nodea == nodeb
+    assert diagram.support(nodea) == {0, 1, 2}
+
+    assert diagram.disjunction(vara, diagram.negate(vara)) == BDD.TRUE
+    assert diagram.conjunction(vara, diagram.negate(vara)) == BDD.FALSE
+    assert diagram.exclusive(varb, varb) == BDD.FALSE
+    assert diagram.negate(diagram.negate(varc)) == varc
+    nodec = diagram.disjunction(varb, diagram.conjunction(vara, varb))
+    assert nodec == varb
+    assert diagram.support(nodec) == {1}
+
+    with pytest.raises(ValueError):
+        diagram.variable(3)
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_unique_nodes"])
+def test_from_tree():
+    diagram = BDD(3)
+    tree = string2tree("(a^b)*!c+a*c")
+    variables = tuple(find_variables(tree))
+    indexs = {id(var): i for i, var in enumerate(variables)}
+    node = diagram.from_tree(tree, indexs)
+
+    vara, varb, varc = map(diagram.variable, range(3))
+    good = diagram.ite(varc, vara, diagram.exclusive(vara, varb))
+    assert node == good
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_from_tree"])
+def test_from_table():
+    tree = string2tree("(a^b)*!c+a*c")
+    variables = tuple(find_variables(tree))
+    table = Implicants.evaluate_table(tree, map(id, variables))
+    assert tuple(table) == (0, 0, 1, 0, 1, 1, 0, 1)
+    diagram = BDD(3)
+    indexs = {id(var): i for i, var in enumerate(variables)}
+    assert diagram.from_table(table) == diagram.from_tree(tree, indexs)
+    assert diagram.from_table([False] * 8) == BDD.FALSE
+    assert diagram.from_table([True] * 8) == BDD.TRUE
+    with pytest.raises(ValueError):
+        diagram.from_table([True] * 4)
+
+    # The 16 columns are evaluated at once
+    names = tuple(f"v{i}" for i in range(16))
+    tree = items2tree(
+        [
+            items2tree(names[:8], Operators.AND),
+            items2tree(names[8:], Operators.XOR),
+        ],
+        Operators.OR,
+    )
+    table = Implicants.evaluate_table(tree, map(id, names))
+    assert len(table) == 2**16
+    assert sum(table) == 2**15 + 2**7
+    assert not table[0] and table[2**16 - 2**8] and table[1]
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(
+    depends=["test_unique_nodes", "test_from_tree", "test_from_table"]
+)
+def test_isop():
+    table = {
+        "a*b+!a*c": "a*b+!a*c",
+        "a*b+a*!b": "a",
+        "(a+b)*(a+c)": "a+b*c",
+        "a*b+!a*c+b*c": "a*b+!a*c",
+        "(a^b)*!c+a*c": "a*!b+a*c+!a*b*!c",
+    }
+    for original, good in table.items():
+        tree = simplify_tree(string2tree(original))
+        assert tree2string(tree) == good
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_isop"])
+def test_many_variables():
+    names = tuple(f"v{i}" for i in range(60))
+    tree = items2tree(
+        [
+            items2tree(names[:10], Operators.AND),
+            items2tree(names, Operators.OR),
+        ],
+        Operators.OR,
+    )
+    tree = simplify_tree(tree)
+    assert tree.operator == Operators.OR
+    assert tuple(tree) == names
+
+    negate = items2tree((names[0],), Operators.NOT)
+    tree = items2tree([tree, negate], Operators.OR)
+    assert tree2string(simplify_tree(tree)) == "1"
+
+
+@pytest.mark.order(1)
+@pytest.mark.dependency(
+    depends=[
+        "test_unique_nodes",
+        "test_from_tree",
+        "test_from_table",
+        "test_isop",
+        "test_many_variables",
+    ]
+)
+def test_all():
+    pass
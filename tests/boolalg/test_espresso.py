@@ -0,0 +1,86 @@
+import pytest
+
+from shapepy.boolalg.converter import string2tree, tree2string
+from shapepy.boolalg.espresso import Espresso
+from shapepy.boolalg.simplify import find_variables, simplify_tree
+from shapepy.boolalg.tree import Operators, items2tree
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency()
+def test_cubes():
+    espresso = Espresso(3)
+    assert espresso.universe == (0, 0b111)
+    assert espresso.literal(0, True) == (0b100, 0b011)
+    assert espresso.literal(2, False) == (0b000, 0b110)
+
+    cubea = (0b100, 0b011)  # '1--'
+    cubeb = (0b001, 0b100)  # '-01'
+    cubec = (0b000, 0b011)  # '0--'
+    assert espresso.intersect(cubea, cubeb) == (0b101, 0b000)
+    assert espresso.intersect(cubea, cubec) is None
+    assert espresso.contains(cubea, (0b101, 0b000))
+    assert not espresso.contains(cubeb, cubea)
+
+    assert espresso.tautology([cubea, cubec])
+    assert not espresso.tautology([cubea, cubeb])
+    assert espresso.covers([cubea, cubeb], (0b001, 0b000))
+    assert not espresso.covers([cubea, cubeb], (0b000, 0b000))
+
+    complement = espresso.complement([cubea, cubeb])
+    # The cubes '0-0' and '01-'
+    assert sorted(complement) == [(0b000, 0b010), (0b010, 0b001)]
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_cubes"])
+def test_minimize():
+    table = {  # The cubes as the pairs (value, mask)
+        "a*b+a*!b+a*c": [(0b100, 0b011)],
+        "a*b*c+a*b*!c+!a*b*c+!a*b*!c": [(0b010, 0b101)],
+        "a*!b+!a*b+a*b": [(0b01, 0b10), (0b10, 0b01)],
+        "(a+b)*(a+c)": [(0b011, 0b100), (0b100, 0b011)],
+        "a*!a": [],
+        "a+!a": [(0, 1)],
+    }
+    for original, good in table.items():
+        tree = string2tree(original)
+        variables = tuple(find_variables(tree))
+        indexs = {id(var): i for i, var in enumerate(variables)}
+        espresso = Espresso(len(variables))
+        cover = espresso.minimize(espresso.from_tree(tree, indexs))
+        assert sorted(cover) == good
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_minimize"])
+def test_simplify():
+    tree = string2tree("a*b+!a*c+b*c+a*!a")
+    assert tree2string(simplify_tree(tree, maxnodes=2)) == "a*b+!a*c"
+
+    names = tuple(f"v{i}" for i in range(300))
+    pairs = [
+        items2tree(names[i : i + 2], Operators.AND)
+        for i in range(0, len(names), 2)
+    ]
+    redundant = items2tree(names[:6], Operators.AND)
+    tree = items2tree(pairs + [redundant], Operators.OR)
+    result = simplify_tree(tree, maxnodes=64)
+    assert result.operator == Operators.OR
+    assert len(result) == 150
+    assert set(map(frozenset, result)) == set(map(frozenset, pairs))
+
+
+@pytest.mark.order(1)
+@pytest.mark.dependency(
+    depends=[
+        "test_cubes",
+        "test_minimize",
+        "test_simplify",
+    ]
+)
+def test_all():
+    pass
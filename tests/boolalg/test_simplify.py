@@ -1,8 +1,10 @@
+import random
+
 import pytest
 
 from shapepy.boolalg.converter import find_operator, string2tree, tree2string
-from shapepy.boolalg.simplify import simplify_tree
-from shapepy.boolalg.tree import Operators
+from shapepy.boolalg.simplify import Implicants, cached_simplify, simplify_tree
+from shapepy.boolalg.tree import BoolTree, Operators, TreeKey, items2tree
 
 
 @pytest.mark.order(1)
@@ -225,6 +227,68 @@ def test_simplify_multi_var():
     assert test == "a+b+c+d+e"
 
 
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_find_operator"])
+def test_implicants():
+    assert Implicants.cube2implicant(((0, True), (2, False)), 4) == (8, 5)
+    assert Implicants.cube2implicant((), 3) == (0, 0b111)
+
+    # The primes of a*b+!a*c: '0-1', '-11' and '11-'
+    primes = ((0b001, 0b010), (0b011, 0b100), (0b110, 0b001))
+    primes = Implicants.sort_implicants(primes, 3)
+    assert primes == ((0b110, 0b001), (0b001, 0b010), (0b011, 0b100))
+    variables = ("a", "b", "c")
+    tree = Implicants.implicants2tree(primes, variables)
+    assert tree2string(tree) == "a*b+!a*c+b*c"
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_simplify_multi_var"])
+def test_cache():
+    vara, varb, varc = "va", "vb", "vc"
+    and_bc = BoolTree([varb, varc], Operators.AND)
+    and_cb = BoolTree([varc, varb], Operators.AND)
+    or_bc = BoolTree([varb, varc], Operators.OR)
+    treea = BoolTree([vara, and_bc], Operators.OR)
+    treeb = BoolTree([and_cb, vara], Operators.OR)
+    treec = BoolTree([vara, or_bc], Operators.OR)
+    assert TreeKey(treea) == TreeKey(treeb)
+    assert hash(TreeKey(treea)) == hash(TreeKey(treeb))
+    assert TreeKey(treea) != TreeKey(treec)
+    assert TreeKey(vara) != TreeKey(varb)
+    # Other variables with the same names give different keys
+    other = "".join(["v", "a"])
+    assert other == vara and other is not vara
+    treed = BoolTree([other, and_bc], Operators.OR)
+    assert TreeKey(treea) != TreeKey(treed)
+    # The items are sorted by the fingerprints, not by their hashes
+    names = tuple(f"v{i}" for i in range(50))
+    items = [BoolTree([name, vara], Operators.AND) for name in names]
+    items += [BoolTree([name], Operators.NOT) for name in names] + [vara]
+    keys = set()
+    for _ in range(10):
+        random.shuffle(items)
+        keys.add(TreeKey(BoolTree(items, Operators.XOR)).fingerprint)
+    assert len(keys) == 1
+
+    cached_simplify.cache_clear()
+    result = cached_simplify(TreeKey(treea))
+    assert tree2string(result) == "va+vb*vc"
+    assert cached_simplify(TreeKey(treeb)) is result
+    info = cached_simplify.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+    names = tuple(f"v{i}" for i in range(100))
+    tree = names[0]
+    for name in names[1:]:
+        tree = items2tree([tree, name], Operators.OR)
+        tree = cached_simplify(TreeKey(tree))
+    assert tuple(tree) == names
+
+
 @pytest.mark.order(1)
 @pytest.mark.timeout(1)
 @pytest.mark.dependency(
@@ -233,6 +297,8 @@ def test_simplify_multi_var():
         "test_simplify_no_variable",
         "test_simplify_single_var",
         "test_simplify_multi_var",
+        "test_implicants",
+        "test_cache",
     ]
 )
 def test_all():
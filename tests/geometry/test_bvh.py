@@ -0,0 +1,193 @@
+"""
+This file contains tests functions to test the module bvh.py
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from shapepy.geometry.box import Box
+from shapepy.geometry.bvh import BoundingTree
+from shapepy.geometry.factory import FactoryJordan
+from shapepy.geometry.intersection import (
+    GeometricIntersectionCurves,
+    cached_intersection,
+    intersect_many,
+    param_and_param,
+    process_pool,
+    sweep_and_prune,
+)
+from shapepy.rbool import extract_knots
+
+
+@pytest.mark.order(15)
+@pytest.mark.dependency(
+    depends=[
+        "tests/geometry/test_box.py::test_all",
+        "tests/geometry/test_segment.py::test_all",
+        "tests/geometry/test_piecewise.py::test_all",
+    ],
+    scope="session",
+)
+def test_begin():
+    pass
+
+
+def random_boxes(nboxes: int, seed: int):
+    generator = np.random.default_rng(seed)
+    centers = generator.uniform(-10, 10, (nboxes, 2))
+    sizes = generator.uniform(0, 2, (nboxes, 2))
+    return [
+        Box(tuple(center - size), tuple(center + size))
+        for center, size in zip(centers, sizes)
+    ]
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin"])
+def test_queries():
+    boxesa = random_boxes(100, 0)
+    boxesb = random_boxes(70, 1)
+    treea = BoundingTree(boxesa)
+    treeb = BoundingTree(boxesb)
+    assert len(treea) == 100
+
+    for point in np.random.default_rng(2).uniform(-12, 12, (50, 2)):
+        good = [i for i, box in enumerate(boxesa) if point in box]
+        assert list(treea.query_point(point)) == good
+
+    query = Box((-3, -3), (2, 1))
+    good = [i for i, box in enumerate(boxesa) if box & query is not None]
+    assert list(treea.query_box(query.lowpt, query.toppt)) == good
+
+    good = [
+        (i, j)
+        for i, boxa in enumerate(boxesa)
+        for j, boxb in enumerate(boxesb)
+        if boxa & boxb is not None
+    ]
+    assert list(treea.query_tree(treeb)) == good
+
+    empty = BoundingTree([])
+    assert not tuple(empty.query_point((0, 0)))
+    assert not tuple(empty.query_tree(treea))
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_queries"])
+def test_jordan():
+    angles = np.linspace(0, 2 * np.pi, 65)[:-1]
+    vertices = np.transpose([np.cos(angles), np.sin(angles)])
+    jordana = FactoryJordan.polygon(vertices)
+    jordanb = FactoryJordan.polygon(vertices + (1, 0))
+    assert jordana.bvh() is jordana.bvh()
+    assert tuple(jordana.bvh().query_point((0, 0))) == ()
+    assert tuple(jordana.bvh().query_point((1, 0))) == (0, 63)
+    assert (1, 0) in jordana
+    assert (0, 0) not in jordana
+
+    piecea = jordana.parametrize()
+    pieceb = jordanb.parametrize()
+    subseta, subsetb = param_and_param(piecea, pieceb)
+    pointsa = sorted(tuple(piecea(node.internal)) for node in subseta)
+    pointsb = sorted(tuple(pieceb(node.internal)) for node in subsetb)
+    assert len(pointsa) == len(pointsb) == 2
+    for pointa, pointb in zip(pointsa, pointsb):
+        assert np.linalg.norm(np.subtract(pointa, pointb)) < 1e-6
+        assert abs(pointa[0] - 0.5) < 1e-2
+        assert abs(abs(pointa[1]) - np.sqrt(3) / 2) < 1e-2
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_queries"])
+def test_sweep_and_prune():
+    boxes = random_boxes(150, 3)
+    good = [
+        (i, j)
+        for i, boxa in enumerate(boxes)
+        for j, boxb in enumerate(boxes)
+        if i < j and boxa & boxb is not None
+    ]
+    assert list(sweep_and_prune(boxes)) == good
+    assert not tuple(sweep_and_prune([]))
+
+    squares = [
+        FactoryJordan.polygon([(x, y), (x + 2, y), (x + 2, y + 2), (x, y + 2)])
+        for x, y in [(0, 0), (1.5, 0.5), (3, 0), (4.5, 0.5), (9, 0)]
+    ]
+    curves = [square.parametrize() for square in squares]
+    intersection = GeometricIntersectionCurves(curves)
+    for i, curve in enumerate(curves):
+        good = set(curve.knots)
+        for j, other in enumerate(curves):
+            if i != j:
+                subset, _ = param_and_param(curve, other)
+                good |= set(extract_knots(subset))
+        assert intersection.all_knots[id(curve)] == good
+    assert len(intersection.all_knots[id(curves[0])]) == 7
+    assert len(intersection.all_knots[id(curves[4])]) == 5
+    intersection = GeometricIntersectionCurves(curves, [(0, 2), (0, 1)])
+    assert len(intersection.all_knots[id(curves[2])]) == 5
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(30)
+@pytest.mark.dependency(depends=["test_begin", "test_sweep_and_prune"])
+def test_executor():
+    angles = np.linspace(0, 2 * np.pi, 17)[:-1]
+    vertices = np.transpose([np.cos(angles), np.sin(angles)])
+    curves = [
+        FactoryJordan.polygon(vertices + (0.3 * i, 0.2 * i)).parametrize()
+        for i in range(4)
+    ]
+    serial = GeometricIntersectionCurves(curves)
+    serial.evaluate()
+    with ThreadPoolExecutor(2) as executor:
+        cached_intersection.cache_clear()
+        threads = GeometricIntersectionCurves(curves, executor=executor)
+        assert threads.all_subsets == serial.all_subsets
+        # The results of the workers are stored in the cache
+        info = cached_intersection.cache_info()
+        assert info.hits == 0 and info.currsize == info.misses > 0
+        GeometricIntersectionCurves(curves, executor=executor).evaluate()
+        assert cached_intersection.cache_info().hits == info.misses
+    # The executor is not shared by the other instances
+    assert GeometricIntersectionCurves(curves).executor is None
+    cached_intersection.cache_clear()
+    processes = GeometricIntersectionCurves(curves, executor=2)
+    assert processes.all_knots == serial.all_knots
+    assert process_pool(2) is process_pool(2)
+
+    segments = [segment for curve in curves for segment in curve]
+    pairs = [
+        (segments[i], segments[j])
+        for i, j in sweep_and_prune(segment.box() for segment in segments)
+    ]
+    cached_intersection.cache_clear()
+    goods = intersect_many(pairs)
+    for executor in (2, process_pool(2)):
+        cached_intersection.cache_clear()
+        assert intersect_many(pairs, executor) == goods
+    # Swapped pairs give swapped results
+    swapped = [(segb, sega) for sega, segb in pairs]
+    cached_intersection.cache_clear()
+    results = intersect_many(swapped, 2)
+    assert results == [good[::-1] for good in goods]
+
+
+@pytest.mark.order(15)
+@pytest.mark.dependency(
+    depends=[
+        "test_begin",
+        "test_queries",
+        "test_jordan",
+        "test_sweep_and_prune",
+        "test_executor",
+    ]
+)
+def test_all():
+    pass
@@ -0,0 +1,211 @@
+"""
+This file contains tests functions to test the module clipping.py
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from shapepy.geometry.clipping import (
+    bezier_clipping,
+    control_points,
+    split_points,
+)
+from shapepy.geometry.factory import FactorySegment
+from shapepy.geometry.intersection import (
+    IntersectionSegments,
+    cached_intersection,
+    segment_and_segment,
+)
+from shapepy.tools import Is
+
+
+@pytest.mark.order(15)
+@pytest.mark.dependency(
+    depends=[
+        "tests/geometry/test_segment.py::test_all",
+    ],
+    scope="session",
+)
+def test_begin():
+    pass
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin"])
+def test_control_points():
+    segment = FactorySegment.bezier([(0, 0), (1, 2), (3, 1)])
+    points = control_points(segment)
+    assert points.shape == (3, 2)
+    assert np.all(points == ((0, 0), (1, 2), (3, 1)))
+
+    left, right = split_points(points, 0.25)
+    assert np.all(left[-1] == right[0])
+    assert np.allclose(left[-1], tuple(map(float, segment(0.25))))
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_control_points"])
+def test_clipping():
+    pointsa = np.array([[0, 0], [1, 2], [2, 0]], dtype=float)
+    pointsb = np.array([[0, 0.5], [2, 0.5]], dtype=float)
+    pairs = bezier_clipping(pointsa, pointsb)
+    root = (2 - np.sqrt(2)) / 4
+    assert np.allclose(pairs, [(root, root), (1 - root, 1 - root)])
+
+    # Tangent at the middle, the clipping doesn't converge
+    pointsb = np.array([[0, 1], [2, 1]], dtype=float)
+    assert bezier_clipping(pointsa, pointsb) is None
+
+    # Disjoint curves
+    pointsb = np.array([[0, 3], [2, 3]], dtype=float)
+    assert not bezier_clipping(pointsa, pointsb)
+
+    # Overlapping curves
+    assert bezier_clipping(pointsa, pointsa) is None
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_clipping"])
+def test_segments():
+    generator = np.random.default_rng(0)
+    for _ in range(10):
+        pointsa = generator.integers(-4, 5, (4, 2))
+        pointsb = generator.integers(-4, 5, (4, 2))
+        curvea = FactorySegment.bezier(pointsa)
+        curveb = FactorySegment.bezier(pointsb)
+        pairs = IntersectionSegments.clipping(curvea, curveb)
+        if pairs is None:
+            continue
+        for u, v in pairs:
+            pointa = tuple(map(float, curvea(u)))
+            pointb = tuple(map(float, curveb(v)))
+            assert np.linalg.norm(np.subtract(pointa, pointb)) < 1e-6
+        # All the pairs found by newton are also found by clipping
+        for u, v in IntersectionSegments.newton(curvea, curveb):
+            params = np.array(pairs, dtype=np.float64)
+            distances = np.linalg.norm(
+                np.subtract(params, (float(u), float(v))), axis=1
+            )
+            assert np.min(distances) < 1e-3
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_segments"])
+def test_clipping_snap():
+    # The float parameters over the rational segments are snapped, like
+    # at the end of a float arc that is not exactly over the line
+    arc = FactorySegment.bezier([(0.0, -1.0), (1.0, -1.0), (1 - 7e-15, 0)])
+    line = FactorySegment.bezier([(0, 0), (2, 0)])
+    pairs = IntersectionSegments.clipping(arc, line)
+    assert pairs == ((1, Fraction(1, 2)),)
+    assert Is.instance(pairs[0][1], Fraction)
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_segments"])
+def test_newton():
+    pairs = [(0, 0), (1e-7, 0), (0.5, 0.5), (0.5, 0.5 + 1e-7), (1, 0)]
+    filtered = IntersectionSegments.filter_parameters(pairs, 1e-6)
+    assert filtered == ((0, 0), (0.5, 0.5), (1, 0))
+
+    curvea = FactorySegment.bezier([(0, 0), (1, 2), (2, 0)])
+    curveb = FactorySegment.bezier([(0, 0.5), (2, 0.5)])
+    root = (2 - np.sqrt(2)) / 4
+    pairs = IntersectionSegments.newton(curvea, curveb)
+    assert np.allclose(sorted(pairs), [(root, root), (1 - root, 1 - root)])
+    seeds = [(0.1, 0.1), (0.2, 0.3), (0.9, 0.8)]
+    pairs = IntersectionSegments.bezier_and_bezier(curvea, curveb, seeds)
+    assert len(pairs) == 3
+    assert np.allclose(pairs, [(root, root), (root, root), (1 - root,) * 2])
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_segments"])
+def test_implicit():
+    parabola = FactorySegment.bezier([(0, 0), (1, 2), (2, 0)])
+    line = FactorySegment.bezier([(0, 0.75), (2, 0.75)])
+    pairs = IntersectionSegments.implicit(parabola, line)
+    assert set(pairs) == {(0.25, 0.25), (0.75, 0.75)}
+    pairs = IntersectionSegments.implicit(line, parabola)
+    assert set(pairs) == {(0.25, 0.25), (0.75, 0.75)}
+
+    other = FactorySegment.bezier([(0, 1.5), (1, -0.5), (2, 1.5)])
+    pairs = IntersectionSegments.implicit(parabola, other)
+    assert set(pairs) == {(0.25, 0.25), (0.75, 0.75)}
+
+    far = FactorySegment.bezier([(0, 3), (2, 3)])
+    assert IntersectionSegments.implicit(parabola, far) == ()
+    # Overlapping and degenerated segments
+    assert IntersectionSegments.implicit(parabola, parabola) is None
+    flat = FactorySegment.bezier([(0, 0), (1, 0), (3, 0)])
+    assert IntersectionSegments.implicit(flat, parabola) is None
+
+    # The float parameters near the knots are snapped, not dropped
+    arc = FactorySegment.bezier([(1 + 1e-15, -1), (1 + 1e-15, 1), (1, 0)])
+    line = FactorySegment.bezier([(0, 0), (1, 0)])
+    pairs = IntersectionSegments.implicit(line, arc)
+    assert len(pairs) == 2
+    assert pairs[0][0] == 1 and pairs[1] == (1, 1)
+    arc = FactorySegment.bezier([(0.0, -1.0), (1.0, -1.0), (1 - 7e-15, 0)])
+    line = FactorySegment.bezier([(0, 0), (2, 0)])
+    pairs = IntersectionSegments.implicit(arc, line)
+    assert pairs == ((1, Fraction(1, 2)),)
+
+
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_implicit"])
+def test_cache():
+    cached_intersection.cache_clear()
+    parabola = FactorySegment.bezier([(0, 0), (1, 2), (2, 0)])
+    line = FactorySegment.bezier([(0, 0.75), (2, 0.75)])
+    subseta, subsetb = segment_and_segment(parabola, line)
+    assert cached_intersection.cache_info().misses == 1
+
+    copy = FactorySegment.bezier([(0, 0), (1, 2), (2, 0)])
+    assert segment_and_segment(copy, line) == (subseta, subsetb)
+    assert segment_and_segment(line, copy) == (subsetb, subseta)
+    info = cached_intersection.cache_info()
+    assert info.hits == 2 and info.misses == 1
+
+    # Changing the method doesn't give the results of the other method
+    try:
+        IntersectionSegments.method = "newton"
+        segment_and_segment(parabola, line)
+        info = cached_intersection.cache_info()
+        assert info.misses == 2 and info.currsize == 2
+    finally:
+        IntersectionSegments.method = "clipping"
+    segment_and_segment(parabola, line)
+    assert cached_intersection.cache_info().hits == 3
+
+    # The cached results are not shared with the callers
+    assert segment_and_segment(parabola, line)[0] is not subseta
+
+    cached_intersection.cache_clear()
+    assert cached_intersection.cache_info().currsize == 0
+
+
+@pytest.mark.order(15)
+@pytest.mark.dependency(
+    depends=[
+        "test_begin",
+        "test_control_points",
+        "test_clipping",
+        "test_segments",
+        "test_clipping_snap",
+        "test_newton",
+        "test_implicit",
+        "test_cache",
+    ]
+)
+def test_all():
+    pass
@@ -3,6 +3,7 @@ import math
 import pytest
 
 from shapepy.geometry.factory import FactoryJordan, FactorySegment
+from shapepy.geometry.integral import IntegrateJordan, IntegrateSegment
 
 
 @pytest.mark.order(15)
@@ -63,6 +64,31 @@ def test_area():
     assert jordan.area == -6
 
 
+@pytest.mark.order(15)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(depends=["test_begin", "test_area"])
+def test_winding():
+    segment = FactorySegment.bezier([(1, -1), (1, 1)])
+    assert IntegrateSegment.crossings(segment, (0, 0)) == 1
+    assert IntegrateSegment.crossings(~segment, (0, 0)) == -1
+    assert IntegrateSegment.crossings(segment, (2, 0)) == 0
+    assert IntegrateSegment.crossings(segment, (0, 2)) == 0
+    segment = FactorySegment.bezier([(1, -1), (2, 1), (1, -1)])
+    assert IntegrateSegment.crossings(segment, (0, 0)) == 0
+
+    vertices = [(0, 0), (3, 0), (3, 3), (0, 3)]
+    jordan = FactoryJordan.polygon(vertices)
+    inverse = FactoryJordan.polygon(vertices[::-1])
+    for point in [(1, 1), (1, 0.5), (2, 2)]:
+        assert IntegrateJordan.turns(jordan, point) == 1
+        assert IntegrateJordan.turns(inverse, point) == -1
+    for point in [(4, 0), (-1, 3), (1, 4), (-1, -1)]:
+        assert IntegrateJordan.turns(jordan, point) == 0
+        assert IntegrateJordan.turns(inverse, point) == 0
+    assert IntegrateJordan.turns(jordan, (1, 0)) == 0.5
+    assert IntegrateJordan.turns(inverse, (3, 1)) == -0.5
+
+
 @pytest.mark.order(15)
 @pytest.mark.timeout(10)
 @pytest.mark.dependency(
@@ -71,6 +97,7 @@ def test_area():
         "test_segment_length",
         "test_jordan_length",
         "test_area",
+        "test_winding",
     ]
 )
 def test_all():
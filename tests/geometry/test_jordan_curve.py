@@ -10,6 +10,7 @@ import pynurbs
 import pytest
 
 from shapepy.geometry.factory import FactoryJordan
+from shapepy.geometry.integral import IntegrateJordan
 from shapepy.geometry.jordancurve import JordanCurve
 from shapepy.scalar.reals import To
 
@@ -157,6 +158,49 @@ class TestQuadraticJordan:
             "TestQuadraticJordan::test_intersection_float",
         ]
     )
+    def test_as_arrays(self):
+        knotvector = [0, 0, 0, 1, 1, 2, 2, 2]
+        knotvector = [Fraction(knot) for knot in knotvector]
+        points = [(0, -2), (4, 0), (0, 2), (0, 0), (0, -2)]
+        curve = pynurbs.Curve(knotvector)
+        curve.ctrlpoints = [To.point(point) for point in points]
+        jordan = FactoryJordan.spline_curve(curve)
+        arrays = jordan.as_arrays()
+        assert arrays is jordan.as_arrays()
+        assert arrays.coefs.shape == (2, 3, 2)
+        assert tuple(arrays.knots) == (0, 1, 2)
+        with pytest.raises(ValueError):
+            arrays.coefs[0, 0, 0] = 1
+
+        assert abs(arrays.area() - jordan.area) < 1e-9
+        assert arrays.box() == jordan.box()
+        for expx, expy in [(1, 0), (0, 1), (2, 0), (1, 1), (0, 2)]:
+            good = IntegrateJordan.polynomial(jordan, expx, expy)
+            assert abs(arrays.moment(expx, expy) - good) < 1e-9
+
+        piecewise = jordan.parametrize()
+        nodes = (0, 0.25, 0.5, 1, 1.5, 2)
+        values = arrays.eval(nodes)
+        for node, value in zip(nodes, values):
+            point = piecewise(node)
+            assert abs(value[0] - point[0]) < 1e-9
+            assert abs(value[1] - point[1]) < 1e-9
+        points = arrays.tessellate(4)
+        assert points.shape == (8, 2)
+        np.testing.assert_allclose(points[4], (0, 2))
+
+    @pytest.mark.order(16)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestQuadraticJordan::test_begin",
+            "TestQuadraticJordan::test_creation",
+            "TestQuadraticJordan::test_error_creation",
+            "TestQuadraticJordan::test_intersection_fractions",
+            "TestQuadraticJordan::test_intersection_float",
+            "TestQuadraticJordan::test_as_arrays",
+        ]
+    )
     def test_end(self):
         pass
 
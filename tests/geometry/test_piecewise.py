@@ -96,6 +96,33 @@ def test_print():
     repr(piecewise)
 
 
+@pytest.mark.order(14)
+@pytest.mark.dependency(depends=["test_build", "test_box"])
+def test_cached_properties():
+    points = [
+        ((0, 0), (1, 0)),
+        ((1, 0), (1, 1)),
+        ((1, 1), (0, 1)),
+        ((0, 1), (0, 0)),
+    ]
+    segments = (
+        FactorySegment.bezier(pts, [i, i + 1]) for i, pts in enumerate(points)
+    )
+    piecewise = PiecewiseCurve(segments)
+    segment = piecewise[0]
+    assert segment.box() is segment.box()
+    assert segment.derivate() is segment.derivate()
+    assert piecewise.box() is piecewise.box()
+    assert piecewise.length == 4
+
+    box = piecewise.box()
+    piecewise.split([0.5, 2.5])
+    assert len(piecewise) == 6
+    assert piecewise.box() is not box
+    assert piecewise.box() == box
+    assert piecewise.length == 4
+
+
 @pytest.mark.order(14)
 @pytest.mark.dependency(
     depends=[
@@ -104,6 +131,7 @@ def test_print():
         "test_box",
         "test_evaluate",
         "test_print",
+        "test_cached_properties",
     ]
 )
 def test_all():
@@ -1,8 +1,18 @@
 import math
+from fractions import Fraction
 
 import pytest
 
-from shapepy.scalar.reals import Is, Math, To
+from shapepy.bool2d.primitive import Primitive
+from shapepy.scalar.nodes_sample import NodeSampleFactory
+from shapepy.scalar.reals import (
+    Backend,
+    Is,
+    Math,
+    To,
+    float_backend,
+    set_float_backend,
+)
 
 
 @pytest.mark.order(1)
@@ -70,6 +80,52 @@ def test_math_functions():
     assert Math.hypot(3, 4) == 5
 
 
+@pytest.mark.order(1)
+@pytest.mark.timeout(1)
+@pytest.mark.dependency(depends=["test_conversion"])
+def test_float_backend():
+    assert To.rational(1, 2) == Fraction(1, 2)
+    assert isinstance(NodeSampleFactory.closed_linspace(3)[1], Fraction)
+    with float_backend():
+        assert Backend.floats
+        value = To.rational(1, 2)
+        assert isinstance(value, float) and value == 0.5
+        nodes = NodeSampleFactory.closed_linspace(3)
+        assert all(isinstance(node, float) for node in nodes)
+        with float_backend(False):
+            assert isinstance(To.rational(1, 3), Fraction)
+        assert isinstance(To.rational(1, 3), float)
+    assert not Backend.floats
+    assert isinstance(NodeSampleFactory.closed_linspace(3)[1], Fraction)
+
+    set_float_backend(True)
+    try:
+        assert isinstance(To.rational(1, 3), float)
+    finally:
+        set_float_backend(False)
+    assert isinstance(To.rational(1, 3), Fraction)
+
+
+@pytest.mark.order(1)
+@pytest.mark.timeout(40)
+@pytest.mark.dependency(depends=["test_float_backend"])
+def test_float_pipeline():
+    def union():
+        square = Primitive.square(side=2, center=(1, 1))
+        circle = Primitive.circle(radius=1)
+        return (square | circle).clean()
+
+    exact = union()
+    with float_backend():
+        shape = union()
+    assert abs(shape.area - exact.area) < 1e-9
+    for jordan in shape.jordans:
+        for segment in jordan.parametrize():
+            values = tuple(segment.knots)
+            values += tuple(segment.xfunc) + tuple(segment.yfunc)
+            assert not any(isinstance(value, Fraction) for value in values)
+
+
 @pytest.mark.order(1)
 @pytest.mark.timeout(1)
 @pytest.mark.dependency(
@@ -79,6 +135,8 @@ def test_math_functions():
         "test_verification",
         "test_trigonometric",
         "test_math_functions",
+        "test_float_backend",
+        "test_float_pipeline",
     ]
 )
 def test_all():